@@ -1,17 +1,31 @@
-from PyQt5.QtCore import Qt, QPoint, QRect, QTimer, pyqtSignal
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap, QIcon, QImage, QTransform
+from PyQt5.QtCore import Qt, QEvent, QPoint, QPointF, QRect, QRectF, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QFontDatabase, \
+    QPixmap, QIcon, QImage, QPolygon, QPolygonF, QRegion
 from PyQt5.QtWidgets import QMainWindow, QButtonGroup, QComboBox, \
-    QFontComboBox, QLabel, QApplication, QSlider, QColorDialog, QFileDialog
+    QLabel, QApplication, QSlider, QSpinBox, QColorDialog, QFileDialog
 
+import os
 import sys
 import types
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from mainwindow import Ui_MainWindow
+from resources import load_resources
+from textbox import TextBox
+import macro
+from profiling import PROFILERS
+from strokes import SmoothStroke
+from brushes import STAMPED_TIPS, TIPS, StampStroke
+from sampling import SAMPLE_SIZES, SampleStore
+from batch import flip_image, invert_image
+from vector import Shape, VectorLayer
 
 EASEL_DIMENSIONS = 600, 400
 
 SELECTION_PEN = QPen(QColor(0xff, 0xff, 0xff), 1, Qt.DashLine)
+SELECTION_BASE_PEN = QPen(QColor(0x00, 0x00, 0x00), 1, Qt.SolidLine)
 PREVIEW_PEN = QPen(QColor(0xff, 0xff, 0xff), 1, Qt.SolidLine)
 
 FONT_SIZES = [7, 8, 9, 10, 11, 12, 13, 14, 18, 24, 36, 48, 64, 72, 96, 144, 288]
@@ -19,6 +33,8 @@ FONT_SIZES = [7, 8, 9, 10, 11, 12, 13, 14, 18, 24, 36, 48, 64, 72, 96, 144, 288]
 BRUSH_MULT = 3
 SPRAY_PAINT_MULT = 5
 SPRAY_PAINT_N = 100
+SMOOTHING_EPSILON = 1.5
+CHECKER_SIZE = 8
 
 COLORS = [
     '#000000', '#82817f', '#820300', '#868417', '#007e03', '#037e7b', '#040079',
@@ -29,23 +45,45 @@ COLORS = [
 ]
 
 MODES = [
+    'selectpoly', 'selectrect',
     'eraser', 'fill',
-    'dropper',
+    'dropper', 'wand',
     'pen', 'brush',
     'spray', 'text',
     'line', 'polyline',
     'rect', 'polygon',
-    'ellipse'
+    'ellipse', 'vector'
 ]
 
+HANDLERS = ['mousePressEvent', 'mouseMoveEvent', 'mouseReleaseEvent', 'mouseDoubleClickEvent', 'keyPressEvent']
 
-def build_font(config):
-    font = config['font']
-    font.setPointSize(config['fontsize'])
-    font.setBold(config['bold'])
-    font.setItalic(config['italic'])
-    font.setUnderline(config['underline'])
-    return font
+SELECTION_MODES = ['selectpoly', 'selectrect', 'wand']
+
+
+def font_key(config):
+    return config['font'].family(), config['fontsize'], config['bold'], config['italic'], config['underline']
+
+
+@lru_cache(maxsize=1)
+def transparency_brush():
+    """
+    The checkerboard shown through transparent parts of the image.
+    """
+    tile = QPixmap(CHECKER_SIZE * 2, CHECKER_SIZE * 2)
+    tile.fill(QColor(0xff, 0xff, 0xff))
+    p = QPainter(tile)
+    p.fillRect(0, 0, CHECKER_SIZE, CHECKER_SIZE, QColor(0xcc, 0xcc, 0xcc))
+    p.fillRect(CHECKER_SIZE, CHECKER_SIZE, CHECKER_SIZE, CHECKER_SIZE, QColor(0xcc, 0xcc, 0xcc))
+    p.end()
+    return QBrush(tile)
+
+
+def points_rect(points, margin=0):
+    """
+    Bounding rect of the points (None entries are skipped), grown by margin plus a pixel for antialiasing.
+    """
+    margin += 1
+    return QPolygon([p for p in points if p is not None]).boundingRect().adjusted(-margin, -margin, margin, margin)
 
 
 class Easel(QLabel):
@@ -56,6 +94,8 @@ class Easel(QLabel):
 
     primary_color_updated = pyqtSignal(str)
     secondary_color_updated = pyqtSignal(str)
+    color_sampled = pyqtSignal(str)
+    indexed_changed = pyqtSignal(bool)
 
     config = {
         'size': 1,
@@ -65,6 +105,14 @@ class Easel(QLabel):
         'bold': False,
         'italic': False,
         'underline': False,
+        'tolerance': 0,
+        'smoothing': False,
+        'brush_tip': 'round',
+        'hardness': 50,
+        'spacing': 15,
+        'sample_size': 1,
+        'eraser_size': 30,
+        'vector': False,
     }
 
     active_color = None
@@ -72,28 +120,519 @@ class Easel(QLabel):
 
     timer_event = None
 
+    selection = None
+    active_selection_op = 'replace'
+
+    floating = None
+    floating_pos = None
+    floating_origin = None
+    drag_pos = None
+    dash_offset = 0
+
+    text_box = None
+
+    recorder = None
+    timelapse = None
+    diagnostics = None
+
+    handlers = {}
+    profilers = {}
+
+    stroke_points = []
+    stroke_pen = None
+    stroke_composition = QPainter.CompositionMode_SourceOver
+    smooth_stroke = None
+    stamp_stroke = None
+
+    samples = None
+
+    shapes = None
+    selected_shapes = []
+
+    palette_colors = None
+
     def initialize(self):
         self.background_color = QColor(self.secondary_color) if self.secondary_color else QColor(Qt.white)
-        self.eraser_color = QColor(self.secondary_color) if self.secondary_color else QColor(Qt.white)
-        self.eraser_color.setAlpha(100)
         self.reset()
 
     def reset(self):
-        self.setPixmap(QPixmap(*EASEL_DIMENSIONS))
+        # An opaque format for an opaque background, so set_image need not scan it.
+        opaque = self.background_color.alpha() == 255
+        image = QImage(*EASEL_DIMENSIONS, QImage.Format_RGB32 if opaque else QImage.Format_ARGB32_Premultiplied)
+        image.fill(self.background_color)
+        self.set_image(image)
+        self.clear_selection()
+
+    def set_image(self, image, palette=None):
+        """
+        Replace the document. The image is the source of truth for every tool; the
+        label's pixmap is only a display cache, synced for dirty areas in paintEvent.
+        With a palette, the document is indexed and image is a Grayscale8 image of
+        indices into it (see indexed.py).
+        """
+        # A floating selection or an open text box belongs to the old document, so
+        # both are dropped rather than committed onto the new one.
+        self.floating = None
+        if self.text_box is not None:
+            self.timer_cleanup()
 
-        self.pixmap().fill(self.background_color)
+        was_indexed = self.palette_colors is not None
+        if palette is None:
+            self.image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+            self.palette_colors = None
+            self.transparent = False
+            if image.hasAlphaChannel():
+                from imagearray import image_array
+                self.transparent = image_array(self.image)[..., 3].min() < 255
+        else:
+            self.image = image
+            self.palette_colors = tuple(palette)
+            self.transparent = any(c >> 24 < 255 for c in self.palette_colors)
+        if was_indexed != (palette is not None):
+            self.indexed_changed.emit(palette is not None)
+
+        self.dirty = QRegion(self.image.rect())
+        self.setPixmap(QPixmap(self.image.size()))
+        if self.timelapse:
+            self.timelapse.touch(self.image.rect())
+
+        if self.samples is None:
+            self.samples = SampleStore(lambda: self.image)
+        self.samples.invalidate()
+
+        if self.shapes is None:
+            self.shapes = VectorLayer()
+        self.shapes.clear()
+        self.selected_shapes = []
+
+    def update(self, *args):
+        """
+        Schedule a repaint, marking the area as changed for the display pixmap and the sample store.
+        """
+        if len(args) == 4:
+            rect = QRect(*args)
+        elif args:
+            rect = args[0] if isinstance(args[0], QRect) else args[0].boundingRect()
+        else:
+            rect = self.image.rect()
+
+        self.dirty += rect
+        self.samples.invalidate(rect)
+        if self.timelapse:
+            self.timelapse.touch(rect)
+        super(Easel, self).update(*args)
+
+    def update_overlay(self, *args):
+        """
+        Repaint something drawn over the canvas in paintEvent, without touching the image.
+        """
+        super(Easel, self).update(*args)
+
+    def sync_display(self):
+        if self.dirty.isEmpty():
+            return
+
+        # Only the eraser and opened files make pixels transparent; until then the
+        # image is copied straight over rather than blended onto a checkerboard.
+        image = self.colored()
+        p = QPainter(self.pixmap())
+        if not self.transparent:
+            p.setCompositionMode(QPainter.CompositionMode_Source)
+        for rect in self.dirty.rects():
+            if self.transparent:
+                p.fillRect(rect, transparency_brush())
+            p.drawImage(rect, image, rect)
+        p.end()
+        self.dirty = QRegion()
+
+    def colored(self):
+        """
+        The image in color: the document itself, or a view of an indexed document's
+        indices in the palette colors.
+        """
+        if self.palette_colors is None:
+            return self.image
+
+        from indexed import color_view
+        return color_view(self.image, self.palette_colors)
+
+    def flattened(self):
+        """
+        The image with the vector layer drawn over it, for saving and copying.
+        """
+        if self.palette_colors is not None:
+            return self.colored().copy()
+
+        if not len(self.shapes):
+            return self.image
+
+        image = self.image.copy()
+        p = QPainter(image)
+        for shape in self.shapes:
+            shape.paint(p)
+        p.end()
+        return image
+
+    def render_rect(self, rect):
+        """
+        A copy of part of the image with the vector layer drawn over it.
+        """
+        image = self.colored().copy(rect)
+        if len(self.shapes):
+            p = QPainter(image)
+            p.translate(-rect.topLeft())
+            self.shapes.paint(p, rect)
+            p.end()
+        return image
+
+    def load_svg(self, path):
+        """
+        Replace the document with an SVG file: embedded raster images are drawn into
+        the image and the shapes go on the vector layer.
+        """
+        import svgio
+
+        self.reset()
+        p = QPainter(self.image)
+        for kind, item in svgio.read_svg(path):
+            if kind == 'image':
+                p.drawImage(item[1], item[0])
+            else:
+                self.shapes.add(item)
+        p.end()
+        self.update()
+
+    def set_indexed(self, enabled):
+        """
+        Switch the document between full color and palette indices. An image with
+        at most 256 colors keeps them as its palette, and anything else is mapped to
+        the nearest of the swatches.
+        """
+        if enabled == (self.palette_colors is not None):
+            return
+
+        import indexed
+
+        self.commit_floating()
+        image = self.flattened()
+        if enabled:
+            palette = indexed.image_palette(image, [QColor(c).rgba() for c in COLORS])
+            self.set_image(indexed.to_indices(image, palette), palette)
+        else:
+            self.set_image(image)
+
+    def ink(self, color):
+        """
+        The color to paint color with. In an indexed document that is the ink of its
+        palette index: the color is added to the palette if it is not there and
+        there is room, and otherwise the nearest palette color is used.
+        """
+        if self.palette_colors is None or color is None:
+            return color
+
+        import indexed
+        rgba = color.rgba()
+        if rgba not in self.palette_colors:
+            if len(self.palette_colors) < indexed.MAX_COLORS:
+                self.palette_colors += (rgba,)
+            else:
+                return indexed.ink(int(indexed.nearest_indices([rgba], self.palette_colors)[0]))
+        return indexed.ink(self.palette_colors.index(rgba))
+
+    def inked(self, image):
+        """
+        An image to draw onto the document: in an indexed document, the inks of the
+        image's nearest palette colors.
+        """
+        if self.palette_colors is None:
+            return image
+
+        from indexed import ink_image
+        return ink_image(image, self.palette_colors)
+
+    def recolor(self, fn):
+        """
+        Map every color of an indexed document through fn, a QRgb -> QRgb function,
+        by swapping the palette; the indices are untouched.
+        """
+        self.palette_colors = tuple(fn(c) for c in self.palette_colors)
+        self.transparent = any(c >> 24 < 255 for c in self.palette_colors)
+        self.update()
+
+    def reduce_colors(self, n, method='median-cut', dither='none'):
+        """
+        Quantize the document to n colors with quantize.py. An indexed document takes
+        the result as its indices and palette. Returns the palette.
+        """
+        from indexed import color_view
+        from quantize import quantize
+
+        self.commit_floating()
+        indices, palette = quantize(self.flattened(), n, method, dither)
+        if self.palette_colors is not None:
+            self.set_image(indices, palette)
+        else:
+            self.set_image(color_view(indices, palette))
+        return palette
+
+    def painter(self):
+        """
+        Open a painter on the canvas, clipped to the active selection.
+        """
+        p = QPainter(self.image)
+        if self.selection is not None:
+            p.setClipRegion(self.selection.region())
+        return p
+
+    def set_selection(self, mask):
+        if mask is not None and mask.is_empty():
+            mask = None
+
+        self.selection = mask
+        self.locked = mask is not None
+        self.update_overlay()
+
+    def combine_selection(self, mask, op):
+        if self.selection is None or op == 'replace':
+            self.set_selection(mask if op in ('replace', 'add') else None)
+        else:
+            self.set_selection(self.selection.combine(mask, op))
+
+    def clear_selection(self):
+        self.set_selection(None)
+
+    def select_all(self):
+        from selection import SelectionMask
+        self.set_selection(SelectionMask.full(self.image.width(), self.image.height()))
+
+    def invert_selection(self):
+        if self.selection is None:
+            self.select_all()
+        else:
+            self.set_selection(self.selection.inverted())
+
+    def selection_rect(self):
+        if self.floating is not None:
+            return QRect(self.floating_pos, self.floating.size())
+        return self.selection.bounding_rect()
+
+    def selection_pixmap(self):
+        """
+        Return the selected pixels, cropped to the selection bounds and transparent outside the mask.
+        """
+        if self.floating is not None:
+            return self.floating
+
+        rect = self.selection.bounding_rect()
+        pixmap = QPixmap(rect.size())
+        pixmap.fill(Qt.transparent)
+
+        p = QPainter(pixmap)
+        p.setClipRegion(self.selection.region().translated(-rect.topLeft()))
+        p.drawImage(QPoint(0, 0), self.colored(), rect)
+        p.end()
+        return pixmap
+
+    def erase_selection(self):
+        p = self.painter()
+        p.fillRect(self.selection.bounding_rect(), self.ink(self.background_color))
+        p.end()
+        self.update(self.selection.bounding_rect())
+
+    def lift_selection(self):
+        """
+        Move the selected pixels off the canvas into a floating buffer, which is
+        composited in paintEvent until commit_floating writes it back.
+        """
+        self.floating = self.selection_pixmap()
+        self.floating_origin = self.selection.bounding_rect().topLeft()
+        self.floating_pos = QPoint(self.floating_origin)
+        self.erase_selection()
+
+    def paste_floating(self, pixmap, pos):
+        self.commit_floating()
+        self.floating = pixmap
+        self.floating_origin = QPoint(pos)
+        self.floating_pos = QPoint(pos)
+
+        from selection import SelectionMask
+        self.set_selection(SelectionMask.from_alpha(self.image.width(), self.image.height(), pixmap.toImage(), pos))
+
+    def move_floating(self, pos):
+        old = self.selection_rect()
+        self.floating_pos = pos
+        self.update_overlay(old.united(self.selection_rect()).adjusted(-1, -1, 1, 1))
+
+    def commit_floating(self):
+        if self.floating is None:
+            return
+
+        floating, pos = self.floating, self.floating_pos
+        self.floating = None
+
+        p = QPainter(self.image)
+        if self.palette_colors is None:
+            p.drawPixmap(pos, floating)
+        else:
+            p.drawImage(pos, self.inked(floating.toImage()))
+        p.end()
+        self.update(QRect(pos, floating.size()))
+
+        from selection import SelectionMask
+        self.set_selection(SelectionMask.from_alpha(self.image.width(), self.image.height(), floating.toImage(), pos))
+
+    def selection_drag_mousePressEvent(self, event):
+        """
+        Start dragging if the press lands on the selection, lifting it first if needed.
+        Returns True if the event was consumed.
+        """
+        from selection import selection_op
+
+        if event.button() != Qt.LeftButton or selection_op(event.modifiers()) != 'replace':
+            return False
+
+        if self.floating is not None:
+            if not self.selection_rect().contains(event.pos()):
+                self.commit_floating()
+                return False
+
+        elif self.selection is None or not self.selection.contains(event.x(), event.y()):
+            return False
+
+        else:
+            self.lift_selection()
+
+        self.drag_pos = event.pos() - self.floating_pos
+        return True
+
+    def selection_drag_mouseMoveEvent(self, event):
+        if self.drag_pos is None:
+            return False
+
+        self.move_floating(event.pos() - self.drag_pos)
+        return True
+
+    def selection_drag_mouseReleaseEvent(self, event):
+        if self.drag_pos is None:
+            return False
+
+        self.drag_pos = None
+        self.commit_floating()
+        self.reset_mode()
+        return True
+
+    def apply_filter(self, fn):
+        """
+        Apply an image -> image filter to the canvas, or to the selection bounds if there is one.
+        """
+        rect = self.image.rect() if self.selection is None else self.selection.bounding_rect()
+        result = fn(self.colored().copy(rect).convertToFormat(QImage.Format_ARGB32_Premultiplied))
+        p = self.painter()
+        p.setCompositionMode(QPainter.CompositionMode_Source)
+        p.drawImage(rect.topLeft(), self.inked(result))
+        p.end()
+        self.update(rect)
 
     def set_primary_color(self, hex):
+        self.record('primary', hex)
         self.primary_color = QColor(hex)
+        self.restyle_shapes(color=self.primary_color)
 
     def set_secondary_color(self, hex):
+        self.record('secondary', hex)
         self.secondary_color = QColor(hex)
+        self.restyle_shapes(fill_color=self.secondary_color)
 
     def set_config(self, key, value):
+        self.record('config', key, macro.encode_value(value))
         self.config[key] = value
 
+        if key == 'size':
+            self.restyle_shapes(width=value)
+        elif key == 'fill':
+            self.restyle_shapes(fill=self.secondary_color if value else None)
+
+    def record(self, *event):
+        if self.recorder:
+            self.recorder.write(*event)
+
+    def start_recording(self, path):
+        self.stop_recording()
+        self.recorder = macro.Recorder(path, self)
+
+    def stop_recording(self):
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+
+    def start_timelapse(self, path):
+        from timelapse import Timelapse
+
+        self.stop_timelapse()
+        self.timelapse = Timelapse(path, self.render_rect(self.image.rect()))
+
+    def stop_timelapse(self):
+        """
+        Finish the timelapse, if one is recording. Returns the number of frames.
+        """
+        timelapse, self.timelapse = self.timelapse, None
+        return timelapse.close(self.render_rect) if timelapse else 0
+
+    def show_diagnostics(self, enabled, log=None):
+        from diagnostics import Diagnostics
+
+        if self.diagnostics:
+            self.diagnostics.close()
+        self.diagnostics = Diagnostics(log) if enabled else None
+        self.update_overlay()
+
     def set_mode(self, mode):
+        self.record('mode', mode)
+        self.enter_mode(mode)
+
+    def build_handlers(self, mode):
+        """
+        Look up the mode's event handlers once, so dispatch is a dict lookup per event.
+        """
+        profiler = self.profilers.get(mode)
+        handlers = {}
+        for name in HANDLERS:
+            fn = getattr(self, "%s_%s" % (mode, name), None)
+            if fn and profiler:
+                fn = profiler.wrap(fn)
+            handlers[name] = fn
+        return handlers
+
+    def start_profiling(self, mode, kind='cprofile'):
+        self.stop_profiling(mode)
+        self.profilers = dict(self.profilers, **{mode: PROFILERS[kind]()})
+        self.handlers = self.build_handlers(self.mode)
+
+    def stop_profiling(self, mode, path=None):
+        """
+        Remove the mode's profiler, dumping its statistics to path if given. Returns the profiler.
+        """
+        profilers = dict(self.profilers)
+        profiler = profilers.pop(mode, None)
+        if profiler is None:
+            return None
+
+        self.profilers = profilers
+        self.handlers = self.build_handlers(self.mode)
+        profiler.close()
+        if path:
+            profiler.dump(path)
+        return profiler
+
+    def enter_mode(self, mode):
+        self.flush_stroke(final=True)
+        self.stroke_points = []
+        self.smooth_stroke = None
+        self.stamp_stroke = None
         self.timer_cleanup()
+        self.commit_floating()
+        self.drag_pos = None
+        self.select_shapes([])
         self.active_shape_fn = None
         self.active_shape_args = ()
 
@@ -105,100 +644,284 @@ class Easel(QLabel):
         self.history_pos = None
         self.last_history = []
 
-        self.current_text = ""
-        self.last_text = ""
-
-        self.last_config = {}
+        self.text_box = None
+        self.text_sizing = False
+        self.cursor_ticks = 0
 
         self.dash_offset = 0
-        self.locked = False
-        self.mode = mode
+        self.locked = self.selection is not None
+        if mode != self.mode or not self.handlers:
+            self.mode = mode
+            self.handlers = self.build_handlers(mode)
 
     def reset_mode(self):
-        self.set_mode(self.mode)
+        self.enter_mode(self.mode)
 
     def on_timer(self):
+        if self.diagnostics and self.diagnostics.refresh_due():
+            self.update_overlay(self.diagnostics.rect)
+
+        if self.timelapse and self.timelapse.capture_due():
+            # Buffered stroke points are only drawn at paint time; draw them now, or
+            # the frame misses them and their area is no longer dirty afterwards.
+            self.flush_stroke()
+            self.timelapse.capture(self.render_rect)
+
         if self.timer_event:
+            self.record('t')
             self.timer_event()
 
+        elif self.selection is not None:
+            self.dash_offset -= 1
+            self.update_overlay(self.selection_rect().adjusted(-1, -1, 1, 1))
+
     def timer_cleanup(self):
         if self.timer_event:
             timer_event = self.timer_event
             self.timer_event = None
             timer_event(final=True)
 
+    def paintEvent(self, event):
+        if self.diagnostics:
+            start = self.diagnostics.paint_started()
+
+        self.flush_stroke()
+        self.sync_display()
+
+        super(Easel, self).paintEvent(event)
+        p = QPainter(self)
+
+        if len(self.shapes):
+            p.save()
+            self.shapes.paint(p, event.rect())
+            p.restore()
+
+        if self.floating is not None:
+            p.drawPixmap(self.floating_pos, self.floating)
+
+        path = self.selection_preview_path()
+        if path is None and self.selection is not None:
+            path = self.selection.outline()
+            if self.floating is not None:
+                path = path.translated(QPointF(self.floating_pos - self.floating_origin))
+
+        if self.text_box is not None:
+            p.setPen(QPen(self.primary_color))
+            self.text_box.paint(p, event.rect(), cursor=(self.cursor_ticks // 5) % 2 == 0, frame=True,
+                                selection=True)
+
+        for id in self.selected_shapes:
+            rect = self.shapes.rect(id)
+            p.setPen(SELECTION_BASE_PEN)
+            p.drawRect(rect)
+            p.setPen(SELECTION_PEN)
+            p.drawRect(rect)
+
+        if path is not None:
+            p.setPen(SELECTION_BASE_PEN)
+            p.drawPath(path)
+            pen = QPen(SELECTION_PEN)
+            pen.setDashOffset(self.dash_offset)
+            p.setPen(pen)
+            p.drawPath(path)
+
+        if self.diagnostics:
+            self.diagnostics.paint_finished(start, event)
+            self.diagnostics.draw(p, event.rect())
+
+    def selection_preview_path(self):
+        path = None
+        if self.mode == 'selectrect' and self.origin_pos and self.current_pos:
+            path = QPainterPath()
+            path.addRect(QRectF(QRect(self.origin_pos, self.current_pos).normalized()))
+
+        elif self.mode == 'selectpoly' and self.history_pos:
+            path = QPainterPath()
+            path.addPolygon(QPolygonF(QPolygon(self.history_pos + [self.current_pos])))
+
+        return path
+
     def mousePressEvent(self, event):
-        fn = getattr(self, "%s_mousePressEvent" % self.mode, None)
-        if fn:
-            return fn(event)
+        if self.recorder:
+            self.recorder.mouse(event)
+
+        self.dispatch('mousePressEvent', event)
 
     def mouseMoveEvent(self, event):
-        fn = getattr(self, "%s_mouseMoveEvent" % self.mode, None)
-        if fn:
-            return fn(event)
+        if self.recorder:
+            self.recorder.mouse(event)
+
+        self.dispatch('mouseMoveEvent', event)
 
     def mouseReleaseEvent(self, event):
-        fn = getattr(self, "%s_mouseReleaseEvent" % self.mode, None)
-        if fn:
-            return fn(event)
+        if self.recorder:
+            self.recorder.mouse(event)
+
+        self.dispatch('mouseReleaseEvent', event)
 
     def mouseDoubleClickEvent(self, event):
-        fn = getattr(self, "%s_mouseDoubleClickEvent" % self.mode, None)
-        if fn:
-            return fn(event)
+        if self.recorder:
+            self.recorder.mouse(event)
+
+        self.dispatch('mouseDoubleClickEvent', event)
+
+    def dispatch(self, name, event):
+        fn = self.handlers.get(name)
+        if not fn:
+            return
+
+        if self.diagnostics:
+            self.diagnostics.handle(fn, event)
+        else:
+            fn(event)
 
     def generic_mousePressEvent(self, event):
         self.last_pos = event.pos()
+        self.stroke_points = [event.pos()]
+        self.smooth_stroke = None
+        self.stamp_stroke = None
+        self.stroke_composition = QPainter.CompositionMode_SourceOver
 
         if event.button() == Qt.LeftButton:
-            self.active_color = self.primary_color
+            self.active_color = self.ink(self.primary_color)
         else:
-            self.active_color = self.secondary_color
+            self.active_color = self.ink(self.secondary_color)
 
     def generic_mouseReleaseEvent(self, event):
+        self.flush_stroke(final=True)
+        self.stroke_points = []
+        self.smooth_stroke = None
+        self.stamp_stroke = None
         self.last_pos = None
 
+    def start_smoothing(self, pos):
+        if self.config['smoothing']:
+            self.smooth_stroke = SmoothStroke(pos, SMOOTHING_EPSILON)
+
+    def generic_stroke_mouseMoveEvent(self, event):
+        """
+        Buffer a freehand stroke point; the buffer is drawn once per frame by flush_stroke().
+        """
+        if self.last_pos:
+            pos = event.pos()
+            self.stroke_points.append(pos)
+
+            w = int(self.stroke_pen.widthF()) + 2
+            self.update(QRect(self.last_pos, pos).normalized().adjusted(-w, -w, w, w))
+            self.last_pos = pos
+
+    def stroke_painter(self):
+        p = self.painter()
+        p.setCompositionMode(self.stroke_composition)
+        return p
+
+    def flush_stroke(self, final=False):
+        """
+        Draw the buffered stroke points as one polyline, so a frame costs a single
+        painter session however many mouse events arrived, and segment joins are
+        drawn properly. The last point is kept to continue the stroke from.
+        """
+        if self.smooth_stroke is not None:
+            self.flush_smooth_stroke(final)
+            return
+
+        started = self.stamp_stroke is not None and self.stamp_stroke.last is None
+        if len(self.stroke_points) < 2 and not (started and self.stroke_points):
+            return
+
+        p = self.stroke_painter()
+        if self.stamp_stroke is not None:
+            self.stamp_stroke.draw(p, self.stroke_points)
+        else:
+            p.setPen(self.stroke_pen)
+            p.drawPolyline(QPolygon(self.stroke_points))
+        p.end()
+        self.stroke_points = self.stroke_points[-1:]
+
+    def flush_smooth_stroke(self, final):
+        if len(self.stroke_points) < 2 and not final:
+            return
+
+        path = self.smooth_stroke.extend(self.stroke_points, final)
+        self.stroke_points = self.stroke_points[-1:]
+        if path is None:
+            return
+
+        # Round caps so the pieces drawn in successive frames join without notches.
+        pen = QPen(self.stroke_pen)
+        pen.setCapStyle(Qt.RoundCap)
+
+        p = self.stroke_painter()
+        if self.stamp_stroke is not None:
+            self.stamp_stroke.draw(p, [point for polygon in path.toSubpathPolygons() for point in polygon])
+        else:
+            # Antialiased edges would blend the indices of an indexed document.
+            p.setRenderHint(QPainter.Antialiasing, self.palette_colors is None)
+            p.setPen(pen)
+            p.drawPath(path)
+        p.end()
+
+        # The spline lags a point behind the input, so what was drawn may lie outside
+        # the area being repainted now.
+        w = int(self.stroke_pen.widthF()) + 2
+        self.update(path.boundingRect().toAlignedRect().adjusted(-w, -w, w, w))
+
     def eraser_mousePressEvent(self, event):
+        """
+        Erase to transparency: the stroke is drawn in opaque black with DestinationOut,
+        which removes as much of the image's alpha as the stroke covers. Below full
+        hardness the stroke is stamped with a soft tip, so its edges fade out. An
+        indexed document is painted with the ink of a transparent palette color.
+        """
         self.generic_mousePressEvent(event)
+        size = self.config['eraser_size']
+        self.transparent = True
+        self.start_smoothing(event.pos())
+        if self.palette_colors is not None:
+            self.stroke_pen = QPen(self.ink(QColor(Qt.transparent)), size, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+            return
 
-    def eraser_mouseMoveEvent(self, event):
-        if self.last_pos:
-            p = QPainter(self.pixmap())
-            p.setPen(QPen(self.eraser_color, 30, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-            p.drawLine(self.last_pos, event.pos())
+        self.stroke_pen = QPen(QColor(Qt.black), size, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self.stroke_composition = QPainter.CompositionMode_DestinationOut
+
+        if self.config['hardness'] < 100:
+            self.stamp_stroke = StampStroke(size, self.config['hardness'] / 100, 'soft', QColor(Qt.black),
+                                            self.config['spacing'] / 100)
+            self.update(QRect(event.pos(), event.pos()).adjusted(-size, -size, size, size))
 
-            self.last_pos = event.pos()
-            self.update()
+    def eraser_mouseMoveEvent(self, event):
+        self.generic_stroke_mouseMoveEvent(event)
 
     def eraser_mouseReleaseEvent(self, event):
         self.generic_mouseReleaseEvent(event)
 
     def pen_mousePressEvent(self, event):
         self.generic_mousePressEvent(event)
+        self.stroke_pen = QPen(self.active_color, self.config['size'], Qt.SolidLine, Qt.SquareCap, Qt.RoundJoin)
+        self.start_smoothing(event.pos())
 
     def pen_mouseMoveEvent(self, event):
-        if self.last_pos:
-            p = QPainter(self.pixmap())
-            p.setPen(QPen(self.active_color, self.config['size'], Qt.SolidLine, Qt.SquareCap, Qt.RoundJoin))
-            p.drawLine(self.last_pos, event.pos())
-
-            self.last_pos = event.pos()
-            self.update()
+        self.generic_stroke_mouseMoveEvent(event)
 
     def pen_mouseReleaseEvent(self, event):
         self.generic_mouseReleaseEvent(event)
 
     def brush_mousePressEvent(self, event):
         self.generic_mousePressEvent(event)
+        size = self.config['size'] * BRUSH_MULT
+        self.stroke_pen = QPen(self.active_color, size, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        self.start_smoothing(event.pos())
+
+        tip = self.config['brush_tip']
+        # Stamps blend, which an indexed document cannot; it gets the plain stroke.
+        if tip in STAMPED_TIPS and self.palette_colors is None:
+            self.stamp_stroke = StampStroke(size, self.config['hardness'] / 100, tip, self.active_color,
+                                            self.config['spacing'] / 100)
+            # The stroke starts with a stamp under the cursor.
+            self.update(QRect(event.pos(), event.pos()).adjusted(-size, -size, size, size))
 
     def brush_mouseMoveEvent(self, event):
-        if self.last_pos:
-            p = QPainter(self.pixmap())
-            p.setPen(QPen(self.active_color, self.config['size'] * BRUSH_MULT, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-            p.drawLine(self.last_pos, event.pos())
-
-            self.last_pos = event.pos()
-            self.update()
+        self.generic_stroke_mouseMoveEvent(event)
 
     def brush_mouseReleaseEvent(self, event):
         self.generic_mouseReleaseEvent(event)
@@ -208,109 +931,160 @@ class Easel(QLabel):
 
     def spray_mouseMoveEvent(self, event):
         if self.last_pos:
-            p = QPainter(self.pixmap())
+            p = self.painter()
             p.setPen(QPen(self.active_color, 1))
 
+            reach = 0
             for n in range(self.config['size'] * SPRAY_PAINT_N):
                 xo = random.gauss(0, self.config['size'] * SPRAY_PAINT_MULT)
                 yo = random.gauss(0, self.config['size'] * SPRAY_PAINT_MULT)
-                p.drawPoint(event.x() + xo, event.y() + yo)
+                p.drawPoint(QPointF(event.x() + xo, event.y() + yo))
+                reach = max(reach, abs(xo), abs(yo))
+            p.end()
 
-        self.update()
+            reach = int(reach) + 2
+            self.update(QRect(event.pos(), event.pos()).adjusted(-reach, -reach, reach, reach))
 
     def spray_mouseReleaseEvent(self, event):
         self.generic_mouseReleaseEvent(event)
 
+    def event(self, event):
+        # Keep Select All, Cut, Copy and Paste from the window's actions while a
+        # text box is open, so they arrive here as key presses for the box.
+        if event.type() == QEvent.ShortcutOverride and self.text_box and self.text_box.takes_key(event):
+            event.accept()
+            return True
+        return super(Easel, self).event(event)
+
     def keyPressEvent(self, event):
-        if self.mode == 'text':
-            if event.key() == Qt.Key_Backspace:
-                self.current_text = self.current_text[:-1]
-            else:
-                self.current_text = self.current_text + event.text()
+        self.record('k', event.key(), int(event.modifiers()), event.text())
+        self.dispatch('keyPressEvent', event)
+
+    def text_keyPressEvent(self, event):
+        if self.text_box:
+            if event.key() == Qt.Key_Escape:
+                self.reset_mode()
+                return
+
+            rect = self.text_box.key_press(event)
+            if rect is not None:
+                self.cursor_ticks = 0
+                self.update_overlay(rect)
 
     def text_mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton and self.current_pos is None:
-            self.current_pos = event.pos()
-            self.current_text = ""
+        if event.button() == Qt.LeftButton and self.text_box is None:
+            self.origin_pos = event.pos()
+            self.text_box = TextBox(event.pos(), self.image.width() - event.x(), font_key(self.config))
+            self.text_sizing = True
             self.timer_event = self.text_timerEvent
+            self.update_overlay(self.text_rect())
 
-        elif event.button() == Qt.LeftButton:
+        elif event.button() == Qt.LeftButton and self.text_box.rect().contains(QPointF(event.pos())):
+            self.update_overlay(self.text_box.set_cursor_at(event.pos(), event.modifiers() & Qt.ShiftModifier))
 
-            self.timer_cleanup()
-            p = QPainter(self.pixmap())
-            p.setRenderHints(QPainter.Antialiasing)
-            font = build_font(self.config)
-            p.setFont(font)
-            pen = QPen(self.primary_color, 1, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        elif event.button() == Qt.LeftButton:
+            p = self.painter()
+            if self.palette_colors is None:
+                p.setRenderHints(QPainter.Antialiasing)
+            else:
+                p.setRenderHint(QPainter.TextAntialiasing, False)
+            pen = QPen(self.ink(self.primary_color), 1, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
             p.setPen(pen)
-            p.drawText(self.current_pos, self.current_text)
-            self.update()
+            self.text_box.paint(p)
+            p.end()
+            self.update(self.text_rect())
 
             self.reset_mode()
 
-        elif event.button() == Qt.RightButton and self.current_pos:
+        elif event.button() == Qt.RightButton and self.text_box:
             self.reset_mode()
 
-    def text_timerEvent(self, final=False):
-        p = QPainter(self.pixmap())
-        p.setCompositionMode(QPainter.RasterOp_SourceXorDestination)
-        pen = PREVIEW_PEN
-        p.setPen(pen)
-        if self.last_text:
-            font = build_font(self.last_config)
-            p.setFont(font)
-            p.drawText(self.current_pos, self.last_text)
+    def text_mouseMoveEvent(self, event):
+        if not self.text_box or not event.buttons() & Qt.LeftButton:
+            return
 
-        if not final:
-            font = build_font(self.config)
-            p.setFont(font)
-            p.drawText(self.current_pos, self.current_text)
+        if self.text_sizing:
+            old = self.text_rect()
+            self.text_box.set_width(event.x() - self.origin_pos.x())
+            self.update_overlay(old.united(self.text_rect()))
+        else:
+            self.update_overlay(self.text_box.set_cursor_at(event.pos(), True))
 
-        self.last_text = self.current_text
-        self.last_config = self.config.copy()
-        self.update()
+    def text_mouseReleaseEvent(self, event):
+        self.text_sizing = False
+
+    def text_rect(self):
+        return self.text_box.rect().toAlignedRect().adjusted(-3, -3, 3, 3)
+
+    def text_timerEvent(self, final=False):
+        if final:
+            rect = self.text_rect()
+            self.text_box = None
+            self.update_overlay(rect)
+            return
+
+        key = font_key(self.config)
+        if key != self.text_box.font_key:
+            old = self.text_rect()
+            self.text_box.set_font(key)
+            self.update_overlay(old.united(self.text_rect()))
+
+        self.cursor_ticks += 1
+        if self.cursor_ticks % 5 == 0:
+            self.update_overlay(self.text_box.selection_rect())
 
     def fill_mousePressEvent(self, event):
 
         if event.button() == Qt.LeftButton:
-            self.active_color = self.primary_color
+            self.active_color = self.ink(self.primary_color)
         else:
-            self.active_color = self.secondary_color
+            self.active_color = self.ink(self.secondary_color)
 
-        image = self.pixmap().toImage()
-        w, h = image.width(), image.height()
-        x, y = event.x(), event.y()
+        if not self.image.rect().contains(event.pos()):
+            return
 
-        target_color = image.pixel(x, y)
+        import numpy as np
+        from imagearray import array_image, image_array
+        from regions import connected_region
 
-        have_seen = set()
-        queue = [(x, y)]
+        region = connected_region(image_array(self.image), event.x(), event.y(), self.config['tolerance'])
+        fill = np.zeros(region.shape, np.uint32)
+        fill[region] = self.active_color.rgba()
 
-        def get_cardinal_points(have_seen, center_pos):
-            points = []
-            cx, cy = center_pos
-            for x, y in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-                xx, yy = cx + x, cy + y
-                if (xx >= 0) and (xx < w) and (yy >= 0) and (yy < h) and (xx, yy) not in have_seen:
-                    points.append((xx, yy))
-                    have_seen.add((xx, yy))
+        p = self.painter()
+        p.drawImage(0, 0, array_image(fill, QImage.Format_ARGB32))
+        p.end()
+        self.update()
 
-            return points
+    def wand_mousePressEvent(self, event):
+        if event.button() == Qt.RightButton:
+            self.clear_selection()
+            return
 
-        p = QPainter(self.pixmap())
-        p.setPen(QPen(self.active_color))
+        if not self.image.rect().contains(event.pos()):
+            return
 
-        while queue:
-            x, y = queue.pop()
-            if image.pixel(x, y) == target_color:
-                p.drawPoint(QPoint(x, y))
-                queue.extend(get_cardinal_points(have_seen, (x, y)))
+        from imagearray import image_array
+        from regions import connected_region
+        from selection import SelectionMask, selection_op
 
-        self.update()
+        region = connected_region(image_array(self.image), event.x(), event.y(), self.config['tolerance'])
+        self.combine_selection(SelectionMask.from_array(region), selection_op(event.modifiers()))
+
+    def wand_copy(self):
+        return self.selection_pixmap()
+
+    def sample_color(self, pos):
+        if self.palette_colors is not None:
+            # Averages would not be palette colors, so indexed documents sample one pixel.
+            return QColor.fromRgba(self.colored().pixel(pos))
+        return self.samples.average(pos.x(), pos.y(), self.config['sample_size'])
 
     def dropper_mousePressEvent(self, event):
-        c = self.pixmap().toImage().pixel(event.pos())
-        hex = QColor(c).name()
+        if not self.image.rect().contains(event.pos()):
+            return
+
+        hex = self.sample_color(event.pos()).name()
 
         if event.button() == Qt.LeftButton:
             self.set_primary_color(hex)
@@ -320,13 +1094,126 @@ class Easel(QLabel):
             self.set_secondary_color(hex)
             self.secondary_color_updated.emit(hex)
 
+    def dropper_mouseMoveEvent(self, event):
+        if self.image.rect().contains(event.pos()):
+            color = self.sample_color(event.pos())
+            self.color_sampled.emit("%s  rgb(%d, %d, %d)  at %d, %d" % (
+                color.name(), color.red(), color.green(), color.blue(), event.x(), event.y()))
+
+    def selectrect_mousePressEvent(self, event):
+        if self.selection_drag_mousePressEvent(event):
+            return
+
+        if event.button() == Qt.LeftButton:
+            from selection import selection_op
+            self.origin_pos = event.pos()
+            self.current_pos = event.pos()
+            self.active_selection_op = selection_op(event.modifiers())
+
+        elif event.button() == Qt.RightButton:
+            self.clear_selection()
+            self.reset_mode()
+
+    def selectrect_mouseMoveEvent(self, event):
+        if self.selection_drag_mouseMoveEvent(event):
+            return
+
+        if self.origin_pos:
+            self.current_pos = event.pos()
+            self.update_overlay()
+
+    def selectrect_mouseReleaseEvent(self, event):
+        if self.selection_drag_mouseReleaseEvent(event):
+            return
+
+        if self.origin_pos and event.button() == Qt.LeftButton:
+            rect = QRect(self.origin_pos, event.pos()).normalized()
+
+            if rect.width() > 1 or rect.height() > 1:
+                from selection import SelectionMask
+                w, h = self.image.width(), self.image.height()
+                self.combine_selection(SelectionMask.from_rect(w, h, rect), self.active_selection_op)
+
+            elif self.active_selection_op == 'replace':
+                self.clear_selection()
+
+        self.reset_mode()
+
+    def selectrect_copy(self):
+        return self.selection_pixmap()
+
+    def selectpoly_mousePressEvent(self, event):
+        if not self.history_pos and self.selection_drag_mousePressEvent(event):
+            return
+
+        if event.button() == Qt.LeftButton:
+            if self.history_pos:
+                self.history_pos.append(event.pos())
+            else:
+                from selection import selection_op
+                self.history_pos = [event.pos()]
+                self.current_pos = event.pos()
+                self.active_selection_op = selection_op(event.modifiers())
+            self.update_overlay()
+
+        elif event.button() == Qt.RightButton:
+            if not self.history_pos:
+                self.clear_selection()
+            self.reset_mode()
+
+    def selectpoly_mouseMoveEvent(self, event):
+        if self.selection_drag_mouseMoveEvent(event):
+            return
+
+        if self.history_pos:
+            self.current_pos = event.pos()
+            self.update_overlay()
+
+    def selectpoly_mouseReleaseEvent(self, event):
+        self.selection_drag_mouseReleaseEvent(event)
+
+    def selectpoly_mouseDoubleClickEvent(self, event):
+        if self.history_pos and len(self.history_pos) > 2:
+            from selection import SelectionMask
+            w, h = self.image.width(), self.image.height()
+            self.combine_selection(SelectionMask.from_polygon(w, h, self.history_pos), self.active_selection_op)
+
+        self.reset_mode()
+
+    def selectpoly_copy(self):
+        return self.selection_pixmap()
+
+    def finish_shape(self, points, pen, brush=None):
+        """
+        Draw a finished shape of the current mode into the image, or keep it on the
+        vector layer when that is enabled and the document is not indexed.
+        """
+        if self.palette_colors is not None:
+            pen, brush = QPen(pen), QBrush(brush) if brush is not None else None
+            pen.setColor(self.ink(pen.color()))
+            if brush is not None:
+                brush.setColor(self.ink(brush.color()))
+
+        shape = Shape(self.mode, points, pen, brush)
+        if self.config['vector'] and self.palette_colors is None:
+            self.shapes.add(shape)
+            self.update_overlay(shape.bounds())
+            if self.timelapse:
+                self.timelapse.touch(shape.bounds())
+            return
+
+        p = self.painter()
+        shape.paint(p)
+        p.end()
+        self.update(shape.bounds())
+
     def generic_shape_mousePressEvent(self, event):
         self.origin_pos = event.pos()
         self.current_pos = event.pos()
         self.timer_event = self.generic_shape_timerEvent
 
     def generic_shape_timerEvent(self, final=False):
-        p = QPainter(self.pixmap())
+        p = QPainter(self.image)
         p.setCompositionMode(QPainter.RasterOp_SourceXorDestination)
         pen = self.preview_pen
         pen.setDashOffset(self.dash_offset)
@@ -340,7 +1227,7 @@ class Easel(QLabel):
             p.setPen(pen)
             getattr(p, self.active_shape_fn)(QRect(self.origin_pos, self.current_pos), *self.active_shape_args)
 
-        self.update()
+        self.update(points_rect([self.origin_pos, self.last_pos, self.current_pos], pen.width()))
         self.last_pos = self.current_pos
 
     def generic_shape_mouseMoveEvent(self, event):
@@ -350,13 +1237,9 @@ class Easel(QLabel):
         if self.last_pos:
             self.timer_cleanup()
 
-            p = QPainter(self.pixmap())
-            p.setPen(QPen(self.primary_color, self.config['size'], Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin))
-
-            if self.config['fill']:
-                p.setBrush(QBrush(self.secondary_color))
-            getattr(p, self.active_shape_fn)(QRect(self.origin_pos, event.pos()), *self.active_shape_args)
-            self.update()
+            pen = QPen(self.primary_color, self.config['size'], Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin)
+            brush = QBrush(self.secondary_color) if self.config['fill'] else None
+            self.finish_shape([self.origin_pos, event.pos()], pen, brush)
 
         self.reset_mode()
 
@@ -367,7 +1250,7 @@ class Easel(QLabel):
         self.timer_event = self.line_timerEvent
 
     def line_timerEvent(self, final=False):
-        p = QPainter(self.pixmap())
+        p = QPainter(self.image)
         p.setCompositionMode(QPainter.RasterOp_SourceXorDestination)
         pen = self.preview_pen
         p.setPen(pen)
@@ -377,7 +1260,7 @@ class Easel(QLabel):
         if not final:
             p.drawLine(self.origin_pos, self.current_pos)
 
-        self.update()
+        self.update(points_rect([self.origin_pos, self.last_pos, self.current_pos], pen.width()))
         self.last_pos = self.current_pos
 
     def line_mouseMoveEvent(self, event):
@@ -387,11 +1270,8 @@ class Easel(QLabel):
         if self.last_pos:
             self.timer_cleanup()
 
-            p = QPainter(self.pixmap())
-            p.setPen(QPen(self.primary_color, self.config['size'], Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-
-            p.drawLine(self.origin_pos, event.pos())
-            self.update()
+            pen = QPen(self.primary_color, self.config['size'], Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+            self.finish_shape([self.origin_pos, event.pos()], pen)
 
         self.reset_mode()
 
@@ -409,7 +1289,7 @@ class Easel(QLabel):
             self.reset_mode()
 
     def generic_poly_timerEvent(self, final=False):
-        p = QPainter(self.pixmap())
+        p = QPainter(self.image)
         p.setCompositionMode(QPainter.RasterOp_SourceXorDestination)
         pen = self.preview_pen
         pen.setDashOffset(self.dash_offset)
@@ -423,7 +1303,7 @@ class Easel(QLabel):
             p.setPen(pen)
             getattr(p, self.active_shape_fn)(*self.history_pos + [self.current_pos])
 
-        self.update()
+        self.update(points_rect(self.last_history + self.history_pos + [self.current_pos], pen.width()))
         self.last_pos = self.current_pos
         self.last_history = self.history_pos + [self.current_pos]
 
@@ -432,14 +1312,9 @@ class Easel(QLabel):
 
     def generic_poly_mouseDoubleClickEvent(self, event):
         self.timer_cleanup()
-        p = QPainter(self.pixmap())
-        p.setPen(QPen(self.primary_color, self.config['size'], Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-
-        if self.secondary_color:
-            p.setBrush(QBrush(self.secondary_color))
-
-        getattr(p, self.active_shape_fn)(*self.history_pos + [event.pos()])
-        self.update()
+        pen = QPen(self.primary_color, self.config['size'], Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        brush = QBrush(self.secondary_color) if self.secondary_color else None
+        self.finish_shape(self.history_pos + [event.pos()], pen, brush)
         self.reset_mode()
 
     def polyline_mousePressEvent(self, event):
@@ -515,11 +1390,109 @@ class Easel(QLabel):
     def roundrect_mouseReleaseEvent(self, event):
         self.generic_shape_mouseReleaseEvent(event)
 
+    def select_shapes(self, ids):
+        changed = set(self.selected_shapes).symmetric_difference(ids)
+        self.selected_shapes = ids
+        self.repaint_shapes(self.shapes.rect(id) for id in changed)
+
+    def repaint_shapes(self, rects):
+        dirty = QRect()
+        for rect in rects:
+            dirty |= rect
+        if not dirty.isNull():
+            # Selection outlines are drawn on the bounds, one pixel past the right and bottom.
+            self.update_overlay(dirty.adjusted(0, 0, 1, 1))
+            if self.timelapse:
+                self.timelapse.touch(dirty)
+
+    def restyle_shapes(self, **style):
+        if self.selected_shapes:
+            self.repaint_shapes([self.shapes.restyle(self.selected_shapes, **style)])
+
+    def vector_mousePressEvent(self, event):
+        hit = self.shapes.hit(event.x(), event.y())
+        selected = self.selected_shapes
+        if event.modifiers() & Qt.ShiftModifier:
+            if hit in selected:
+                selected = [id for id in selected if id != hit]
+            elif hit is not None:
+                selected = selected + [hit]
+        elif hit not in selected:
+            selected = [] if hit is None else [hit]
+
+        self.select_shapes(selected)
+        self.drag_pos = event.pos() if hit in selected else None
+
+    def vector_mouseMoveEvent(self, event):
+        if self.drag_pos is not None and event.buttons() & Qt.LeftButton:
+            delta = event.pos() - self.drag_pos
+            self.repaint_shapes([self.shapes.move(self.selected_shapes, delta.x(), delta.y())])
+            self.drag_pos = event.pos()
+
+    def vector_mouseReleaseEvent(self, event):
+        self.drag_pos = None
+
+    def vector_keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
+            selected, self.selected_shapes = self.selected_shapes, []
+            self.repaint_shapes([self.shapes.remove(selected)])
+
+        elif event.key() == Qt.Key_Escape:
+            self.select_shapes([])
+
+
+class FontComboBox(QComboBox):
+    """
+    Font family picker that defers enumerating the font database until it is
+    first needed, rather than filling itself at startup like QFontComboBox.
+    """
+    currentFontChanged = pyqtSignal(QFont)
+
+    populated = False
+
+    def __init__(self, *args, **kwargs):
+        super(FontComboBox, self).__init__(*args, **kwargs)
+        self.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.setMinimumContentsLength(16)
+        self.currentTextChanged.connect(lambda family: self.currentFontChanged.emit(QFont(family)))
+
+    def currentFont(self):
+        return QFont(self.currentText())
+
+    def setCurrentFont(self, font):
+        if self.findText(font.family()) < 0:
+            self.addItem(font.family())
+        self.setCurrentText(font.family())
+
+    def populate(self):
+        if self.populated:
+            return
+
+        self.populated = True
+        current = self.currentText()
+
+        self.blockSignals(True)
+        self.clear()
+        self.addItems(QFontDatabase().families())
+        self.blockSignals(False)
+
+        self.setCurrentFont(QFont(current))
+
+    def showPopup(self):
+        self.populate()
+        super(FontComboBox, self).showPopup()
+
+    def focusInEvent(self, event):
+        self.populate()
+        super(FontComboBox, self).focusInEvent(event)
+
 
 class MainWindow(QMainWindow, Ui_MainWindow):
+    export_finished = pyqtSignal(str)
 
     def __init__(self, *args, **kwargs):
         super(MainWindow, self).__init__(*args, **kwargs)
+        load_resources()
         self.setupUi(self)
 
         self.horizontalLayout.removeWidget(self.canvas)
@@ -543,10 +1516,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.primaryButton.pressed.connect(lambda: self.choose_color(self.set_primary_color))
         self.secondaryButton.pressed.connect(lambda: self.choose_color(self.set_secondary_color))
 
-        for n, hex in enumerate(COLORS, 1):
+        self.set_swatches(COLORS)
+        for n in range(1, len(COLORS) + 1):
             btn = getattr(self, 'colorButton_%d' % n)
-            btn.setStyleSheet('QPushButton { background-color: %s; }' % hex)
-            btn.hex = hex
 
             def patch_mousePressEvent(self_, event):
                 if event.button() == Qt.LeftButton:
@@ -558,6 +1530,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             btn.mousePressEvent = types.MethodType(patch_mousePressEvent, btn)
 
         self.actionCopy.triggered.connect(self.copy_to_clipboard)
+        self.actionCut.triggered.connect(self.cut_to_clipboard)
+        self.actionPaste.triggered.connect(self.paste_from_clipboard)
+        self.actionSelectAll.triggered.connect(self.canvas.select_all)
+        self.actionDeselect.triggered.connect(self.canvas.clear_selection)
+        self.actionInvertSelection.triggered.connect(self.canvas.invert_selection)
 
         self.timer = QTimer()
         self.timer.timeout.connect(self.canvas.on_timer)
@@ -578,10 +1555,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.actionFlipHorizontal.triggered.connect(self.flip_horizontal)
         self.actionFlipVertical.triggered.connect(self.flip_vertical)
 
-        self.fontselect = QFontComboBox()
+        self.fontselect = FontComboBox()
         self.fontToolbar.addWidget(self.fontselect)
         self.fontselect.currentFontChanged.connect(lambda f: self.canvas.set_config('font', f))
         self.fontselect.setCurrentFont(QFont('Times'))
+        self.textButton.pressed.connect(self.fontselect.populate)
 
         self.fontsize = QComboBox()
         self.fontsize.addItems([str(s) for s in FONT_SIZES])
@@ -605,10 +1583,86 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.sizeselect.valueChanged.connect(lambda s: self.canvas.set_config('size', s))
         self.drawingToolbar.addWidget(self.sizeselect)
 
+        self.drawingToolbar.addWidget(QLabel('Tolerance'))
+        self.toleranceselect = QSpinBox()
+        self.toleranceselect.setRange(0, 255)
+        self.toleranceselect.valueChanged.connect(lambda s: self.canvas.set_config('tolerance', s))
+        self.drawingToolbar.addWidget(self.toleranceselect)
+
         self.actionFillShapes.triggered.connect(lambda s: self.canvas.set_config('fill', s))
         self.drawingToolbar.addAction(self.actionFillShapes)
         self.actionFillShapes.setChecked(True)
 
+        self.actionSmoothStrokes.triggered.connect(lambda s: self.canvas.set_config('smoothing', s))
+        self.drawingToolbar.addAction(self.actionSmoothStrokes)
+
+        self.actionVectorShapes.triggered.connect(lambda s: self.canvas.set_config('vector', s))
+        self.drawingToolbar.addAction(self.actionVectorShapes)
+
+        self.drawingToolbar.addWidget(QLabel('Tip'))
+        self.tipselect = QComboBox()
+        self.tipselect.addItems(TIPS)
+        self.tipselect.currentTextChanged.connect(lambda s: self.canvas.set_config('brush_tip', s))
+        self.drawingToolbar.addWidget(self.tipselect)
+
+        self.drawingToolbar.addWidget(QLabel('Hardness'))
+        self.hardnessselect = QSpinBox()
+        self.hardnessselect.setRange(0, 100)
+        self.hardnessselect.setSuffix('%')
+        self.hardnessselect.setValue(self.canvas.config['hardness'])
+        self.hardnessselect.valueChanged.connect(lambda s: self.canvas.set_config('hardness', s))
+        self.drawingToolbar.addWidget(self.hardnessselect)
+
+        self.drawingToolbar.addWidget(QLabel('Spacing'))
+        self.spacingselect = QSpinBox()
+        self.spacingselect.setRange(1, 200)
+        self.spacingselect.setSuffix('%')
+        self.spacingselect.setValue(self.canvas.config['spacing'])
+        self.spacingselect.valueChanged.connect(lambda s: self.canvas.set_config('spacing', s))
+        self.drawingToolbar.addWidget(self.spacingselect)
+
+        self.drawingToolbar.addWidget(QLabel('Eraser'))
+        self.erasersizeselect = QSpinBox()
+        self.erasersizeselect.setRange(1, 200)
+        self.erasersizeselect.setSuffix(' px')
+        self.erasersizeselect.setValue(self.canvas.config['eraser_size'])
+        self.erasersizeselect.valueChanged.connect(lambda s: self.canvas.set_config('eraser_size', s))
+        self.drawingToolbar.addWidget(self.erasersizeselect)
+
+        self.drawingToolbar.addWidget(QLabel('Sample'))
+        self.sampleselect = QComboBox()
+        self.sampleselect.addItems(['Point'] + ['%dx%d' % (s, s) for s in SAMPLE_SIZES[1:]])
+        self.sampleselect.currentIndexChanged.connect(lambda i: self.canvas.set_config('sample_size', SAMPLE_SIZES[i]))
+        self.drawingToolbar.addWidget(self.sampleselect)
+
+        self.canvas.color_sampled.connect(self.statusBar.showMessage)
+
+        self.actionDiagnostics.triggered.connect(
+            lambda s: self.canvas.show_diagnostics(s, os.environ.get('PYPAINT_DIAGNOSTICS_LOG')))
+        if os.environ.get('PYPAINT_DIAGNOSTICS_LOG'):
+            self.actionDiagnostics.trigger()
+
+        self.actionProfileTool.triggered.connect(self.profile_tool)
+
+        self.exporter = ThreadPoolExecutor(max_workers=1)
+        self.export_options = {}
+        self.export_finished.connect(self.statusBar.showMessage)
+
+        self.actionImportSvg.triggered.connect(self.import_svg)
+        self.actionExportSvg.triggered.connect(self.export_svg)
+
+        self.actionRecordMacro.triggered.connect(self.record_macro)
+        self.actionPlayMacro.triggered.connect(self.play_macro)
+        self.actionRecordTimelapse.triggered.connect(self.record_timelapse)
+
+        self.actionIndexedColors.triggered.connect(self.canvas.set_indexed)
+        self.actionReduceColors.triggered.connect(self.reduce_colors)
+        self.canvas.indexed_changed.connect(self.actionIndexedColors.setChecked)
+
+        # Connected last so an action is recorded after anything it records itself.
+        for name in macro.ACTIONS:
+            getattr(self, name).triggered.connect(lambda checked=False, name=name: self.canvas.record('action', name))
+
         self.show()
 
     def choose_color(self, callback):
@@ -624,71 +1678,205 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.canvas.set_secondary_color(hex)
         self.secondaryButton.setStyleSheet('QPushButton { background-color: %s; }' % hex)
 
+    def set_swatches(self, colors):
+        """
+        Show colors on the swatch buttons, in order; buttons past the end keep theirs.
+        """
+        for n, hex in enumerate(colors[:len(COLORS)], 1):
+            btn = getattr(self, 'colorButton_%d' % n)
+            btn.setStyleSheet('QPushButton { background-color: %s; }' % hex)
+            btn.hex = hex
+
+    def reduce_colors(self):
+        from quantize import ReduceColorsDialog
+
+        dialog = ReduceColorsDialog(self)
+        if not dialog.exec():
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            palette = self.canvas.reduce_colors(**dialog.options())
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if dialog.swatches.isChecked():
+            self.set_swatches([QColor(c).name() for c in palette if c >> 24 == 0xff])
+        self.statusBar.showMessage("Reduced to %d colors" % len(palette))
+
     def copy_to_clipboard(self):
         clipboard = QApplication.clipboard()
 
-        if self.canvas.mode == 'selectrect' and self.canvas.locked:
-            clipboard.setPixmap(self.canvas.selectrect_copy())
-
-        elif self.canvas.mode == 'selectpoly' and self.canvas.locked:
-            clipboard.setPixmap(self.canvas.selectpoly_copy())
+        if self.canvas.mode in SELECTION_MODES and self.canvas.locked:
+            clipboard.setPixmap(getattr(self.canvas, '%s_copy' % self.canvas.mode)())
 
         else:
-            clipboard.setPixmap(self.canvas.pixmap())
+            clipboard.setImage(self.canvas.flattened())
+
+    def cut_to_clipboard(self):
+        if self.canvas.mode in SELECTION_MODES and self.canvas.locked:
+            self.copy_to_clipboard()
+            if self.canvas.floating is not None:
+                self.canvas.floating = None
+                self.canvas.clear_selection()
+            else:
+                self.canvas.erase_selection()
+
+    def paste_from_clipboard(self):
+        pixmap = QApplication.clipboard().pixmap()
+        if pixmap.isNull():
+            return
+
+        if self.canvas.mode not in SELECTION_MODES:
+            self.selectrectButton.setChecked(True)
+            self.canvas.set_mode('selectrect')
+
+        pos = self.canvas.selection.bounding_rect().topLeft() if self.canvas.selection is not None else QPoint(0, 0)
+        self.canvas.paste_floating(pixmap, pos)
 
     def open_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open file", "",
                                               "PNG image files (*.png); JPEG image files (*jpg); All files (*.*)")
 
         if path:
-            pixmap = QPixmap()
-            pixmap.load(path)
+            image = QImage(path)
 
-            image_weight = pixmap.width()
-            image_height = pixmap.height()
+            image_weight = image.width()
+            image_height = image.height()
 
             easel_weight, ch = EASEL_DIMENSIONS
 
             if image_weight / easel_weight < image_height / ch:
-                pixmap = pixmap.scaledToWidth(easel_weight)
-                hoff = (pixmap.height() - ch) // 2
-                pixmap = pixmap.copy(
-                    QRect(QPoint(0, hoff), QPoint(easel_weight, pixmap.height() - hoff))
+                image = image.scaledToWidth(easel_weight)
+                hoff = (image.height() - ch) // 2
+                image = image.copy(
+                    QRect(QPoint(0, hoff), QPoint(easel_weight, image.height() - hoff))
                 )
 
             elif image_weight / easel_weight > image_height / ch:
-                pixmap = pixmap.scaledToHeight(ch)
-                woff = (pixmap.width() - easel_weight) // 2
-                pixmap = pixmap.copy(
-                    QRect(QPoint(woff, 0), QPoint(pixmap.width() - woff, ch))
+                image = image.scaledToHeight(ch)
+                woff = (image.width() - easel_weight) // 2
+                image = image.copy(
+                    QRect(QPoint(woff, 0), QPoint(image.width() - woff, ch))
                 )
 
-            self.canvas.setPixmap(pixmap)
+            self.canvas.set_image(image)
+            self.canvas.clear_selection()
 
     def save_file(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save file", "", "PNG Image file (*.png)")
+        import export
+
+        path, selected = QFileDialog.getSaveFileName(self, "Save file", "", export.file_filter())
+        if not path:
+            return
+
+        name = export.format_for_path(path, selected.split()[0] if selected else 'PNG')
+        if not os.path.splitext(path)[1]:
+            path += '.' + export.FORMATS[name][1][0]
+
+        # A shallow copy: the worker shares the pixels, and painting on the canvas
+        # meanwhile detaches the canvas image from them.
+        image = QImage(self.canvas.flattened())
+        dialog = export.ExportDialog(image, name, self.export_options.get(name), self)
+        if not dialog.exec():
+            return
+
+        self.export_options[name] = dialog.options
+        self.statusBar.showMessage("Saving %s..." % path)
+        future = self.exporter.submit(export.save, image, path, name, dict(dialog.options))
+        future.add_done_callback(lambda f: self.export_finished.emit(
+            "Saved %s" % path if not f.exception() else "Could not save %s: %s" % (path, f.exception())))
+
+    def import_svg(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import SVG", "", "SVG files (*.svg)")
+        if path:
+            self.canvas.load_svg(path)
+            self.canvas.clear_selection()
+
+    def export_svg(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export SVG", "", "SVG files (*.svg)")
+        if path:
+            import svgio
+            svgio.write_svg(path, self.canvas.colored(), self.canvas.shapes)
+
+    def profile_tool(self, checked):
+        """
+        Profile the current tool's handlers until unchecked, then dump the statistics to a file.
+        PYPAINT_PROFILER selects the profiler: cprofile (default), sampling or tracemalloc.
+        """
+        if checked:
+            self.profiled_mode = self.canvas.mode
+            self.canvas.start_profiling(self.profiled_mode, os.environ.get('PYPAINT_PROFILER', 'cprofile'))
+            return
+
+        mode = self.profiled_mode
+        profiler = self.canvas.profilers.get(mode)
+        if profiler:
+            path = 'profile-%s.%s' % (mode, profiler.extension)
+            self.canvas.stop_profiling(mode, path)
+            self.statusBar.showMessage("Profile of %s written to %s" % (mode, path))
+
+    def record_macro(self, checked):
+        if not checked:
+            self.canvas.stop_recording()
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Record macro", "", "Macro files (*.macro)")
+        if path:
+            self.canvas.start_recording(path)
+        else:
+            self.actionRecordMacro.setChecked(False)
+
+    def record_timelapse(self, checked):
+        if not checked:
+            try:
+                frames = self.canvas.stop_timelapse()
+                self.statusBar.showMessage("Timelapse saved, %d frames" % frames)
+            except OSError as e:
+                self.statusBar.showMessage("Could not save timelapse: %s" % e)
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Record timelapse", "", "Animated PNG files (*.png *.apng)")
+        if path:
+            self.canvas.start_timelapse(path)
+            self.statusBar.showMessage("Recording timelapse to %s" % path)
+        else:
+            self.actionRecordTimelapse.setChecked(False)
 
+    def play_macro(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Play macro", "", "Macro files (*.macro)")
         if path:
-            pixmap = self.canvas.pixmap()
-            pixmap.save(path, "PNG")
+            self.actionRecordMacro.setChecked(False)
+            self.canvas.stop_recording()
+            macro.replay(path, self.canvas, {name: getattr(self, name).trigger for name in macro.ACTIONS})
+            getattr(self, '%sButton' % self.canvas.mode).setChecked(True)
+
+    def closeEvent(self, event):
+        self.exporter.shutdown(wait=True)
+        self.canvas.stop_recording()
+        if self.actionRecordTimelapse.isChecked():
+            self.actionRecordTimelapse.trigger()
+        self.canvas.show_diagnostics(False)
+        super(MainWindow, self).closeEvent(event)
 
     def invert(self):
-        image_ = QImage(self.canvas.pixmap())
-        image_.invertPixels()
-        pixmap = QPixmap()
-        pixmap.convertFromImage(image_)
-        self.canvas.setPixmap(pixmap)
+        if self.canvas.palette_colors is not None and self.canvas.selection is None:
+            self.canvas.recolor(lambda rgba: rgba ^ 0xffffff)
+        else:
+            self.canvas.apply_filter(invert_image)
 
     def flip_horizontal(self):
-        pixmap = self.canvas.pixmap()
-        self.canvas.setPixmap(pixmap.transformed(QTransform().scale(-1, 1)))
+        self.canvas.apply_filter(lambda image: flip_image(image, True, False))
 
     def flip_vertical(self):
-        pixmap = self.canvas.pixmap()
-        self.canvas.setPixmap(pixmap.transformed(QTransform().scale(1, -1)))
+        self.canvas.apply_filter(lambda image: flip_image(image, False, True))
 
 
 if __name__ == '__main__':
+    if sys.argv[1:2] == ['batch']:
+        import batch
+        sys.exit(batch.main(sys.argv[2:]))
+
     app = QApplication(sys.argv)
     window = MainWindow()
     app.exec_()
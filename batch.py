@@ -0,0 +1,266 @@
+"""
+Headless batch processing: apply canvas operations to many images without a window.
+
+    python PyPaint.py batch [options] -o OP [-o OP ...] PATH [PATH ...]
+    find shots -name '*.png' | python batch.py -o invert -d out -
+
+Operations run in the order given:
+
+    invert                  invert the colors
+    flip-h, flip-v          flip horizontally / vertically
+    grayscale               convert to shades of gray
+    resize=WxH              smooth scale to W x H (leave one side empty to keep the aspect ratio)
+    fill=X,Y,COLOR[,TOL]    flood fill at X, Y like the fill tool, e.g. fill=0,0,#ff0000,16
+    reduce=N[,METHOD[,DITHER]]
+                            quantize to N colors with median-cut, k-means or octree, and
+                            dithering none, ordered or floyd-steinberg, e.g. reduce=16,k-means
+
+Paths may be files or directories (searched recursively for images); "-" reads paths
+from standard input, one per line. The list is streamed, so it can be arbitrarily long.
+"""
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tif', '.tiff', '.webp')
+
+# Keep this many jobs queued per worker so the pool never idles while the next paths
+# are read, without holding the whole file list in memory.
+JOBS_PER_WORKER = 4
+
+REPORT_INTERVAL = 1.0
+
+
+def invert_image(image):
+    image.invertPixels()
+    return image
+
+
+def flip_image(image, horizontal, vertical):
+    return image.mirrored(horizontal, vertical)
+
+
+def grayscale_image(image):
+    from PyQt5.QtGui import QImage
+    return image.convertToFormat(QImage.Format_Grayscale8).convertToFormat(image.format())
+
+
+def resize_image(image, width, height):
+    from PyQt5.QtCore import Qt
+
+    if width is None:
+        width = round(image.width() * height / image.height())
+    if height is None:
+        height = round(image.height() * width / image.width())
+    return image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+def fill_image(image, x, y, color, tolerance=0):
+    from PyQt5.QtGui import QColor, QImage, QPainter
+
+    import numpy as np
+    from imagearray import array_image, image_array
+    from regions import connected_region
+
+    image = image.convertToFormat(QImage.Format_ARGB32)
+    if not image.rect().contains(x, y):
+        return image
+
+    region = connected_region(image_array(image), x, y, tolerance)
+    fill = np.zeros(region.shape, np.uint32)
+    fill[region] = QColor(color).rgba()
+
+    p = QPainter(image)
+    p.drawImage(0, 0, array_image(fill, QImage.Format_ARGB32))
+    p.end()
+    return image
+
+
+def reduce_image(image, n, method='median-cut', dither='none'):
+    from quantize import quantize
+    from indexed import color_view
+
+    indices, palette = quantize(image, n, method, dither)
+    return color_view(indices, palette).copy()
+
+
+def parse_size(value):
+    w, _, h = value.partition('x')
+    width, height = int(w) if w else None, int(h) if h else None
+    if width is None and height is None:
+        raise ValueError("resize needs a width, a height or both")
+    return width, height
+
+
+def parse_fill(value):
+    parts = value.split(',')
+    if len(parts) not in (3, 4):
+        raise ValueError("fill takes X,Y,COLOR[,TOLERANCE]")
+    return int(parts[0]), int(parts[1]), parts[2], int(parts[3]) if len(parts) == 4 else 0
+
+
+def parse_reduce(value):
+    from quantize import DITHERS, METHODS
+
+    parts = value.split(',')
+    if not 1 <= len(parts) <= 3:
+        raise ValueError("reduce takes N[,METHOD[,DITHER]]")
+    if len(parts) > 1 and parts[1] not in METHODS:
+        raise ValueError("method must be one of %s" % ', '.join(METHODS))
+    if len(parts) > 2 and parts[2] not in DITHERS:
+        raise ValueError("dithering must be one of %s" % ', '.join(DITHERS))
+    return (int(parts[0]),) + tuple(parts[1:])
+
+
+OPERATIONS = {
+    'invert': (invert_image, None),
+    'flip-h': (lambda image: flip_image(image, True, False), None),
+    'flip-v': (lambda image: flip_image(image, False, True), None),
+    'grayscale': (grayscale_image, None),
+    'resize': (resize_image, parse_size),
+    'fill': (fill_image, parse_fill),
+    'reduce': (reduce_image, parse_reduce),
+}
+
+
+def parse_operation(spec):
+    """
+    Turn "name" or "name=args" into a picklable (name, args) tuple.
+    """
+    name, _, value = spec.partition('=')
+    if name not in OPERATIONS:
+        raise argparse.ArgumentTypeError("unknown operation %r" % name)
+
+    fn, parse = OPERATIONS[name]
+    if parse is None:
+        if value:
+            raise argparse.ArgumentTypeError("%s takes no arguments" % name)
+        return name, ()
+
+    try:
+        return name, parse(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("%s: %s" % (name, e))
+
+
+def init_worker():
+    """
+    Each worker process needs its own QGuiApplication for image plugins and painting.
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtGui import QGuiApplication
+
+    global app
+    app = QGuiApplication(sys.argv[:1])
+
+
+def process(path, target, operations, quality):
+    from PyQt5.QtGui import QImage
+
+    image = QImage(path)
+    if image.isNull():
+        raise IOError("cannot read image")
+
+    for name, args in operations:
+        image = OPERATIONS[name][0](image, *args)
+
+    if not image.save(target, None, quality):
+        raise IOError("cannot write %s" % target)
+
+
+def iter_paths(sources):
+    """
+    Lazily yield image paths from files, directories and "-" (stdin).
+    """
+    for source in sources:
+        if source == '-':
+            for line in sys.stdin:
+                line = line.strip()
+                if line:
+                    yield line
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield source
+
+
+def target_path(path, args):
+    name = os.path.basename(path)
+    if args.format:
+        name = os.path.splitext(name)[0] + '.' + args.format
+    return os.path.join(args.output_dir or os.path.dirname(path), args.prefix + name)
+
+
+def run(args):
+    done = failed = 0
+    start = last_report = time.perf_counter()
+
+    def report(final=False):
+        elapsed = time.perf_counter() - start
+        rate = done / elapsed if elapsed else 0
+        print("%d images, %d failed, %.1f images/s" % (done, failed, rate),
+              file=sys.stderr, end='\n' if final else '\r', flush=True)
+
+    with concurrent.futures.ProcessPoolExecutor(args.jobs, initializer=init_worker) as pool:
+        pending = {}
+        paths = iter_paths(args.paths)
+
+        while True:
+            for path in paths:
+                future = pool.submit(process, path, target_path(path, args), args.operations, args.quality)
+                pending[future] = path
+                if len(pending) >= args.jobs * JOBS_PER_WORKER:
+                    break
+
+            if not pending:
+                break
+
+            finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                path = pending.pop(future)
+                done += 1
+                error = future.exception()
+                if error is not None:
+                    failed += 1
+                    print("%s: %s" % (path, error), file=sys.stderr)
+
+            now = time.perf_counter()
+            if not args.quiet and now - last_report >= REPORT_INTERVAL:
+                last_report = now
+                report()
+
+    if not args.quiet:
+        report(final=True)
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='PyPaint.py batch', description=__doc__.strip().splitlines()[0],
+                                     epilog=__doc__.split('\n\n', 2)[2], formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help="image files, directories or - for stdin")
+    parser.add_argument('-o', '--op', dest='operations', action='append', type=parse_operation, required=True,
+                        metavar='OP', help="operation to apply, may be repeated")
+    parser.add_argument('-d', '--output-dir', help="write results here (default: next to the input)")
+    parser.add_argument('-p', '--prefix', default='', help="prefix for output file names")
+    parser.add_argument('-f', '--format', help="output format extension, e.g. png or jpg (default: keep)")
+    parser.add_argument('-q', '--quality', type=int, default=-1, help="JPEG/WebP quality 0-100")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument('--quiet', action='store_true', help="do not report progress")
+    args = parser.parse_args(argv)
+
+    if not args.output_dir and not args.prefix and not args.format:
+        parser.error("refusing to overwrite the inputs: give --output-dir, --prefix or --format")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    return run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
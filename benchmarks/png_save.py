@@ -0,0 +1,117 @@
+"""
+PNG save benchmark: Qt's PNG writer against the parallel strip writer.
+
+    python benchmarks/png_save.py [--size W H] [--level N] [--jobs N ...] [--json OUT]
+
+The canvas is a fixed-seed mix of gradients, flat fills, strokes and noise, like a
+painted image. Each writer saves it REPEAT times and the best time is reported,
+with the file size and a check that the file decodes back to the same pixels.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEED = 1234
+REPEAT = 3
+
+
+def make_canvas(width, height):
+    import numpy as np
+    from PyQt5.QtGui import QImage
+    from imagearray import array_image
+
+    rng = np.random.default_rng(SEED)
+    y, x = np.mgrid[:height, :width]
+    arr = np.empty((height, width, 4), np.uint8)
+    arr[..., 0] = x * 255 // width
+    arr[..., 1] = y * 255 // height
+    arr[..., 2] = (x + y) * 255 // (width + height)
+    arr[..., 3] = 255
+    for _ in range(200):
+        x0, y0 = rng.integers(0, width), rng.integers(0, height)
+        w, h = rng.integers(16, width // 8), rng.integers(16, height // 8)
+        arr[y0:y0 + h, x0:x0 + w, :3] = rng.integers(0, 256, 3)
+    noise = arr[height // 2:height // 2 + height // 8]
+    noise[..., :3] = rng.integers(0, 256, noise[..., :3].shape)
+    return array_image(arr, QImage.Format_ARGB32_Premultiplied)
+
+
+def png_quality(level):
+    """
+    The QImageWriter quality that makes Qt's PNG writer use zlib level 0-9, since
+    it derives the level from the quality as (100 - quality) * 9 / 91.
+    """
+    return 100 - (level * 91 + 8) // 9
+
+
+def timed(fn, path):
+    best = float('inf')
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        fn(path)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main(argv=None):
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, nargs=2, default=(8000, 6000), metavar=('W', 'H'), help="canvas size")
+    parser.add_argument('--level', type=int, default=6, help="zlib compression level")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1],
+                        help="thread counts to try")
+    parser.add_argument('--json', help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    from PyQt5.QtGui import QGuiApplication, QImage, QImageWriter
+    from pngwriter import write_png
+
+    app = QGuiApplication(sys.argv[:1])
+    width, height = args.size
+    image = make_canvas(width, height)
+    reference = image.convertToFormat(QImage.Format_ARGB32)
+    megabytes = width * height * 4 / 1e6
+
+    def qt_save(path):
+        writer = QImageWriter(path, b'png')
+        writer.setQuality(png_quality(args.level))
+        if not writer.write(image):
+            raise OSError(writer.errorString())
+
+    writers = [('qt', qt_save)]
+    for jobs in sorted(set(args.jobs)):
+        writers.append(('strips x%d' % jobs, lambda path, jobs=jobs: write_png(image, path, args.level, jobs)))
+
+    results = {'size': [width, height], 'level': args.level, 'cpus': os.cpu_count(), 'writers': {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.png')
+        for name, fn in writers:
+            seconds = timed(fn, path)
+            results['writers'][name] = {
+                'seconds': round(seconds, 3),
+                'mb_per_s': round(megabytes / seconds, 1),
+                'bytes': os.path.getsize(path),
+                'exact': QImage(path).convertToFormat(QImage.Format_ARGB32) == reference,
+            }
+
+    print("%dx%d at level %d on %s cpus" % (width, height, args.level, os.cpu_count()))
+    print("%-12s %10s %10s %12s %6s" % ('writer', 'seconds', 'MB/s', 'bytes', 'exact'))
+    for name, r in results['writers'].items():
+        print("%-12s %10.3f %10.1f %12d %6s" % (name, r['seconds'], r['mb_per_s'], r['bytes'], r['exact']))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    del app
+
+
+if __name__ == '__main__':
+    main()
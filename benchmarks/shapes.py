@@ -0,0 +1,117 @@
+"""
+Vector layer benchmark: hit tests, dirty-rect repaints and moves with many shapes.
+
+    python benchmarks/shapes.py [-n SHAPES] [--size W H] [--json OUT]
+
+Shapes of every kind are scattered over the canvas with a fixed seed. Hit tests
+are at random points; repaints draw the shapes under a DIRTY x DIRTY rect into an
+image, as paintEvent does for a small update. Times are microseconds per call.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEED = 1234
+
+HITS = 10000
+REPAINTS = 1000
+MOVES = 1000
+DIRTY = 64
+
+WORDS = ['lorem', 'ipsum', 'dolor', 'sit', 'amet']
+
+
+def random_shape(rng, kind, width, height):
+    from PyQt5.QtCore import QPoint
+    from PyQt5.QtGui import QBrush, QColor, QFont, QPen
+
+    x, y = rng.randrange(width), rng.randrange(height)
+    size = rng.randrange(8, 64)
+    n = 2 if kind not in ('polyline', 'polygon') else rng.randrange(3, 8)
+    points = [QPoint(x + rng.randrange(size), y + rng.randrange(size)) for _ in range(n)]
+    pen = QPen(QColor(rng.randrange(1 << 24)), rng.randrange(1, 6))
+    brush = QBrush(QColor(rng.randrange(1 << 24))) if rng.random() < 0.5 else None
+    if kind == 'text':
+        return kind, points, pen, brush, rng.choice(WORDS), QFont('Sans', rng.randrange(8, 32))
+    return kind, points, pen, brush
+
+
+def timed(fn, args):
+    times = []
+    for a in args:
+        t = time.perf_counter()
+        fn(*a)
+        times.append((time.perf_counter() - t) * 1e6)
+    times.sort()
+    return {
+        'mean_us': round(statistics.mean(times), 2),
+        'p50_us': round(times[len(times) // 2], 2),
+        'p99_us': round(times[int(len(times) * 0.99)], 2),
+    }
+
+
+def main(argv=None):
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--shapes', type=int, default=100000, help="number of shapes")
+    parser.add_argument('--size', type=int, nargs=2, default=(4096, 4096), metavar=('W', 'H'), help="canvas size")
+    parser.add_argument('--json', help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    from PyQt5.QtCore import QRect
+    from PyQt5.QtGui import QGuiApplication, QImage, QPainter
+    from vector import SHAPE_KINDS, Shape, VectorLayer
+
+    app = QGuiApplication(sys.argv[:1])
+    rng = random.Random(SEED)
+    width, height = args.size
+
+    layer = VectorLayer()
+    t = time.perf_counter()
+    for i in range(args.shapes):
+        layer.add(Shape(*random_shape(rng, SHAPE_KINDS[i % len(SHAPE_KINDS)], width, height)))
+    build = time.perf_counter() - t
+
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    p = QPainter(image)
+
+    def repaint(x, y):
+        rect = QRect(x, y, DIRTY, DIRTY)
+        p.setClipRect(rect)
+        layer.paint(p, rect)
+
+    results = {
+        'shapes': args.shapes,
+        'size': [width, height],
+        'build_s': round(build, 3),
+        'hit': timed(layer.hit, [(rng.randrange(width), rng.randrange(height)) for _ in range(HITS)]),
+        'repaint': timed(repaint, [(rng.randrange(width - DIRTY), rng.randrange(height - DIRTY))
+                                   for _ in range(REPAINTS)]),
+        'move': timed(layer.move, [([rng.randrange(args.shapes)], rng.randrange(-8, 9), rng.randrange(-8, 9))
+                                   for _ in range(MOVES)]),
+    }
+    p.end()
+
+    print("%d shapes on %dx%d, built in %.2f s" % (args.shapes, width, height, build))
+    print("%-10s %10s %10s %10s" % ('op', 'mean us', 'p50 us', 'p99 us'))
+    for op in ('hit', 'repaint', 'move'):
+        r = results[op]
+        print("%-10s %10.1f %10.1f %10.1f" % (op, r['mean_us'], r['p50_us'], r['p99_us']))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    del app
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Startup benchmark: import time of PyPaint and time until the canvas first paints.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/startup.py [-n RUNS] [--json OUT]
+
+Every run is a fresh interpreter so module and font caches start cold. Times are
+milliseconds from the start of the child process's main script.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIMEOUT = 10
+
+
+def child():
+    t0 = time.perf_counter()
+    sys.path.insert(0, ROOT)
+
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+    t_qt = time.perf_counter()
+
+    import PyPaint
+    t_import = time.perf_counter()
+
+    painted = []
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if not painted and event.type() == QEvent.Paint and isinstance(obj, PyPaint.Easel):
+                painted.append(time.perf_counter())
+            return False
+
+    app = QApplication(sys.argv[:1])
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+
+    window = PyPaint.MainWindow()
+    t_window = time.perf_counter()
+
+    while not painted and time.perf_counter() - t0 < TIMEOUT:
+        app.processEvents()
+
+    ms = lambda t: round((t - t0) * 1000, 2)
+    print(json.dumps({
+        'qt_import': ms(t_qt),
+        'import': ms(t_import),
+        'window': ms(t_window),
+        'first_paint': ms(painted[0]) if painted else None,
+    }))
+    window.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-n', '--runs', type=int, default=10)
+    parser.add_argument('--json', help="write the summary to this file")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run([sys.executable, __file__, '--child'], env=env, check=True,
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True)
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    summary = {}
+    for key in runs[0]:
+        values = [r[key] for r in runs if r[key] is not None]
+        summary[key] = {'median': statistics.median(values), 'min': min(values), 'max': max(values)}
+        print("%-12s median %8.2f ms  min %8.2f ms  max %8.2f ms" % (
+            key, summary[key]['median'], summary[key]['min'], summary[key]['max']))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'runs': runs, 'summary': summary}, f, indent=2)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--child']:
+        child()
+    else:
+        main()
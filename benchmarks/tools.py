@@ -0,0 +1,243 @@
+"""
+Tool benchmark: drive synthetic event streams through every mode in MODES.
+
+    python benchmarks/tools.py [-m MODE ...] [-r REPEAT] [--json OUT] [--compare OLD]
+
+Each mode runs in a fresh interpreter on an offscreen Easel, with the RNG seeded so
+spray strokes are identical between runs. An op is one stroke, shape, click or
+text box; events are the mouse, key and timer events delivered to the canvas, each
+followed by a pass of the event loop so repaints are included. Reports events/s,
+ms/op, peak Python heap (tracemalloc) and the process's peak RSS.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEED = 1234
+
+STROKE_POINTS = 200
+POLY_POINTS = 12
+TEXT_CHARS = 400
+TIMER_EVERY = 10
+
+
+def stroke_path(n, i):
+    """
+    A deterministic wobbly path across the canvas, different for every op i.
+    """
+    for k in range(n):
+        t = k / n
+        yield (int(40 + 520 * t + 30 * math.sin(7 * t + i)),
+               int(60 + 360 * (0.5 + 0.45 * math.sin(3 * t + i * 0.7))))
+
+
+class Driver:
+
+    def __init__(self, app, canvas, paint=True):
+        from PyQt5.QtCore import Qt, QEvent, QPointF
+        from PyQt5.QtGui import QKeyEvent, QMouseEvent
+
+        self.app, self.canvas, self.paint = app, canvas, paint
+        self.Qt, self.QEvent, self.QPointF = Qt, QEvent, QPointF
+        self.QKeyEvent, self.QMouseEvent = QKeyEvent, QMouseEvent
+        self.events = 0
+
+    def pump(self):
+        self.events += 1
+        if self.paint:
+            self.app.processEvents()
+
+    def mouse(self, kind, x, y, button=None, buttons=None):
+        Qt, QEvent = self.Qt, self.QEvent
+        event_type, handler = {
+            'press': (QEvent.MouseButtonPress, self.canvas.mousePressEvent),
+            'move': (QEvent.MouseMove, self.canvas.mouseMoveEvent),
+            'release': (QEvent.MouseButtonRelease, self.canvas.mouseReleaseEvent),
+            'double': (QEvent.MouseButtonDblClick, self.canvas.mouseDoubleClickEvent),
+        }[kind]
+        if button is None:
+            button = Qt.NoButton if kind == 'move' else Qt.LeftButton
+        if buttons is None:
+            buttons = Qt.NoButton if kind == 'release' else Qt.LeftButton
+        handler(self.QMouseEvent(event_type, self.QPointF(x, y), button, buttons, Qt.NoModifier))
+        self.pump()
+
+    def key(self, key, text=''):
+        self.canvas.keyPressEvent(self.QKeyEvent(self.QEvent.KeyPress, key, self.Qt.NoModifier, text))
+        self.pump()
+
+    def tick(self):
+        self.canvas.on_timer()
+        self.pump()
+
+    def click(self, x, y):
+        self.mouse('press', x, y)
+        self.mouse('release', x, y)
+
+    def stroke(self, i):
+        points = list(stroke_path(STROKE_POINTS, i))
+        self.mouse('press', *points[0])
+        for k, (x, y) in enumerate(points[1:], 1):
+            self.mouse('move', x, y)
+            if k % TIMER_EVERY == 0:
+                self.tick()
+        self.mouse('release', *points[-1])
+
+    def poly(self, i):
+        points = list(stroke_path(POLY_POINTS, i))
+        for k, (x, y) in enumerate(points):
+            self.mouse('move', x, y, buttons=self.Qt.NoButton)
+            self.tick()
+            if k == len(points) - 1:
+                self.mouse('double', x, y)
+            else:
+                self.click(x, y)
+
+    def points(self, i):
+        x, y = next(stroke_path(1, i))
+        self.click(x, y)
+
+    def text(self, i):
+        Qt = self.Qt
+        self.click(40 + i % 20, 40 + i % 20)
+        for k in range(TEXT_CHARS):
+            if k % 40 == 39:
+                self.key(Qt.Key_Return, '\r')
+            else:
+                self.key(0, 'lorem ipsum dolor sit amet '[k % 27])
+            if k % TIMER_EVERY == 0:
+                self.tick()
+        self.click(630, 470)
+
+
+SCENARIOS = {
+    'selectpoly': 'poly', 'polyline': 'poly', 'polygon': 'poly',
+    'fill': 'points', 'dropper': 'points', 'wand': 'points',
+    'text': 'text',
+}
+
+OPS = {'stroke': 20, 'poly': 20, 'points': 20, 'text': 3}
+
+
+def child(mode, repeat, paint):
+    sys.path.insert(0, ROOT)
+    import random
+
+    from PyQt5.QtWidgets import QApplication
+    import PyPaint
+
+    app = QApplication(sys.argv[:1])
+    canvas = PyPaint.Easel()
+    canvas.set_secondary_color('#ffffff')
+    canvas.initialize()
+    canvas.setMouseTracking(True)
+    canvas.show()
+    app.processEvents()
+
+    canvas.set_mode(mode)
+    driver = Driver(app, canvas, paint)
+    scenario = getattr(driver, SCENARIOS.get(mode, 'stroke'))
+    ops = OPS[SCENARIOS.get(mode, 'stroke')] * repeat
+
+    # Warm up caches (fonts, stamps, numpy) outside the measurement.
+    random.seed(SEED)
+    scenario(0)
+    canvas.initialize()
+    canvas.set_mode(mode)
+    driver.events = 0
+
+    random.seed(SEED)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(ops):
+        scenario(i)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(json.dumps({
+        'ops': ops,
+        'events': driver.events,
+        'seconds': round(elapsed, 4),
+        'events_per_s': round(driver.events / elapsed, 1),
+        'ms_per_op': round(elapsed / ops * 1000, 3),
+        'peak_python_kb': peak // 1024,
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }))
+
+
+def compare(results, old):
+    print()
+    print("%-12s %12s %12s %8s" % ('mode', 'old ms/op', 'new ms/op', 'change'))
+    for mode, r in results.items():
+        o = old.get('results', {}).get(mode)
+        if not o:
+            continue
+        change = (r['ms_per_op'] - o['ms_per_op']) / o['ms_per_op'] * 100
+        print("%-12s %12.3f %12.3f %+7.1f%%" % (mode, o['ms_per_op'], r['ms_per_op'], change))
+
+
+def revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, universal_newlines=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main(argv=None):
+    sys.path.insert(0, ROOT)
+    from PyPaint import MODES
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-m', '--mode', action='append', choices=MODES, help="benchmark only these modes")
+    parser.add_argument('-r', '--repeat', type=int, default=1, help="multiply the number of ops per mode")
+    parser.add_argument('--no-paint', action='store_true', help="do not run the event loop between events")
+    parser.add_argument('--json', help="write the results to this file")
+    parser.add_argument('--compare', help="compare with results from an earlier --json run")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    print("%-12s %6s %8s %12s %10s %12s %10s" % ('mode', 'ops', 'events', 'events/s', 'ms/op', 'py peak kB', 'rss kB'))
+    results = {}
+    for mode in args.mode or MODES:
+        cmd = [sys.executable, __file__, '--child', mode, str(args.repeat), '0' if args.no_paint else '1']
+        out = subprocess.run(cmd, env=env, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             universal_newlines=True)
+        r = results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+        print("%-12s %6d %8d %12.1f %10.3f %12d %10d" % (
+            mode, r['ops'], r['events'], r['events_per_s'], r['ms_per_op'], r['peak_python_kb'], r['max_rss_kb']))
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+    if args.json:
+        from PyQt5.QtCore import QT_VERSION_STR
+        with open(args.json, 'w') as f:
+            json.dump({
+                'revision': revision(),
+                'python': platform.python_version(),
+                'qt': QT_VERSION_STR,
+                'platform': env['QT_QPA_PLATFORM'],
+                'paint': not args.no_paint,
+                'results': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], int(sys.argv[3]), sys.argv[4] == '1')
+    else:
+        main()
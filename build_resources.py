@@ -0,0 +1,60 @@
+"""
+Compile resources_rc.qrc into the binary resources.rcc bundle registered by resources.py.
+
+    python build_resources.py
+
+pyrcc5 can only emit Python, so the resource tree, names and data it generates
+are wrapped in a version 2 .rcc header, which QResource.registerResource reads.
+"""
+import ast
+import os
+import struct
+import sys
+import tempfile
+
+from PyQt5.pyrcc_main import processResourceFile
+
+from resources import RESOURCE_FILE
+
+QRC_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources_rc.qrc')
+
+RCC_VERSION = 2
+HEADER_SIZE = 20
+
+
+def compile_arrays(qrc):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'resources_rc.py')
+        if not processResourceFile([qrc], path, False):
+            raise SystemExit("pyrcc5 failed to compile %s" % qrc)
+
+        with open(path) as f:
+            tree = ast.parse(f.read())
+
+    return {
+        node.targets[0].id: node.value.value
+        for node in tree.body
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, bytes)
+    }
+
+
+def build(qrc=QRC_FILE, out=RESOURCE_FILE):
+    arrays = compile_arrays(qrc)
+    data, names, tree = arrays['qt_resource_data'], arrays['qt_resource_name'], arrays['qt_resource_struct_v2']
+
+    data_offset = HEADER_SIZE
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+
+    with open(out, 'wb') as f:
+        f.write(b'qres' + struct.pack('>IIII', RCC_VERSION, tree_offset, data_offset, names_offset))
+        f.write(data)
+        f.write(names)
+        f.write(tree)
+
+    return out
+
+
+if __name__ == '__main__':
+    print(build(*sys.argv[1:]))
@@ -0,0 +1,156 @@
+import csv
+import time
+from collections import defaultdict, deque
+
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor, QFont
+
+import numpy as np
+
+WINDOW = 1000
+
+# Event timestamps are milliseconds on the monotonic clock for real input; synthetic
+# events carry other values, so anything older than this is ignored and the time
+# the handler was entered is used instead.
+MAX_EVENT_AGE_MS = 5000
+
+REFRESH_INTERVAL = 0.5
+
+OVERLAY_RECT = QRect(6, 6, 350, 78)
+OVERLAY_BACKGROUND = QColor(0, 0, 0, 170)
+OVERLAY_FONT = QFont('Monospace', 8)
+OVERLAY_FONT.setStyleHint(QFont.TypeWriter)
+
+LOG_FIELDS = ['time', 'handler', 'latency_ms', 'handler_ms', 'paint_ms', 'region_px']
+
+
+def percentiles(values, q=(50, 95, 99)):
+    if not values:
+        return [0.0] * len(q)
+    return np.percentile(np.fromiter(values, float, len(values)), q)
+
+
+def region_area(region):
+    return sum(r.width() * r.height() for r in region.rects())
+
+
+class Diagnostics:
+    """
+    Measures the time from an input event to the end of the paint that shows its
+    result, along with handler and paint times and repainted area, over a rolling
+    window. Optionally writes one CSV row per input event to a log file, followed on
+    close by the summary: a row per handler and percentile, with 'p50', 'p95' or
+    'p99' in the time column.
+    """
+
+    def __init__(self, log=None):
+        self.latency = deque(maxlen=WINDOW)
+        self.handler_ms = deque(maxlen=WINDOW)
+        self.paint_ms = deque(maxlen=WINDOW)
+        self.areas = deque(maxlen=WINDOW)
+        self.paints = deque()
+        self.by_handler = defaultdict(lambda: deque(maxlen=WINDOW))
+
+        self.pending = []
+        self.rect = OVERLAY_RECT
+        self.last_refresh = 0
+
+        self.log_file = open(log, 'w', newline='') if log else None
+        self.log = csv.writer(self.log_file) if log else None
+        if self.log:
+            self.log.writerow(LOG_FIELDS)
+
+    def event_time(self, event):
+        now = time.perf_counter()
+        timestamp = event.timestamp()
+        if timestamp:
+            age = (int(time.monotonic() * 1000) - timestamp) % (1 << 32)
+            if age < MAX_EVENT_AGE_MS:
+                return now - age / 1000
+        return now
+
+    def handle(self, fn, event):
+        """
+        Call an event handler, timing it and queueing the event until the next paint.
+        """
+        start = self.event_time(event)
+        t = time.perf_counter()
+        fn(event)
+        handler_ms = (time.perf_counter() - t) * 1000
+
+        self.handler_ms.append(handler_ms)
+        self.pending.append((fn.__name__, start, handler_ms))
+
+    def paint_started(self):
+        return time.perf_counter()
+
+    def paint_finished(self, start, event):
+        now = time.perf_counter()
+        region = event.region()
+        if not self.pending and self.rect.contains(region.boundingRect()):
+            return  # Only the overlay itself was refreshed.
+
+        paint_ms = (now - start) * 1000
+        area = region_area(region)
+        self.paint_ms.append(paint_ms)
+        self.areas.append(area)
+        self.paints.append(now)
+        while self.paints[0] < now - 1:
+            self.paints.popleft()
+
+        for name, t, handler_ms in self.pending:
+            latency = (now - t) * 1000
+            self.latency.append(latency)
+            self.by_handler[name].append(latency)
+            if self.log:
+                self.log.writerow([round(now, 4), name, round(latency, 3), round(handler_ms, 3),
+                                   round(paint_ms, 3), area])
+        self.pending = []
+
+    def refresh_due(self):
+        now = time.perf_counter()
+        if now - self.last_refresh < REFRESH_INTERVAL:
+            return False
+        self.last_refresh = now
+        return True
+
+    def paints_per_second(self):
+        now = time.perf_counter()
+        return sum(1 for t in self.paints if t >= now - 1)
+
+    def lines(self):
+        lat = percentiles(self.latency)
+        handler = percentiles(self.handler_ms, (50, 95))
+        paint = percentiles(self.paint_ms, (50, 95))
+        area = np.mean(self.areas) if self.areas else 0
+        return [
+            "latency p50 %6.1f  p95 %6.1f  p99 %6.1f ms" % tuple(lat),
+            "handler p50 %6.2f  p95 %6.2f ms" % tuple(handler),
+            "paint   p50 %6.2f  p95 %6.2f ms  %3d paints/s" % (paint[0], paint[1], self.paints_per_second()),
+            "region  %9d px avg  %9d px last" % (area, self.areas[-1] if self.areas else 0),
+        ]
+
+    def draw(self, p, rect):
+        if not rect.intersects(self.rect):
+            return
+
+        p.save()
+        p.fillRect(self.rect, OVERLAY_BACKGROUND)
+        p.setPen(Qt.white)
+        p.setFont(OVERLAY_FONT)
+        p.drawText(self.rect.adjusted(6, 4, -6, -4), Qt.AlignLeft | Qt.AlignTop, "\n".join(self.lines()))
+        p.restore()
+
+    def summary(self):
+        """
+        Latency percentiles per handler, e.g. {'pen_mouseMoveEvent': [p50, p95, p99]}.
+        """
+        return {name: [round(float(v), 3) for v in percentiles(values)] for name, values in self.by_handler.items()}
+
+    def close(self):
+        if self.log_file:
+            for name, values in self.summary().items():
+                for q, latency in zip(('p50', 'p95', 'p99'), values):
+                    self.log.writerow([q, name, latency, '', '', ''])
+            self.log_file.close()
+            self.log_file = self.log = None
@@ -0,0 +1,239 @@
+"""
+Image export in several formats with per-format options, and the export dialog.
+
+Encoding only touches QImage, which is safe off the GUI thread, so both the final
+save and the size estimates shown in the dialog run on worker threads.
+"""
+import io
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice, pyqtSignal
+from PyQt5.QtGui import QImage, QImageWriter, QPainter
+from PyQt5.QtWidgets import QCheckBox, QDialog, QDialogButtonBox, QFormLayout, QLabel, QSlider, \
+    QSpinBox
+
+from pngwriter import write_png
+
+# name -> (Qt format, extensions, options the format takes)
+FORMATS = {
+    'PNG': (b'png', ['png'], ['compression', 'palette']),
+    'JPEG': (b'jpeg', ['jpg', 'jpeg'], ['quality']),
+    'WebP': (b'webp', ['webp'], ['quality']),
+    'TIFF': (b'tiff', ['tif', 'tiff'], ['lzw']),
+    'BMP': (b'bmp', ['bmp'], []),
+}
+
+OPAQUE_FORMATS = ['JPEG', 'BMP']
+
+DEFAULT_OPTIONS = {
+    'quality': 90,
+    'compression': 6,
+    'palette': False,
+    'lzw': True,
+}
+
+# Estimates encode a mosaic of full-resolution tiles from across the image,
+# PROXY_GRID x PROXY_GRID of them covering about PROXY_PIXELS in total.
+PROXY_PIXELS = 256 * 256
+PROXY_GRID = 4
+
+
+def file_filter():
+    return ';;'.join("%s image files (%s)" % (name, ' '.join('*.%s' % e for e in extensions))
+                     for name, (_, extensions, _) in FORMATS.items())
+
+
+def format_for_path(path, default='PNG'):
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    for name, (_, extensions, _) in FORMATS.items():
+        if ext in extensions:
+            return name
+    return default
+
+
+def prepare(image, name, options):
+    """
+    Convert the image to what will be written: flattened onto white for formats
+    without alpha, or reduced to a 256 color palette.
+    """
+    if name in OPAQUE_FORMATS and image.hasAlphaChannel():
+        flat = QImage(image.size(), QImage.Format_RGB32)
+        flat.fill(Qt.white)
+        p = QPainter(flat)
+        p.drawImage(0, 0, image)
+        p.end()
+        return flat
+
+    if name == 'PNG' and options.get('palette'):
+        return image.convertToFormat(QImage.Format_Indexed8, Qt.DiffuseDither | Qt.PreferDither)
+
+    return image
+
+
+def write(image, device, name, options):
+    fmt, _, supported = FORMATS[name]
+    writer = QImageWriter(device, fmt)
+    if 'quality' in supported:
+        writer.setQuality(options['quality'])
+    if 'lzw' in supported:
+        writer.setCompression(1 if options['lzw'] else 0)
+
+    if not writer.write(prepare(image, name, options)):
+        raise OSError(writer.errorString())
+
+
+def encode(image, name, options):
+    if name == 'PNG':
+        # The same writer as save, so estimates describe the file that gets written.
+        buffer = io.BytesIO()
+        write_png(prepare(image, name, options), buffer, options['compression'])
+        return buffer.getvalue()
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    write(image, buffer, name, options)
+    return bytes(data)
+
+
+def save(image, path, name, options):
+    """
+    Write the image to path. Raises OSError on failure.
+    """
+    if name == 'PNG':
+        # Deflated in parallel strips, much faster than Qt's writer on big canvases.
+        return write_png(prepare(image, name, options), path, options['compression'])
+
+    with open(path, 'wb') as f:
+        f.write(encode(image, name, options))
+    return path
+
+
+def proxy(image, pixels=PROXY_PIXELS, grid=PROXY_GRID):
+    """
+    A small stand-in for image with the same local detail: a mosaic of tiles cut at
+    full resolution from a grid across it. Returns the proxy and the scale from its
+    area to the image's, or the image itself if it is already small.
+    """
+    w, h = image.width(), image.height()
+    if w * h <= pixels:
+        return image, 1.0
+
+    tile = max(8, int(math.sqrt(pixels) / grid))
+    tw, th = min(tile, w // grid), min(tile, h // grid)
+    # QPainter cannot draw on Indexed8, so indexed images are put together in
+    # ARGB32 and converted back to their own color table.
+    indexed = image.format() == QImage.Format_Indexed8
+    out = QImage(tw * grid, th * grid, QImage.Format_ARGB32 if indexed else image.format())
+    p = QPainter(out)
+    p.setCompositionMode(QPainter.CompositionMode_Source)
+    for j in range(grid):
+        for i in range(grid):
+            x = (w - tw) * i // max(grid - 1, 1)
+            y = (h - th) * j // max(grid - 1, 1)
+            p.drawImage(i * tw, j * th, image, x, y, tw, th)
+    p.end()
+    if indexed:
+        out = out.convertToFormat(QImage.Format_Indexed8, image.colorTable())
+    return out, w * h / (out.width() * out.height())
+
+
+def estimate_size(image, name, options):
+    """
+    Estimated encoded size in bytes, from encoding a proxy of the image.
+    """
+    small, scale = proxy(image)
+    if scale == 1.0:
+        return len(encode(image, name, options))
+
+    # A single pixel image gives the fixed cost of the headers, which does not
+    # scale with the area.
+    blank = small.copy(0, 0, 1, 1)
+    blank.fill(0)
+    fixed = len(encode(blank, name, options))
+    size = len(encode(small, name, options))
+    return int(fixed + max(size - fixed, 0) * scale)
+
+
+def format_size(n):
+    for unit in ('bytes', 'kB', 'MB'):
+        if n < 1024 or unit == 'MB':
+            return ("%d %s" if unit == 'bytes' else "%.1f %s") % (n, unit)
+        n /= 1024
+
+
+class ExportDialog(QDialog):
+    """
+    Options for exporting the image in one format, with a live size estimate.
+    """
+    estimated = pyqtSignal(int, int)
+
+    def __init__(self, image, name, options=None, parent=None):
+        super(ExportDialog, self).__init__(parent)
+        self.setWindowTitle("Export %s" % name)
+        self.image, self.name = image, name
+        self.options = dict(DEFAULT_OPTIONS, **(options or {}))
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.request = 0
+
+        layout = QFormLayout(self)
+        supported = FORMATS[name][2]
+
+        if 'quality' in supported:
+            self.quality = QSlider(Qt.Horizontal)
+            self.quality.setRange(1, 100)
+            self.quality.setValue(self.options['quality'])
+            self.quality.valueChanged.connect(lambda v: self.set_option('quality', v))
+            layout.addRow("Quality", self.quality)
+
+        if 'compression' in supported:
+            self.compression = QSpinBox()
+            self.compression.setRange(0, 9)
+            self.compression.setValue(self.options['compression'])
+            self.compression.valueChanged.connect(lambda v: self.set_option('compression', v))
+            layout.addRow("Compression level", self.compression)
+
+        if 'palette' in supported:
+            self.palette_box = QCheckBox("Reduce to 256 colors")
+            self.palette_box.setChecked(self.options['palette'])
+            self.palette_box.toggled.connect(lambda v: self.set_option('palette', v))
+            layout.addRow(self.palette_box)
+
+        if 'lzw' in supported:
+            self.lzw = QCheckBox("LZW compression")
+            self.lzw.setChecked(self.options['lzw'])
+            self.lzw.toggled.connect(lambda v: self.set_option('lzw', v))
+            layout.addRow(self.lzw)
+
+        self.size_label = QLabel()
+        layout.addRow("Estimated size", self.size_label)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+        self.estimated.connect(self.show_estimate)
+        self.update_estimate()
+
+    def set_option(self, key, value):
+        self.options[key] = value
+        self.update_estimate()
+
+    def update_estimate(self):
+        self.request += 1
+        request = self.request
+        self.size_label.setText("estimating...")
+        future = self.executor.submit(estimate_size, self.image, self.name, dict(self.options))
+        # Runs on the worker thread; the signal is queued to the GUI thread.
+        future.add_done_callback(lambda f: self.estimated.emit(request, f.result() if not f.exception() else -1))
+
+    def show_estimate(self, request, size):
+        if request == self.request:
+            self.size_label.setText("about %s" % format_size(size) if size >= 0 else "unknown")
+
+    def done(self, result):
+        self.executor.shutdown(wait=False)
+        super(ExportDialog, self).done(result)
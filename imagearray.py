@@ -0,0 +1,45 @@
+from PyQt5.QtGui import QImage
+
+import numpy as np
+
+CHANNELS = {
+    QImage.Format_Grayscale8: 1,
+    QImage.Format_Alpha8: 1,
+    QImage.Format_Indexed8: 1,
+    QImage.Format_RGB32: 4,
+    QImage.Format_ARGB32: 4,
+    QImage.Format_ARGB32_Premultiplied: 4,
+}
+
+
+def image_array(image, writable=False):
+    """
+    Return a NumPy view (no copy) onto the pixels of an 8-bit or 32-bit QImage.
+
+    32-bit formats come back as (h, w, 4) in memory order, i.e. BGRA on little
+    endian machines. The view is only valid while the image is alive and unmodified
+    by Qt, so keep a reference to the image for as long as the array is used.
+    """
+    channels = CHANNELS[image.format()]
+    w, h = image.width(), image.height()
+    ptr = image.bits() if writable else image.constBits()
+    ptr.setsize(image.bytesPerLine() * h)
+    arr = np.frombuffer(ptr, np.uint8).reshape(h, image.bytesPerLine())
+    arr = arr[:, :w * channels]
+    if not writable:
+        arr.flags.writeable = False
+
+    if channels == 1:
+        return arr
+
+    return arr.reshape(h, w, channels)
+
+
+def array_image(arr, format=QImage.Format_Grayscale8):
+    """
+    Build a QImage owning a copy of a (h, w) uint8 or uint32 array, or a (h, w, 4) uint8 array.
+    """
+    arr = np.ascontiguousarray(arr)
+    h, w = arr.shape[:2]
+    bpl = arr.strides[0]
+    return QImage(arr.data, w, h, bpl, format).copy()
@@ -0,0 +1,114 @@
+"""
+Palette-indexed documents.
+
+An indexed document stores one byte per pixel: the index of its color in a palette
+of up to 256 colors. The indices live in a Grayscale8 QImage, which QPainter can
+draw on, so the tools write indices directly. They paint with the gray
+QColor(i, i, i), which lands in the buffer as exactly i as long as nothing is
+blended or antialiased. An Indexed8 QImage over the same bytes, with the palette
+as its color table, gives the colors for display and saving. Recoloring changes
+only the palette.
+"""
+from functools import lru_cache
+
+from PyQt5.QtGui import QColor, QImage
+
+import numpy as np
+
+from imagearray import array_image, image_array
+
+MAX_COLORS = 256
+
+# Colors are matched to the palette a chunk at a time, to bound the distance table.
+MATCH_CHUNK = 4096
+
+
+def ink(index):
+    """
+    The color that paints index into an index buffer.
+    """
+    return QColor(index, index, index)
+
+
+def argb_words(image):
+    """
+    The pixels of image as a (h, w) array of non-premultiplied QRgb values, and the
+    image the array views.
+    """
+    image = image.convertToFormat(QImage.Format_ARGB32)
+    return image_array(image).view(np.uint32)[..., 0], image
+
+
+def channels(colors):
+    colors = np.asarray(colors, np.uint32)
+    return np.stack([(colors >> shift) & 0xff for shift in (24, 16, 8, 0)], axis=-1).astype(np.int32)
+
+
+def nearest_indices(colors, palette):
+    """
+    For each QRgb in colors, the index of the nearest palette color by squared
+    distance over A, R, G and B.
+    """
+    target = channels(palette)
+    out = np.empty(len(colors), np.uint8)
+    for i in range(0, len(colors), MATCH_CHUNK):
+        source = channels(colors[i:i + MATCH_CHUNK])
+        distance = ((source[:, None, :] - target[None]) ** 2).sum(axis=2)
+        out[i:i + MATCH_CHUNK] = distance.argmin(axis=1)
+    return out
+
+
+def image_palette(image, fallback):
+    """
+    The colors of image if it has no more than MAX_COLORS of them, else fallback.
+    """
+    words, _ = argb_words(image)
+    colors = np.unique(words)
+    return tuple(int(c) for c in colors) if len(colors) <= MAX_COLORS else tuple(fallback)
+
+
+def to_indices(image, palette):
+    """
+    A Grayscale8 image holding, for each pixel of image, the index of the nearest
+    palette color. Each distinct color is matched once.
+    """
+    words, _ = argb_words(image)
+    colors, inverse = np.unique(words, return_inverse=True)
+    return array_image(nearest_indices(colors, palette)[inverse].reshape(words.shape))
+
+
+def ink_image(image, palette):
+    """
+    An ARGB32 copy of image in the inks of the nearest palette colors, transparent
+    where image is mostly transparent, for drawing onto an index buffer.
+    """
+    words, _ = argb_words(image)
+    colors, inverse = np.unique(words, return_inverse=True)
+    inks = nearest_indices(colors, palette).astype(np.uint32) * 0x010101 | 0xff000000
+    inks[colors >> 24 < 128] = 0
+    return array_image(inks[inverse].reshape(words.shape), QImage.Format_ARGB32)
+
+
+@lru_cache(maxsize=16)
+def color_table(palette):
+    """
+    The palette padded to 256 entries. Index i past the palette shows the inverse of
+    entry 255 - i, so the XOR rubber bands the shape tools draw on the indices look
+    as they do in color, for palettes of up to 128 colors.
+    """
+    table = list(palette)
+    for i in range(len(table), MAX_COLORS):
+        j = MAX_COLORS - 1 - i
+        table.append(palette[j] ^ 0xffffff if j < len(palette) else 0xff000000)
+    return table
+
+
+def color_view(indices, palette):
+    """
+    An Indexed8 image of the index buffer in the palette's colors. It shares the
+    buffer, so it only lives as long as indices and shows later changes to it.
+    """
+    view = QImage(indices.constBits(), indices.width(), indices.height(), indices.bytesPerLine(),
+                  QImage.Format_Indexed8)
+    view.setColorTable(color_table(palette))
+    return view
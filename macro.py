@@ -0,0 +1,178 @@
+"""
+Record Easel actions to a macro file and replay them onto a canvas.
+
+    QT_QPA_PLATFORM=offscreen python macro.py session.macro [-o result.png] [-n RUNS]
+
+A macro is gzipped JSON lines: a header object followed by one short array per
+event, e.g. ["p", x, y, button, buttons, modifiers] for a mouse press. Replay calls
+the canvas handlers directly instead of posting events, with widget updates
+disabled, so it runs as fast as the tools can draw and repaints once at the end.
+"""
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+
+from PyQt5.QtCore import Qt, QEvent, QPointF
+from PyQt5.QtGui import QFont, QKeyEvent, QMouseEvent
+
+VERSION = 1
+
+MOUSE_EVENTS = {
+    'p': (QEvent.MouseButtonPress, 'mousePressEvent'),
+    'm': (QEvent.MouseMove, 'mouseMoveEvent'),
+    'r': (QEvent.MouseButtonRelease, 'mouseReleaseEvent'),
+    'd': (QEvent.MouseButtonDblClick, 'mouseDoubleClickEvent'),
+}
+MOUSE_CODES = {event_type: code for code, (event_type, _) in MOUSE_EVENTS.items()}
+
+# Menu actions that can be replayed; file dialogs are left out on purpose.
+ACTIONS = [
+    'actionNewImage', 'actionClearImage', 'actionInvertColors', 'actionFlipHorizontal', 'actionFlipVertical',
+    'actionCut', 'actionCopy', 'actionPaste', 'actionSelectAll', 'actionDeselect', 'actionInvertSelection',
+    'actionIndexedColors',
+]
+
+
+def encode_value(value):
+    if isinstance(value, QFont):
+        return {'font': value.family()}
+    return value
+
+
+def decode_value(value):
+    if isinstance(value, dict) and 'font' in value:
+        return QFont(value['font'])
+    return value
+
+
+class Recorder:
+    """
+    Writes events to a macro file as they happen. The canvas calls write() from its
+    handlers while it has a recorder attached.
+    """
+
+    def __init__(self, path, canvas):
+        self.file = gzip.open(path, 'wt', encoding='utf-8')
+        self.seed = random.randrange(1 << 32)
+        random.seed(self.seed)
+
+        self.file.write(json.dumps({
+            'version': VERSION,
+            'seed': self.seed,
+            'mode': canvas.mode,
+            'primary': canvas.primary_color.name(),
+            'secondary': canvas.secondary_color.name(),
+            'config': {k: encode_value(v) for k, v in canvas.config.items()},
+        }) + '\n')
+
+    def write(self, *event):
+        self.file.write(json.dumps(event, separators=(',', ':')) + '\n')
+
+    def mouse(self, event):
+        self.write(MOUSE_CODES[event.type()], event.x(), event.y(),
+                   int(event.button()), int(event.buttons()), int(event.modifiers()))
+
+    def close(self):
+        self.file.close()
+
+
+def read_macro(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if header.get('version') != VERSION:
+            raise ValueError("unsupported macro version %r" % header.get('version'))
+        return header, [json.loads(line) for line in f]
+
+
+def replay(path, canvas, actions=None):
+    """
+    Replay a macro onto canvas. actions maps recorded action names to callables
+    (normally the window's QAction.trigger); other actions are skipped.
+
+    Returns the number of events replayed.
+    """
+    header, events = read_macro(path)
+    actions = actions or {}
+
+    canvas.set_primary_color(header['primary'])
+    canvas.set_secondary_color(header['secondary'])
+    for key, value in header['config'].items():
+        canvas.set_config(key, decode_value(value))
+    canvas.set_mode(header['mode'])
+    random.seed(header['seed'])
+
+    canvas.setUpdatesEnabled(False)
+    try:
+        for event in events:
+            code = event[0]
+
+            if code in MOUSE_EVENTS:
+                event_type, handler = MOUSE_EVENTS[code]
+                x, y, button, buttons, modifiers = event[1:]
+                getattr(canvas, handler)(QMouseEvent(event_type, QPointF(x, y), Qt.MouseButton(button),
+                                                     Qt.MouseButtons(buttons), Qt.KeyboardModifiers(modifiers)))
+
+            elif code == 'k':
+                key, modifiers, text = event[1:]
+                canvas.keyPressEvent(QKeyEvent(QEvent.KeyPress, key, Qt.KeyboardModifiers(modifiers), text))
+
+            elif code == 't':
+                canvas.on_timer()
+
+            elif code == 'mode':
+                canvas.set_mode(event[1])
+
+            elif code == 'config':
+                canvas.set_config(event[1], decode_value(event[2]))
+
+            elif code == 'primary':
+                canvas.set_primary_color(event[1])
+
+            elif code == 'secondary':
+                canvas.set_secondary_color(event[1])
+
+            elif code == 'action' and event[1] in actions:
+                actions[event[1]]()
+
+    finally:
+        canvas.setUpdatesEnabled(True)
+        canvas.update()
+
+    return len(events)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('macro')
+    parser.add_argument('-o', '--output', help="save the resulting image")
+    parser.add_argument('-n', '--runs', type=int, default=1, help="replay this many times and report the best")
+    args = parser.parse_args(argv)
+
+    from PyQt5.QtWidgets import QApplication
+    import PyPaint
+
+    app = QApplication(sys.argv[:1])
+    window = PyPaint.MainWindow()
+    actions = {name: getattr(window, name).trigger for name in ACTIONS}
+
+    best = None
+    for _ in range(args.runs):
+        window.canvas.initialize()
+        start = time.perf_counter()
+        n = replay(args.macro, window.canvas, actions)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    print("%d events in %.1f ms (%.0f events/s)" % (n, best * 1000, n / best if best else 0))
+
+    if args.output:
+        window.canvas.flattened().save(args.output)
+    window.close()
+    del app
+
+
+if __name__ == '__main__':
+    main()
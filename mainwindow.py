@@ -2,7 +2,7 @@
 
 # Form implementation generated from reading ui file 'mainwindow.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.1
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -200,6 +200,42 @@ class Ui_MainWindow(object):
         self.rectButton.setCheckable(True)
         self.rectButton.setObjectName("rectButton")
         self.gridLayout.addWidget(self.rectButton, 6, 0, 1, 1)
+        self.selectpolyButton = QtWidgets.QPushButton(self.widget)
+        self.selectpolyButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.selectpolyButton.setMaximumSize(QtCore.QSize(30, 30))
+        self.selectpolyButton.setText("")
+        icon12 = QtGui.QIcon()
+        icon12.addPixmap(QtGui.QPixmap(":/icons/selection-poly.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.selectpolyButton.setIcon(icon12)
+        self.selectpolyButton.setCheckable(True)
+        self.selectpolyButton.setObjectName("selectpolyButton")
+        self.gridLayout.addWidget(self.selectpolyButton, 1, 0, 1, 1)
+        self.selectrectButton = QtWidgets.QPushButton(self.widget)
+        self.selectrectButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.selectrectButton.setMaximumSize(QtCore.QSize(30, 30))
+        self.selectrectButton.setText("")
+        icon13 = QtGui.QIcon()
+        icon13.addPixmap(QtGui.QPixmap(":/icons/selection.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.selectrectButton.setIcon(icon13)
+        self.selectrectButton.setCheckable(True)
+        self.selectrectButton.setObjectName("selectrectButton")
+        self.gridLayout.addWidget(self.selectrectButton, 1, 1, 1, 1)
+        self.wandButton = QtWidgets.QPushButton(self.widget)
+        self.wandButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.wandButton.setMaximumSize(QtCore.QSize(30, 30))
+        self.wandButton.setText("")
+        icon14 = QtGui.QIcon()
+        icon14.addPixmap(QtGui.QPixmap(":/icons/magic-wand.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.wandButton.setIcon(icon14)
+        self.wandButton.setCheckable(True)
+        self.wandButton.setObjectName("wandButton")
+        self.gridLayout.addWidget(self.wandButton, 4, 0, 1, 1)
+        self.vectorButton = QtWidgets.QPushButton(self.widget)
+        self.vectorButton.setMinimumSize(QtCore.QSize(30, 30))
+        self.vectorButton.setMaximumSize(QtCore.QSize(30, 30))
+        self.vectorButton.setCheckable(True)
+        self.vectorButton.setObjectName("vectorButton")
+        self.gridLayout.addWidget(self.vectorButton, 4, 1, 1, 1)
         self.verticalLayout_2.addWidget(self.widget)
         spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout_2.addItem(spacerItem)
@@ -574,20 +610,24 @@ class Ui_MainWindow(object):
         self.menuEdit.setObjectName("menuEdit")
         self.menuImage = QtWidgets.QMenu(self.menuBar)
         self.menuImage.setObjectName("menuImage")
+        self.menuMacro = QtWidgets.QMenu(self.menuBar)
+        self.menuMacro.setObjectName("menuMacro")
+        self.menuView = QtWidgets.QMenu(self.menuBar)
+        self.menuView.setObjectName("menuView")
         MainWindow.setMenuBar(self.menuBar)
         self.actionCopy = QtWidgets.QAction(MainWindow)
         self.actionCopy.setObjectName("actionCopy")
         self.actionClearImage = QtWidgets.QAction(MainWindow)
         self.actionClearImage.setObjectName("actionClearImage")
         self.actionOpenImage = QtWidgets.QAction(MainWindow)
-        icon12 = QtGui.QIcon()
-        icon12.addPixmap(QtGui.QPixmap(":/icons/blue-folder-open-image.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionOpenImage.setIcon(icon12)
+        icon15 = QtGui.QIcon()
+        icon15.addPixmap(QtGui.QPixmap(":/icons/blue-folder-open-image.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionOpenImage.setIcon(icon15)
         self.actionOpenImage.setObjectName("actionOpenImage")
         self.actionSaveImage = QtWidgets.QAction(MainWindow)
-        icon13 = QtGui.QIcon()
-        icon13.addPixmap(QtGui.QPixmap(":/icons/disk.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionSaveImage.setIcon(icon13)
+        icon16 = QtGui.QIcon()
+        icon16.addPixmap(QtGui.QPixmap(":/icons/disk.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionSaveImage.setIcon(icon16)
         self.actionSaveImage.setObjectName("actionSaveImage")
         self.actionInvertColors = QtWidgets.QAction(MainWindow)
         self.actionInvertColors.setObjectName("actionInvertColors")
@@ -596,47 +636,106 @@ class Ui_MainWindow(object):
         self.actionFlipVertical = QtWidgets.QAction(MainWindow)
         self.actionFlipVertical.setObjectName("actionFlipVertical")
         self.actionNewImage = QtWidgets.QAction(MainWindow)
-        icon14 = QtGui.QIcon()
-        icon14.addPixmap(QtGui.QPixmap(":/icons/document-image.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionNewImage.setIcon(icon14)
+        icon17 = QtGui.QIcon()
+        icon17.addPixmap(QtGui.QPixmap(":/icons/document-image.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionNewImage.setIcon(icon17)
         self.actionNewImage.setObjectName("actionNewImage")
         self.actionBold = QtWidgets.QAction(MainWindow)
         self.actionBold.setCheckable(True)
-        icon15 = QtGui.QIcon()
-        icon15.addPixmap(QtGui.QPixmap(":/icons/edit-bold.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionBold.setIcon(icon15)
+        icon18 = QtGui.QIcon()
+        icon18.addPixmap(QtGui.QPixmap(":/icons/edit-bold.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionBold.setIcon(icon18)
         self.actionBold.setObjectName("actionBold")
         self.actionItalic = QtWidgets.QAction(MainWindow)
         self.actionItalic.setCheckable(True)
-        icon16 = QtGui.QIcon()
-        icon16.addPixmap(QtGui.QPixmap(":/icons/edit-italic.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionItalic.setIcon(icon16)
+        icon19 = QtGui.QIcon()
+        icon19.addPixmap(QtGui.QPixmap(":/icons/edit-italic.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionItalic.setIcon(icon19)
         self.actionItalic.setObjectName("actionItalic")
         self.actionUnderline = QtWidgets.QAction(MainWindow)
         self.actionUnderline.setCheckable(True)
-        icon17 = QtGui.QIcon()
-        icon17.addPixmap(QtGui.QPixmap(":/icons/edit-underline.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionUnderline.setIcon(icon17)
+        icon20 = QtGui.QIcon()
+        icon20.addPixmap(QtGui.QPixmap(":/icons/edit-underline.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionUnderline.setIcon(icon20)
         self.actionUnderline.setObjectName("actionUnderline")
         self.actionFillShapes = QtWidgets.QAction(MainWindow)
         self.actionFillShapes.setCheckable(True)
-        icon18 = QtGui.QIcon()
-        icon18.addPixmap(QtGui.QPixmap(":/icons/paint-can-color.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionFillShapes.setIcon(icon18)
+        icon21 = QtGui.QIcon()
+        icon21.addPixmap(QtGui.QPixmap(":/icons/paint-can-color.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionFillShapes.setIcon(icon21)
         self.actionFillShapes.setObjectName("actionFillShapes")
+        self.actionSelectAll = QtWidgets.QAction(MainWindow)
+        self.actionSelectAll.setObjectName("actionSelectAll")
+        self.actionDeselect = QtWidgets.QAction(MainWindow)
+        self.actionDeselect.setObjectName("actionDeselect")
+        self.actionInvertSelection = QtWidgets.QAction(MainWindow)
+        self.actionInvertSelection.setObjectName("actionInvertSelection")
+        self.actionCut = QtWidgets.QAction(MainWindow)
+        self.actionCut.setObjectName("actionCut")
+        self.actionPaste = QtWidgets.QAction(MainWindow)
+        self.actionPaste.setObjectName("actionPaste")
+        self.actionRecordMacro = QtWidgets.QAction(MainWindow)
+        self.actionRecordMacro.setCheckable(True)
+        self.actionRecordMacro.setObjectName("actionRecordMacro")
+        self.actionPlayMacro = QtWidgets.QAction(MainWindow)
+        self.actionPlayMacro.setObjectName("actionPlayMacro")
+        self.actionDiagnostics = QtWidgets.QAction(MainWindow)
+        self.actionDiagnostics.setCheckable(True)
+        self.actionDiagnostics.setObjectName("actionDiagnostics")
+        self.actionProfileTool = QtWidgets.QAction(MainWindow)
+        self.actionProfileTool.setCheckable(True)
+        self.actionProfileTool.setObjectName("actionProfileTool")
+        self.actionSmoothStrokes = QtWidgets.QAction(MainWindow)
+        self.actionSmoothStrokes.setCheckable(True)
+        self.actionSmoothStrokes.setObjectName("actionSmoothStrokes")
+        self.actionVectorShapes = QtWidgets.QAction(MainWindow)
+        self.actionVectorShapes.setCheckable(True)
+        self.actionVectorShapes.setObjectName("actionVectorShapes")
+        self.actionImportSvg = QtWidgets.QAction(MainWindow)
+        self.actionImportSvg.setObjectName("actionImportSvg")
+        self.actionExportSvg = QtWidgets.QAction(MainWindow)
+        self.actionExportSvg.setObjectName("actionExportSvg")
+        self.actionRecordTimelapse = QtWidgets.QAction(MainWindow)
+        self.actionRecordTimelapse.setCheckable(True)
+        self.actionRecordTimelapse.setObjectName("actionRecordTimelapse")
+        self.actionIndexedColors = QtWidgets.QAction(MainWindow)
+        self.actionIndexedColors.setCheckable(True)
+        self.actionIndexedColors.setObjectName("actionIndexedColors")
+        self.actionReduceColors = QtWidgets.QAction(MainWindow)
+        self.actionReduceColors.setObjectName("actionReduceColors")
         self.menuFIle.addAction(self.actionNewImage)
         self.menuFIle.addAction(self.actionOpenImage)
         self.menuFIle.addAction(self.actionSaveImage)
+        self.menuFIle.addSeparator()
+        self.menuFIle.addAction(self.actionImportSvg)
+        self.menuFIle.addAction(self.actionExportSvg)
+        self.menuEdit.addAction(self.actionCut)
         self.menuEdit.addAction(self.actionCopy)
+        self.menuEdit.addAction(self.actionPaste)
         self.menuEdit.addSeparator()
         self.menuEdit.addAction(self.actionClearImage)
+        self.menuEdit.addSeparator()
+        self.menuEdit.addAction(self.actionSelectAll)
+        self.menuEdit.addAction(self.actionDeselect)
+        self.menuEdit.addAction(self.actionInvertSelection)
         self.menuImage.addAction(self.actionInvertColors)
         self.menuImage.addSeparator()
         self.menuImage.addAction(self.actionFlipHorizontal)
         self.menuImage.addAction(self.actionFlipVertical)
+        self.menuImage.addSeparator()
+        self.menuImage.addAction(self.actionReduceColors)
+        self.menuImage.addAction(self.actionIndexedColors)
+        self.menuMacro.addAction(self.actionRecordMacro)
+        self.menuMacro.addAction(self.actionPlayMacro)
+        self.menuMacro.addSeparator()
+        self.menuMacro.addAction(self.actionRecordTimelapse)
+        self.menuView.addAction(self.actionDiagnostics)
+        self.menuView.addAction(self.actionProfileTool)
         self.menuBar.addAction(self.menuFIle.menuAction())
         self.menuBar.addAction(self.menuEdit.menuAction())
         self.menuBar.addAction(self.menuImage.menuAction())
+        self.menuBar.addAction(self.menuView.menuAction())
+        self.menuBar.addAction(self.menuMacro.menuAction())
 
         self.retranslateUi(MainWindow)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
@@ -644,11 +743,15 @@ class Ui_MainWindow(object):
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "PyPaint"))
+        self.vectorButton.setToolTip(_translate("MainWindow", "Select, move and restyle vector shapes"))
+        self.vectorButton.setText(_translate("MainWindow", "↖"))
         self.drawingToolbar.setWindowTitle(_translate("MainWindow", "toolBar"))
         self.fontToolbar.setWindowTitle(_translate("MainWindow", "toolBar"))
         self.menuFIle.setTitle(_translate("MainWindow", "FIle"))
         self.menuEdit.setTitle(_translate("MainWindow", "Edit"))
         self.menuImage.setTitle(_translate("MainWindow", "Image"))
+        self.menuMacro.setTitle(_translate("MainWindow", "Macro"))
+        self.menuView.setTitle(_translate("MainWindow", "View"))
         self.actionCopy.setText(_translate("MainWindow", "Copy"))
         self.actionCopy.setShortcut(_translate("MainWindow", "Ctrl+C"))
         self.actionClearImage.setText(_translate("MainWindow", "Clear Image"))
@@ -667,4 +770,31 @@ class Ui_MainWindow(object):
         self.actionItalic.setShortcut(_translate("MainWindow", "Ctrl+I"))
         self.actionUnderline.setText(_translate("MainWindow", "Underline"))
         self.actionFillShapes.setText(_translate("MainWindow", "Fill Shapes?"))
-import resources_rc
+        self.actionSelectAll.setText(_translate("MainWindow", "Select All"))
+        self.actionSelectAll.setShortcut(_translate("MainWindow", "Ctrl+A"))
+        self.actionDeselect.setText(_translate("MainWindow", "Deselect"))
+        self.actionDeselect.setShortcut(_translate("MainWindow", "Ctrl+D"))
+        self.actionInvertSelection.setText(_translate("MainWindow", "Invert Selection"))
+        self.actionInvertSelection.setShortcut(_translate("MainWindow", "Ctrl+Shift+I"))
+        self.actionCut.setText(_translate("MainWindow", "Cut"))
+        self.actionCut.setShortcut(_translate("MainWindow", "Ctrl+X"))
+        self.actionPaste.setText(_translate("MainWindow", "Paste"))
+        self.actionPaste.setShortcut(_translate("MainWindow", "Ctrl+V"))
+        self.actionRecordMacro.setText(_translate("MainWindow", "Record Macro"))
+        self.actionRecordMacro.setShortcut(_translate("MainWindow", "Ctrl+Shift+R"))
+        self.actionPlayMacro.setText(_translate("MainWindow", "Play Macro..."))
+        self.actionPlayMacro.setShortcut(_translate("MainWindow", "Ctrl+Shift+P"))
+        self.actionDiagnostics.setText(_translate("MainWindow", "Diagnostics Overlay"))
+        self.actionDiagnostics.setShortcut(_translate("MainWindow", "F12"))
+        self.actionProfileTool.setText(_translate("MainWindow", "Profile Current Tool"))
+        self.actionProfileTool.setShortcut(_translate("MainWindow", "Shift+F12"))
+        self.actionSmoothStrokes.setText(_translate("MainWindow", "Smooth"))
+        self.actionSmoothStrokes.setToolTip(_translate("MainWindow", "Smooth pen and brush strokes"))
+        self.actionVectorShapes.setText(_translate("MainWindow", "Vector"))
+        self.actionVectorShapes.setToolTip(_translate("MainWindow", "Keep new shapes as editable objects"))
+        self.actionImportSvg.setText(_translate("MainWindow", "Import SVG..."))
+        self.actionExportSvg.setText(_translate("MainWindow", "Export SVG..."))
+        self.actionRecordTimelapse.setText(_translate("MainWindow", "Record Timelapse"))
+        self.actionRecordTimelapse.setShortcut(_translate("MainWindow", "Ctrl+Shift+T"))
+        self.actionIndexedColors.setText(_translate("MainWindow", "Indexed Colors"))
+        self.actionReduceColors.setText(_translate("MainWindow", "Reduce Colors..."))
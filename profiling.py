@@ -0,0 +1,180 @@
+"""
+Profilers that can be wrapped around a tool's event handlers.
+
+Each profiler collects statistics for the handlers of one mode and can write them
+out with dump(path) or summarise them with report().
+"""
+import cProfile
+import functools
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+
+SAMPLE_INTERVAL = 0.001
+REPORT_LIMIT = 20
+
+
+class Profiler:
+    extension = 'txt'
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = defaultdict(float)
+
+    def wrap(self, fn):
+        @functools.wraps(fn)
+        def profiled(*args):
+            self.start()
+            t = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self.seconds[fn.__name__] += time.perf_counter() - t
+                self.calls[fn.__name__] += 1
+                self.stop(fn.__name__)
+
+        return profiled
+
+    def start(self):
+        pass
+
+    def stop(self, name):
+        pass
+
+    def close(self):
+        pass
+
+    def handler_report(self):
+        lines = ["%-32s %8s %10s %10s" % ('handler', 'calls', 'total ms', 'ms/call')]
+        for name, calls in self.calls.most_common():
+            total = self.seconds[name] * 1000
+            lines.append("%-32s %8d %10.2f %10.3f" % (name, calls, total, total / calls))
+        return lines
+
+    def report(self):
+        return "\n".join(self.handler_report())
+
+    def dump(self, path):
+        with open(path, 'w') as f:
+            f.write(self.report() + "\n")
+
+
+class CProfileProfiler(Profiler):
+    """
+    Deterministic profile of everything called from the handlers; dumps a pstats file.
+    """
+    extension = 'prof'
+
+    def __init__(self):
+        super(CProfileProfiler, self).__init__()
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self, name):
+        self.profile.disable()
+
+    def report(self):
+        out = io.StringIO()
+        pstats.Stats(self.profile, stream=out).sort_stats('cumulative').print_stats(REPORT_LIMIT)
+        return "\n".join(self.handler_report()) + "\n" + out.getvalue()
+
+    def dump(self, path):
+        self.profile.dump_stats(path)
+
+
+class SamplingProfiler(Profiler):
+    """
+    Samples the GUI thread's stack from a background thread while a handler runs,
+    counting the frames seen. Much lower overhead than cProfile on hot handlers.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super(SamplingProfiler, self).__init__()
+        self.interval = interval
+        self.samples = Counter()
+        self.thread_id = threading.get_ident()
+        self.active = threading.Event()
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.closed:
+            if not self.active.wait(0.1):
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if not self.active.is_set():
+                continue  # The handler returned while we were waking up.
+
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                if key not in seen:
+                    seen.add(key)
+                    self.samples[key] += 1
+                frame = frame.f_back
+            time.sleep(self.interval)
+
+    def start(self):
+        self.active.set()
+
+    def stop(self, name):
+        self.active.clear()
+
+    def close(self):
+        self.closed = True
+
+    def report(self):
+        lines = self.handler_report() + ["", "%8s  %s" % ('samples', 'function')]
+        for (filename, line, name), count in self.samples.most_common(REPORT_LIMIT):
+            lines.append("%8d  %s (%s:%d)" % (count, name, filename, line))
+        return "\n".join(lines)
+
+
+class TracemallocProfiler(Profiler):
+    """
+    Records the memory allocated and the peak reached during each handler call.
+    """
+
+    def __init__(self):
+        super(TracemallocProfiler, self).__init__()
+        self.allocated = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start()
+
+    def start(self):
+        self.before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+    def stop(self, name):
+        current, peak = tracemalloc.get_traced_memory()
+        self.allocated[name] += current - self.before
+        self.peak[name] = max(self.peak[name], peak - self.before)
+
+    def close(self):
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def report(self):
+        lines = ["%-32s %8s %14s %12s" % ('handler', 'calls', 'retained kB', 'peak kB')]
+        for name, calls in self.calls.most_common():
+            lines.append("%-32s %8d %14.1f %12.1f" % (
+                name, calls, self.allocated[name] / 1024, self.peak[name] / 1024))
+        return "\n".join(lines)
+
+
+PROFILERS = {
+    'cprofile': CProfileProfiler,
+    'sampling': SamplingProfiler,
+    'tracemalloc': TracemallocProfiler,
+}
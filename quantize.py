@@ -0,0 +1,295 @@
+"""
+Color quantization: reduce an image to a palette of N colors.
+
+The palette is found from a random sample of the pixels, not the whole image,
+with one of three methods:
+
+    median-cut  split the box of colors with the widest spread at its median
+    k-means     refine a median cut palette with Lloyd iterations
+    octree      merge the least populated nodes of the RGB octree
+
+Pixels are then mapped through a table holding the nearest palette color for each
+5-bit-per-channel RGB bin, optionally with ordered (Bayer) or Floyd-Steinberg
+dithering. Pixels less than half opaque become a transparent palette entry.
+"""
+import numpy as np
+
+from PyQt5.QtWidgets import QCheckBox, QComboBox, QDialog, QDialogButtonBox, QFormLayout, QSpinBox
+
+from imagearray import array_image
+from indexed import MAX_COLORS, argb_words
+
+SAMPLE_SIZE = 1 << 16
+SEED = 1234
+
+KMEANS_ITERATIONS = 8
+
+LUT_BITS = 5
+
+# Rows mapped at a time, to keep the temporaries small on large images.
+MAP_BAND = 1 << 18
+
+BAYER = np.array([
+    [0, 32, 8, 40, 2, 34, 10, 42],
+    [48, 16, 56, 24, 50, 18, 58, 26],
+    [12, 44, 4, 36, 14, 46, 6, 38],
+    [60, 28, 52, 20, 62, 30, 54, 22],
+    [3, 35, 11, 43, 1, 33, 9, 41],
+    [51, 19, 59, 27, 49, 17, 57, 25],
+    [15, 47, 7, 39, 13, 45, 5, 37],
+    [63, 31, 55, 23, 61, 29, 53, 21],
+]) / 64 - 0.5
+
+DITHERS = ['none', 'ordered', 'floyd-steinberg']
+
+
+def rgb(words):
+    """
+    The R, G and B channels of QRgb values as a (..., 3) uint8 array.
+    """
+    return np.stack([(words >> shift & 0xff).astype(np.uint8) for shift in (16, 8, 0)], axis=-1)
+
+
+def sample(words, size=SAMPLE_SIZE, seed=SEED):
+    """
+    The RGB of up to size random opaque pixels.
+    """
+    flat = words.reshape(-1)
+    if len(flat) > size:
+        flat = flat[np.random.default_rng(seed).integers(0, len(flat), size)]
+    flat = flat[flat >> 24 >= 128]
+    return rgb(flat).astype(np.float32)
+
+
+def median_cut(samples, n):
+    boxes = [samples]
+    while len(boxes) < n:
+        # Split the box whose widest channel, weighted by its population, is largest.
+        spreads = [(b.max(axis=0) - b.min(axis=0)) if len(b) > 1 else np.zeros(3) for b in boxes]
+        scores = [s.max() * np.sqrt(len(b)) for s, b in zip(spreads, boxes)]
+        i = int(np.argmax(scores))
+        if scores[i] <= 0:
+            break
+
+        box = boxes.pop(i)
+        order = np.argsort(box[:, int(np.argmax(spreads[i]))], kind='stable')
+        values = box[order, int(np.argmax(spreads[i]))]
+        # Split at the median, moved to where the value changes so that a run of one
+        # color is never divided.
+        median = values[len(box) // 2]
+        half = np.searchsorted(values, median, 'left') or np.searchsorted(values, median, 'right')
+        boxes += [box[order[:half]], box[order[half:]]]
+
+    return np.array([b.mean(axis=0) for b in boxes], np.float32)
+
+
+def nearest(samples, palette):
+    """
+    The index of the nearest palette color for each sample, by squared distance.
+    """
+    # |s - p|^2 = |s|^2 - 2 s.p + |p|^2, and |s|^2 is the same for every p.
+    distance = (palette ** 2).sum(axis=1) - 2 * samples @ palette.T
+    return distance.argmin(axis=1)
+
+
+def kmeans(samples, n, iterations=KMEANS_ITERATIONS):
+    palette = median_cut(samples, n)
+    for _ in range(iterations):
+        labels = nearest(samples, palette)
+        counts = np.bincount(labels, minlength=len(palette))
+        sums = np.stack([np.bincount(labels, samples[:, c], len(palette)) for c in range(3)], axis=1)
+        used = counts > 0
+        palette[used] = sums[used] / counts[used, None]
+    return palette
+
+
+def octree(samples, n):
+    """
+    Octree quantization, vectorized by level: find the deepest level whose nodes
+    are too many, then fold the least populated of their parents into single
+    colors until the leaves fit in n.
+    """
+    pixels = samples.astype(np.uint8)
+
+    def keys(level):
+        shift = 8 - level
+        r, g, b = (pixels[:, c].astype(np.uint32) >> shift for c in range(3))
+        return r << (2 * level) | g << level | b
+
+    level = 8
+    while level > 1 and len(np.unique(keys(level - 1))) > n:
+        level -= 1
+
+    leaves, leaf_of = np.unique(keys(level), return_inverse=True)
+    if len(leaves) > n:
+        # Parents of the leaves, least populated first; folding a parent turns its
+        # children into one leaf.
+        mask = (1 << level) - 1
+        r, g, b = leaves >> 2 * level, leaves >> level & mask, leaves & mask
+        parent_key = (r >> 1) << 2 * (level - 1) | (g >> 1) << level - 1 | b >> 1
+        parents, parent_of = np.unique(parent_key, return_inverse=True)
+        children = np.bincount(parent_of)
+        population = np.bincount(parent_of, np.bincount(leaf_of, minlength=len(leaves)))
+        order = np.argsort(population, kind='stable')
+        saved = np.cumsum(children[order] - 1)
+        folded = order[:np.searchsorted(saved, len(leaves) - n) + 1]
+
+        fold = np.zeros(len(parents), bool)
+        fold[folded] = True
+        # Folded leaves are keyed by their parent, kept ones by themselves, on
+        # separate ranges so the two never collide.
+        node = np.where(fold[parent_of], parent_of, len(parents) + np.arange(len(leaves)))
+        _, leaf_of = np.unique(node[leaf_of], return_inverse=True)
+
+    counts = np.bincount(leaf_of)
+    sums = np.stack([np.bincount(leaf_of, samples[:, c]) for c in range(3)], axis=1)
+    return (sums / counts[:, None]).astype(np.float32)
+
+
+METHODS = {
+    'median-cut': median_cut,
+    'k-means': kmeans,
+    'octree': octree,
+}
+
+
+def palette_lut(palette):
+    """
+    The index of the nearest palette color for the centre of every LUT_BITS RGB bin.
+    """
+    levels = (np.arange(1 << LUT_BITS, dtype=np.float32) + 0.5) * (1 << 8 - LUT_BITS)
+    r, g, b = np.meshgrid(levels, levels, levels, indexing='ij')
+    centres = np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+    return nearest(centres, palette).astype(np.uint8)
+
+
+def lut_keys(values):
+    """
+    LUT indices for a (..., 3) array of RGB values in 0-255.
+    """
+    bins = values.astype(np.int32) >> 8 - LUT_BITS
+    return bins[..., 0] << 2 * LUT_BITS | bins[..., 1] << LUT_BITS | bins[..., 2]
+
+
+def map_ordered(words, lut, palette, y0):
+    """
+    Map rows of pixels starting at row y0 with an 8x8 Bayer threshold added, scaled
+    to the typical distance between palette colors.
+    """
+    h, w = words.shape
+    spread = 255 / max(len(palette), 2) ** (1 / 3)
+    threshold = np.tile(BAYER, ((h + y0 % 8) // 8 + 1, w // 8 + 1))[y0 % 8:y0 % 8 + h, :w]
+    values = rgb(words) + (threshold * spread)[..., None]
+    return lut[lut_keys(np.clip(values, 0, 255))]
+
+
+def map_floyd_steinberg(words, lut, palette):
+    """
+    Floyd-Steinberg error diffusion. A pixel only takes error from its left and
+    upper neighbours, so every pixel on an anti-diagonal x + 2y = t depends only on
+    earlier ones, and each anti-diagonal is done as one vector step.
+    """
+    h, w = words.shape
+    source = rgb(words).reshape(-1, 3).astype(np.int16)
+    colors = np.round(palette).astype(np.int16)
+    # Errors in sixteenths, with a column of padding on either side and a row below.
+    stride = w + 2
+    error = np.zeros(((h + 1) * stride, 3), np.int32)
+    out = np.empty(h * w, np.uint8)
+
+    for t in range(w + 2 * (h - 1)):
+        y = np.arange(max(0, (t - w + 2) // 2), min(h - 1, t // 2) + 1)
+        x = t - 2 * y
+        at = y * stride + x + 1
+
+        value = np.clip(source[y * w + x] + (error[at] >> 4), 0, 255)
+        index = lut[lut_keys(value)]
+        out[y * w + x] = index
+        e = value - colors[index]
+
+        error[at + 1] += e * 7
+        error[at + stride - 1] += e * 3
+        error[at + stride] += e * 5
+        error[at + stride + 1] += e
+
+    return out.reshape(h, w)
+
+
+def quantize(image, n, method='median-cut', dither='none'):
+    """
+    Reduce image to at most n colors. Returns a Grayscale8 image of indices and the
+    palette as QRgb values, most used first, as indexed.py takes them.
+    """
+    words, _ = argb_words(image)
+    # With room for only one color, transparent pixels take that color too.
+    transparent = n > 1 and (words >> 24 < 128).any()
+    colors = max(1, min(n, MAX_COLORS) - int(transparent))
+
+    samples = sample(words)
+    palette = METHODS[method](samples, colors) if len(samples) else np.zeros((1, 3), np.float32)
+
+    # Most used first, so the first swatches are the main colors.
+    if len(samples):
+        order = np.argsort(-np.bincount(nearest(samples, palette), minlength=len(palette)), kind='stable')
+        palette = palette[order]
+    lut = palette_lut(palette)
+
+    h, w = words.shape
+    if dither == 'floyd-steinberg':
+        indices = map_floyd_steinberg(words, lut, palette)
+    else:
+        indices = np.empty((h, w), np.uint8)
+        band = max(1, MAP_BAND // max(w, 1))
+        for y0 in range(0, h, band):
+            rows = words[y0:y0 + band]
+            if dither == 'ordered':
+                indices[y0:y0 + band] = map_ordered(rows, lut, palette, y0)
+            else:
+                indices[y0:y0 + band] = lut[lut_keys(rgb(rows))]
+
+    rgb_palette = np.clip(np.round(palette), 0, 255).astype(np.uint32)
+    qrgb = [int(0xff000000 | r << 16 | g << 8 | b) for r, g, b in rgb_palette]
+    if transparent:
+        indices[words >> 24 < 128] = len(qrgb)
+        qrgb.append(0)
+    return array_image(indices), tuple(qrgb)
+
+
+class ReduceColorsDialog(QDialog):
+    """
+    Options for Image > Reduce Colors.
+    """
+
+    def __init__(self, parent=None):
+        super(ReduceColorsDialog, self).__init__(parent)
+        self.setWindowTitle("Reduce Colors")
+        layout = QFormLayout(self)
+
+        self.colors = QSpinBox()
+        self.colors.setRange(2, MAX_COLORS)
+        self.colors.setValue(16)
+        layout.addRow("Colors", self.colors)
+
+        self.method = QComboBox()
+        self.method.addItems(list(METHODS))
+        layout.addRow("Method", self.method)
+
+        self.dither = QComboBox()
+        self.dither.addItems(DITHERS)
+        layout.addRow("Dithering", self.dither)
+
+        self.swatches = QCheckBox("Use as swatches")
+        self.swatches.setChecked(True)
+        layout.addRow(self.swatches)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addRow(buttons)
+
+    def options(self):
+        return {
+            'n': self.colors.value(),
+            'method': self.method.currentText(),
+            'dither': self.dither.currentText(),
+        }
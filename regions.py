@@ -0,0 +1,182 @@
+import numpy as np
+
+
+H = np.uint32(0x80808080)
+LOW = np.uint32(0x7f7f7f7f)
+
+MATCH_BAND = 1 << 16
+
+
+def pack_bytes(values):
+    return np.uint32(int.from_bytes(bytes(values), 'little'))
+
+
+def color_match(arr, x, y, tolerance=0):
+    """
+    Return a (h, w) boolean mask of pixels within tolerance (per channel) of the pixel at x, y.
+    Single-channel arrays, like the indices of an indexed document, match exactly.
+    """
+    if arr.ndim == 2:
+        return arr == arr[y, x]
+
+    words = arr.view(np.uint32).reshape(arr.shape[:2])
+    if tolerance <= 0:
+        return words == words[y, x]
+
+    if tolerance >= 255:
+        return np.ones(arr.shape[:2], bool)
+
+    target = [int(c) for c in arr[y, x]]
+    lo = [max(c - tolerance, 0) for c in target]
+    span = [min(c + tolerance, 255) - l for c, l in zip(target, lo)]
+
+    if max(span) > 127:
+        match = np.ones(arr.shape[:2], bool)
+        for c in range(arr.shape[2]):
+            channel = arr[..., c]
+            match &= (channel >= lo[c]) & (channel <= lo[c] + span[c])
+        return match
+
+    # Test all four channels at once on packed 32-bit words: d = (pixel - lo) per
+    # byte, without borrows between bytes, then a byte fails if d has its high bit
+    # set or if d + (127 - span) carries into it. Rows are processed in bands so
+    # the scratch buffers stay small and cache resident.
+    lo_word = pack_bytes(lo)
+    lo_low, lo_high = lo_word & LOW, ~lo_word & H
+    carry = pack_bytes([0x7f - s for s in span])
+
+    h, w = words.shape
+    band = max(1, MATCH_BAND // w)
+    match = np.empty((h, w), bool)
+    d = np.empty((band, w), np.uint32)
+    t = np.empty((band, w), np.uint32)
+
+    for y0 in range(0, h, band):
+        rows = words[y0:y0 + band]
+        n = len(rows)
+        dn, tn = d[:n], t[:n]
+
+        np.bitwise_or(rows, H, out=dn)
+        dn -= lo_low
+        np.bitwise_and(rows, H, out=tn)
+        tn ^= lo_high
+        dn ^= tn
+
+        np.bitwise_and(dn, LOW, out=tn)
+        tn += carry
+        tn |= dn
+        tn &= H
+        np.equal(tn, 0, out=match[y0:y0 + n])
+
+    return match
+
+
+def find_runs(mask):
+    """
+    Find horizontal runs of True in a (h, w) mask.
+
+    Returns run starts and (exclusive) ends as flat offsets into the mask padded to
+    width w + 1, so the padding column separates runs on consecutive rows and both
+    arrays are sorted.
+    """
+    h, w = mask.shape
+    padded = np.zeros((h, w + 1), bool)
+    padded[:, :w] = mask
+    flat = padded.ravel()
+
+    edges = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+    if flat[0]:
+        edges = np.concatenate(([0], edges))
+    return edges[0::2], edges[1::2]
+
+
+def run_edges(starts, ends, stride):
+    """
+    Pair every run with the runs it touches (4-connected) on the row below.
+    """
+    row = starts // stride
+    below = (row + 1) * stride
+    lo = np.searchsorted(ends, below + starts % stride, side='right')
+    hi = np.searchsorted(starts, below + (ends - row * stride), side='left')
+
+    counts = np.maximum(hi - lo, 0)
+    a = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    b = np.repeat(lo, counts) + offsets
+    return a, b
+
+
+def label_runs(n, a, b):
+    """
+    Label connected runs by hooking the larger root onto the smaller and pointer
+    jumping, all as whole-array operations, until every edge joins equal labels.
+    """
+    labels = np.arange(n)
+    while True:
+        la, lb = labels[a], labels[b]
+        differ = la != lb
+        if not differ.any():
+            return labels
+
+        la, lb = la[differ], lb[differ]
+        np.minimum.at(labels, np.maximum(la, lb), np.minimum(la, lb))
+
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
+def region_in(arr, x, y, tolerance):
+    h, w = arr.shape[:2]
+    stride = w + 1
+
+    match = color_match(arr, x, y, tolerance)
+    starts, ends = find_runs(match)
+
+    a, b = run_edges(starts, ends, stride)
+    labels = label_runs(len(starts), a, b)
+
+    seed = np.searchsorted(starts, y * stride + x, side='right') - 1
+    selected = labels == labels[seed]
+
+    flat = np.zeros(h * stride + 1, np.int8)
+    flat[starts[selected]] = 1
+    flat[ends[selected]] = -1
+    region = np.cumsum(flat[:-1], dtype=np.int8).view(bool)
+    return region.reshape(h, stride)[:, :w]
+
+
+def connected_region(arr, x, y, tolerance=0, window=256):
+    """
+    Return a (h, w) boolean mask of the region 4-connected to x, y whose pixels
+    are within tolerance of the pixel at x, y.
+
+    Works on horizontal runs rather than pixels: runs are found, joined to
+    overlapping runs on adjacent rows and labelled with vectorized union-find,
+    so there is no per-pixel Python loop. The search starts in a window around
+    the seed and only grows it while the region reaches the window edge, so
+    small regions on large images stay cheap.
+    """
+    h, w = arr.shape[:2]
+
+    while True:
+        x0, y0 = max(x - window, 0), max(y - window, 0)
+        x1, y1 = min(x + window, w), min(y + window, h)
+        region = region_in(arr[y0:y1, x0:x1], x - x0, y - y0, tolerance)
+
+        clipped = (
+            (y0 > 0 and region[0].any()) or (y1 < h and region[-1].any()) or
+            (x0 > 0 and region[:, 0].any()) or (x1 < w and region[:, -1].any())
+        )
+        if not clipped:
+            break
+        window *= 4
+
+    if (x0, y0, x1, y1) == (0, 0, w, h):
+        return region
+
+    result = np.zeros((h, w), bool)
+    result[y0:y1, x0:x1] = region
+    return result
@@ -0,0 +1,22 @@
+from PyQt5.QtCore import QResource
+
+import os
+
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources.rcc')
+
+registered = False
+
+
+def load_resources():
+    """
+    Register the :/icons bundle the first time it is needed.
+
+    Qt memory-maps the binary .rcc file, so no resource data is parsed, compiled
+    or copied at import time. Rebuild it with build_resources.py after editing
+    resources_rc.qrc.
+    """
+    global registered
+    if not registered:
+        if not QResource.registerResource(RESOURCE_FILE):
+            raise RuntimeError("Could not register %s, run build_resources.py" % RESOURCE_FILE)
+        registered = True
@@ -1,2052 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.1)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x01\x1a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x00\xbc\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\x03\x25\x80\x89\x81\x42\x30\xf0\x06\xb0\xc0\x4d\
-\x62\x02\x9b\xa5\x0d\xc4\x8d\x38\xd4\xbe\x06\xe2\x7a\x20\x7e\x05\
-\xe2\xfc\xfb\xf7\x0f\xab\x0b\xae\x02\xf1\x34\x20\x66\x86\xe2\x06\
-\x20\x0e\x01\xe2\x35\x40\x2c\x01\xc4\x4e\x38\x5d\x80\x04\xde\x00\
-\x31\x2b\x9a\x17\x99\xa0\x62\x4c\xc4\x18\xc0\x88\x64\x40\x37\x16\
-\x17\x12\x0c\x44\x90\x01\x6c\x50\xdc\x0f\xc4\xe5\x40\xbc\x0c\xca\
-\xaf\x00\x62\x2e\x42\x06\x30\x21\x19\x00\x0a\xb0\x0b\x40\x7c\x19\
-\xca\x97\x03\x62\x0d\xac\x5e\x00\xa5\x48\x46\x46\x90\xe5\x0c\x32\
-\x40\xcc\x0e\x33\x0c\x2a\x8e\x2c\xf6\x09\xc5\xb9\xb0\xa4\x0c\x54\
-\xc4\x09\xa4\xac\x80\x78\x1e\x9e\x68\x9f\x0f\xc4\x33\x81\xf8\x1b\
-\x50\xdf\x47\x6c\x06\xf0\x20\x05\x20\x2e\xf0\x1f\xab\x01\x43\x37\
-\x2f\x00\x04\x18\x00\x53\x06\x31\x28\x9b\x56\xd0\x25\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x9f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x41\x49\x44\x41\x54\x78\xda\x8c\
-\x53\x4d\x6b\x13\x51\x14\x3d\xf3\xdd\xd4\x86\x36\xc6\xd4\x44\xec\
-\xc2\x85\x50\x12\x74\x1d\x30\xab\x08\xe2\xc6\x9d\x3b\xff\x80\x8b\
-\xfe\x05\x5b\x08\x2e\x5c\x8b\x60\xd7\x85\x80\x0b\xd7\x82\x94\x16\
-\x0a\x5d\x74\x55\xb2\xd2\x56\x53\x5d\xa8\x19\x63\x35\x1f\x26\x69\
-\x66\x26\x33\x6f\xbc\xf7\x25\x93\x4c\xb1\x88\x17\xee\xbc\xaf\x7b\
-\xce\xdc\x73\xef\x7b\xca\xc3\xf5\x75\xb0\x29\x8a\xf2\x80\x86\x1c\
-\xfe\x6d\xbb\x42\x88\xba\x08\x02\x84\x61\x88\xa3\xfd\x7d\xe8\x3c\
-\x61\xa3\xf1\xda\xd6\xc6\xc6\xa6\x47\x87\x23\x76\x21\x10\xd0\x59\
-\x74\x5e\xab\xd5\xb0\xb5\xbd\xfd\x98\xff\x45\xfe\x91\xf7\x56\x4b\
-\x25\xa8\xcc\x36\x71\x45\x30\x68\x34\x92\xee\x39\x0e\x86\x83\x01\
-\xfa\xfd\x3e\x7a\xbd\x9e\x1c\x5f\x57\x2a\x9b\x14\x77\x97\xb0\x37\
-\xa3\x94\xf4\x80\xc0\x13\x53\x98\x5a\xa5\xaf\xa1\x69\xb3\xa4\x7d\
-\x1f\x3e\x11\xb7\x5a\x2d\xbc\xa8\x56\x51\xce\xe7\x5f\x3e\xaf\x56\
-\x9f\xd0\xc9\x53\x49\x20\x66\x04\x2a\x83\x55\x49\x83\xbf\x48\xca\
-\xe5\xb2\x94\x93\x4c\x26\xf1\xb6\x56\x6b\x4f\x33\xf0\xe3\x19\x10\
-\xf8\xd3\x9b\x95\x0b\x6a\xc7\xa4\xe3\x5a\xe0\xde\x67\x10\x46\x99\
-\x49\x20\xf6\xb8\x04\xd3\x34\xcf\x43\x79\x57\xa5\x89\x90\x85\x96\
-\x6b\xc2\x5c\x48\x20\x25\xfc\xfc\xb5\x88\x5c\xd6\xa5\xc5\x38\x58\
-\x33\x35\x68\x96\x81\xc0\xa5\xe2\x7a\x01\xb4\x31\x81\x3a\x05\xf9\
-\x5c\xa4\xb1\xab\x4c\x5b\x7d\x95\xc1\xbb\xf7\x29\x58\x96\x25\x7d\
-\x21\x9d\xc6\xf2\x6a\x1e\xc9\x4c\x06\xd6\xdc\x9c\xac\x0d\xc7\x46\
-\xb8\x38\x81\xac\x41\xb3\xd1\xc1\xce\xae\x01\xcf\x33\xa1\xe9\x16\
-\x12\xe9\x1c\xac\xa5\xeb\x98\x4f\x67\x61\x90\x3c\x43\x55\x65\x6c\
-\x84\xd3\xb9\xe7\x51\x36\x9c\x81\xdd\x68\xc0\x75\x2e\xa3\x52\x59\
-\x44\xe1\x96\x81\xfb\x8f\x32\xb8\x9d\xbb\x81\x76\x37\x80\x3b\xb4\
-\x31\xcf\x12\x46\x23\x75\xd6\x85\x58\x0d\x38\x83\xb5\xb5\x01\x69\
-\x3f\x83\xae\x7f\x87\xa6\x29\xe8\xd9\x27\x68\x7f\xdd\xc1\xb7\x0f\
-\x2e\xba\x8d\x01\x32\x77\x20\x25\x4c\x09\xba\xb6\x8d\x4b\xa4\x2f\
-\xea\x42\x36\x6b\x9e\xeb\x9e\x7f\xe6\xc1\xae\xf7\xe0\x74\x7d\xea\
-\x82\x90\xf7\xc4\x9f\x74\x61\x70\x7a\x0a\xbd\xbe\xb7\x87\x95\x62\
-\x11\x89\x54\x4a\xe7\xcd\xc3\x43\x07\xf1\xbe\x2e\x5d\xa1\x94\x13\
-\x2e\x4e\x8e\xe9\x36\xfe\x08\x51\xa2\x7d\xba\xe2\xfa\xb0\xdd\xc6\
-\x97\x83\x03\x19\x97\x20\x5f\xbe\x5a\x2c\x56\xc2\x98\x09\xf2\x40\
-\x88\x90\xae\x71\x48\x8f\x2b\xa4\x47\x16\x3a\xbe\x1f\xba\xb4\xe6\
-\x58\xc6\x30\x56\x8f\x08\x7e\x37\x9b\x9d\x85\x42\xe1\x19\xfe\xc3\
-\xc4\x70\xd8\x99\x10\xf8\x7f\x04\x18\x00\xb6\x51\x47\x46\x4d\xa6\
-\x76\x14\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x37\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x06\x08\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x52\x69\x67\x68\x74\x73\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x72\x69\x67\x68\x74\x73\x2f\x22\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
-\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\x6d\
-\x6c\x6e\x73\x3a\x73\x74\x52\x65\x66\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\
-\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\
-\x6f\x75\x72\x63\x65\x52\x65\x66\x23\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\
-\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\
-\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\x73\x6f\x75\x72\
-\x63\x65\x45\x76\x65\x6e\x74\x23\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x70\x52\x69\x67\x68\x74\x73\x3a\x4d\x61\
-\x72\x6b\x65\x64\x3d\x22\x46\x61\x6c\x73\x65\x22\x20\x78\x6d\x70\
-\x4d\x4d\x3a\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\
-\x6d\x70\x2e\x64\x69\x64\x3a\x37\x30\x34\x45\x42\x34\x36\x34\x30\
-\x33\x38\x37\x31\x31\x45\x31\x41\x44\x45\x32\x43\x42\x43\x33\x30\
-\x30\x41\x42\x35\x36\x32\x36\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\
-\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\
-\x69\x64\x3a\x62\x39\x34\x66\x61\x34\x32\x32\x2d\x65\x39\x30\x34\
-\x2d\x33\x35\x34\x36\x2d\x62\x36\x38\x31\x2d\x33\x31\x37\x32\x39\
-\x31\x63\x64\x39\x30\x32\x65\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\
-\x72\x69\x67\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\
-\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\x37\x30\x34\x45\x42\
-\x34\x36\x34\x30\x33\x38\x37\x31\x31\x45\x31\x41\x44\x45\x32\x43\
-\x42\x43\x33\x30\x30\x41\x42\x35\x36\x32\x36\x22\x20\x78\x6d\x70\
-\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\x64\
-\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x43\x53\
-\x33\x20\x57\x69\x6e\x64\x6f\x77\x73\x22\x20\x78\x6d\x70\x3a\x43\
-\x72\x65\x61\x74\x65\x44\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\
-\x30\x35\x2d\x32\x30\x54\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\
-\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\
-\x44\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\
-\x54\x31\x33\x3a\x30\x37\x3a\x32\x37\x2b\x31\x30\x3a\x30\x30\x22\
-\x20\x78\x6d\x70\x3a\x4d\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\
-\x65\x3d\x22\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\
-\x3a\x30\x37\x3a\x32\x37\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\
-\x3a\x66\x6f\x72\x6d\x61\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\
-\x6e\x67\x22\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\
-\x6c\x6f\x72\x4d\x6f\x64\x65\x3d\x22\x33\x22\x3e\x20\x3c\x78\x6d\
-\x70\x4d\x4d\x3a\x44\x65\x72\x69\x76\x65\x64\x46\x72\x6f\x6d\x20\
-\x73\x74\x52\x65\x66\x3a\x69\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\
-\x3d\x22\x75\x75\x69\x64\x3a\x41\x43\x31\x46\x32\x45\x38\x33\x33\
-\x32\x34\x41\x44\x46\x31\x31\x41\x41\x42\x38\x43\x35\x33\x39\x30\
-\x44\x38\x35\x42\x35\x42\x33\x22\x20\x73\x74\x52\x65\x66\x3a\x64\
-\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x75\x75\x69\x64\x3a\
-\x43\x39\x44\x33\x34\x39\x36\x36\x34\x41\x33\x43\x44\x44\x31\x31\
-\x42\x30\x38\x41\x42\x42\x42\x43\x46\x46\x31\x37\x32\x31\x35\x36\
-\x22\x2f\x3e\x20\x3c\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\
-\x72\x79\x3e\x20\x3c\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\
-\x64\x66\x3a\x6c\x69\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\
-\x6f\x6e\x3d\x22\x73\x61\x76\x65\x64\x22\x20\x73\x74\x45\x76\x74\
-\x3a\x69\x6e\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\
-\x2e\x69\x69\x64\x3a\x62\x39\x34\x66\x61\x34\x32\x32\x2d\x65\x39\
-\x30\x34\x2d\x33\x35\x34\x36\x2d\x62\x36\x38\x31\x2d\x33\x31\x37\
-\x32\x39\x31\x63\x64\x39\x30\x32\x65\x22\x20\x73\x74\x45\x76\x74\
-\x3a\x77\x68\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\
-\x38\x54\x31\x33\x3a\x30\x37\x3a\x32\x37\x2b\x31\x30\x3a\x30\x30\
-\x22\x20\x73\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\
-\x41\x67\x65\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\
-\x57\x69\x6e\x64\x6f\x77\x73\x29\x22\x20\x73\x74\x45\x76\x74\x3a\
-\x63\x68\x61\x6e\x67\x65\x64\x3d\x22\x2f\x22\x2f\x3e\x20\x3c\x2f\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\
-\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\
-\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\
-\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\
-\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\
-\x6e\x64\x3d\x22\x72\x22\x3f\x3e\xc8\x47\xc9\x97\x00\x00\x00\x92\
-\x49\x44\x41\x54\x38\x8d\x95\x93\x4b\x0e\x03\x21\x0c\x43\x9d\xaa\
-\x07\x6b\x4f\x5e\x72\x32\x77\x01\x83\x5c\x8d\x09\x34\x2b\x40\xd8\
-\x7e\xe1\x13\x24\x71\x55\x44\xc0\x14\x65\x1c\xba\x1f\x00\x9e\x4e\
-\xa1\xe2\x8f\x4c\xde\xdd\xec\x27\x65\x67\x00\x00\x78\x5d\xa9\x86\
-\xf0\x51\xa5\xeb\x64\xb4\x77\x73\x28\x09\xc8\x11\xea\xcf\xa6\x24\
-\x18\x67\x45\xb4\xd6\x26\x84\xdb\x18\x8b\x5b\x60\x5f\x0f\x0d\x0f\
-\x71\x2e\x09\xa6\x38\xb3\x4e\x5f\x11\x4c\x7c\x21\x52\xb4\x92\x60\
-\x8a\x33\x73\x9b\xee\x08\xba\x9c\xb8\xf5\x7e\x4a\x30\x8c\xbc\xd8\
-\x55\xf5\x90\xb6\xe2\xca\xe0\x48\xbc\x32\x38\x16\x03\xe6\x7b\xfe\
-\x5b\x5f\x03\x85\x42\x1a\x3b\x36\xbb\xab\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xce\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x34\
-\x3a\x32\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x34\x3a\x32\x36\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x39\x38\x65\x63\x63\x37\x32\x37\x2d\x32\x63\x61\x63\x2d\x30\x66\
-\x34\x35\x2d\x61\x38\x31\x36\x2d\x62\x66\x35\x66\x36\x39\x34\x39\
-\x61\x39\x37\x31\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x39\x38\x65\x63\x63\x37\x32\x37\x2d\x32\x63\x61\x63\x2d\x30\x66\
-\x34\x35\x2d\x61\x38\x31\x36\x2d\x62\x66\x35\x66\x36\x39\x34\x39\
-\x61\x39\x37\x31\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x39\x38\x65\x63\x63\x37\x32\x37\
-\x2d\x32\x63\x61\x63\x2d\x30\x66\x34\x35\x2d\x61\x38\x31\x36\x2d\
-\x62\x66\x35\x66\x36\x39\x34\x39\x61\x39\x37\x31\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x39\x38\x65\x63\x63\x37\x32\x37\x2d\x32\x63\x61\x63\x2d\
-\x30\x66\x34\x35\x2d\x61\x38\x31\x36\x2d\x62\x66\x35\x66\x36\x39\
-\x34\x39\x61\x39\x37\x31\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x74\x34\x4e\xea\x00\x00\x00\x3e\x49\x44\x41\x54\x38\
-\x8d\xed\x93\xc1\x09\x00\x31\x10\x02\xc7\x90\xc2\xb6\xf4\xed\xcc\
-\xd4\x90\x18\x38\x38\xe2\xdf\x41\x41\x65\x9b\x44\x23\x72\x03\x02\
-\x8e\x23\xd8\xd6\x04\xe8\xee\x6d\x73\x55\x01\x17\x2a\x3c\xc0\x2f\
-\x00\xf1\x12\xf5\xf9\x99\x62\xc0\x02\x14\x95\x11\x13\xe0\x69\x72\
-\xa9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xe0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x0f\x00\x00\x00\x10\x08\x06\x00\x00\x00\xc9\x56\x25\x04\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x35\
-\x3a\x30\x38\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x35\x3a\x30\x38\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x62\x64\x38\x31\x39\x35\x61\x36\x2d\x31\x61\x66\x35\x2d\x61\x30\
-\x34\x33\x2d\x38\x63\x64\x64\x2d\x36\x37\x37\x34\x66\x65\x64\x63\
-\x39\x63\x37\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x62\x64\x38\x31\x39\x35\x61\x36\x2d\x31\x61\x66\x35\x2d\x61\x30\
-\x34\x33\x2d\x38\x63\x64\x64\x2d\x36\x37\x37\x34\x66\x65\x64\x63\
-\x39\x63\x37\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x62\x64\x38\x31\x39\x35\x61\x36\
-\x2d\x31\x61\x66\x35\x2d\x61\x30\x34\x33\x2d\x38\x63\x64\x64\x2d\
-\x36\x37\x37\x34\x66\x65\x64\x63\x39\x63\x37\x33\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x62\x64\x38\x31\x39\x35\x61\x36\x2d\x31\x61\x66\x35\x2d\
-\x61\x30\x34\x33\x2d\x38\x63\x64\x64\x2d\x36\x37\x37\x34\x66\x65\
-\x64\x63\x39\x63\x37\x33\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x57\xfc\xf0\x98\x00\x00\x00\x50\x49\x44\x41\x54\x28\
-\x91\x63\xfc\xff\xff\x3f\x03\xb9\x80\x89\x6c\x9d\x94\x6a\x66\xc4\
-\x22\x86\xcf\x1f\x8c\xb8\x38\xff\x19\x18\x18\x18\x0e\x1c\x38\x80\
-\x53\xa7\x83\x83\x03\x8a\x3e\x98\xe6\xff\xf8\x34\xe1\x30\x84\x91\
-\x91\x54\x8d\xc8\x06\x0c\x5c\x68\x53\x25\xaa\xc8\x0e\x30\x18\x20\
-\x3b\xaa\x90\x01\xf1\x89\x64\x68\x66\x0c\x00\x09\x17\x1c\x11\x00\
-\xe5\x0f\xca\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\xb9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x5b\x49\x44\x41\x54\x78\xda\xa4\
-\x53\xcf\x6f\x12\x61\x10\x7d\xfb\xa3\xa5\x08\x51\x0e\x48\x8c\x37\
-\x13\x34\x56\x69\x38\x58\x45\x69\x53\x8e\x70\x69\xa2\x26\xc4\xc4\
-\x5b\x69\xec\xad\x8d\x5e\x4c\x1b\x8d\xe2\xb1\xfe\x03\x95\x03\x09\
-\x09\x09\x47\x2f\x5e\xb5\x29\x11\x4c\x4c\xc0\x22\x24\x10\x88\xed\
-\xa1\x22\x4d\x2d\x81\x52\x60\xf9\xb5\xec\x3a\xdf\x4a\x1b\x8b\x3d\
-\xe9\x24\x6f\xbf\xd9\xc9\xbc\x37\xf3\xcd\xce\x72\x20\xb3\x58\x2c\
-\x70\xb9\x5c\xf8\xc3\x26\x5b\xad\x96\xa3\x50\x28\xa4\x79\x9e\xff\
-\xb8\xb5\xb5\x85\x5e\xaf\x07\xbd\x5e\x8f\x6b\x53\x4b\x50\x55\x15\
-\x5f\x3e\xbc\xd6\x12\x85\x53\xc8\x2c\x61\x96\x08\x6b\x44\x7c\x44\
-\xaf\x97\x0f\x0f\x0f\x65\x8a\xed\x8d\x8c\x8c\xc0\xe3\x7b\x8b\x0b\
-\x97\x9c\x18\x77\x2e\x82\xe3\x38\xf0\xc3\xe4\x81\x80\x4c\x02\x0b\
-\x3e\x9f\xef\x79\x2a\x95\x0a\xf4\xfb\xfd\x3b\x14\xbe\x39\x9c\x37\
-\x31\xf3\x04\x3c\xfe\x36\x7b\xbd\x5e\x17\x22\x91\x48\x80\xbd\xe4\
-\xf3\x79\x94\x4a\x3f\xd7\xa8\xda\x3d\xc2\xcc\x70\xf2\xb0\x80\xbd\
-\x56\xab\x39\xc2\xe1\x70\x20\x97\xcb\x69\x81\x62\xb1\x88\x44\x22\
-\x81\x64\x72\x7b\xc5\x68\x34\x7a\x3a\x52\xa5\x4a\x1d\xae\x9e\x26\
-\xa0\x91\x43\xa1\x50\xe0\xe0\xe0\x00\xd9\x6c\x16\x5e\xaf\x17\xdb\
-\xdb\x3b\xd8\xdf\x97\x90\x4e\x67\x10\x8f\xe7\x56\x8a\x99\xd0\xfb\
-\x46\xa3\xf1\xb4\xdb\xed\x3e\x6c\xb7\xdb\xe0\x3b\x9d\x0e\x18\x18\
-\x39\x18\x0c\x06\xa8\x7d\x54\x2a\x15\x6d\xe2\xab\xab\xac\x90\x1e\
-\x82\x30\x0a\xb3\xd9\x4c\xb1\x31\xf0\x8d\xcf\x31\x56\x80\x06\xfb\
-\x92\x84\x20\xd2\xa7\xd2\xca\x4b\x92\x04\x59\x96\x35\x72\xb3\xd9\
-\x84\xc9\x64\x86\xc7\xf3\xe0\x98\x6c\xb3\xd9\x30\x37\x77\xf7\xb1\
-\xc1\x60\x88\x7e\x2f\x97\x19\xe5\x0a\x7b\x70\xac\x12\x33\x22\xdb\
-\x09\xb7\xe3\xf1\x4f\x6f\xca\xe5\xaa\xd6\xf6\x11\x79\x7c\xfc\x2a\
-\xe6\xe7\xef\x2f\x91\xf0\xa6\x78\xde\x13\xdb\x6d\x5f\x57\x07\xd7\
-\xe6\x78\x56\x95\x41\x51\x94\xaf\x34\xe5\xc4\xf4\xf4\xd4\xb2\x24\
-\xf1\xc7\x64\xab\xd5\x0a\xb7\xfb\xd6\x62\xb5\x5a\x8d\x51\x97\xb1\
-\xec\xee\x45\x90\x0f\xba\xea\x2b\x76\xdd\x13\xc6\x16\x43\x14\x45\
-\xa7\x4e\xa7\x7b\xb1\xbe\xbe\xa9\x66\x32\x3f\x54\x9a\xfc\x33\x82\
-\xe3\xa8\x53\xfe\x8c\x15\x82\xd9\xed\x67\xa7\xc6\xf1\xdf\x98\x85\
-\x3f\xf9\x8e\xf9\xe7\x08\x46\xc2\x59\x41\x10\x26\x48\x6c\x72\xb0\
-\x54\x49\x5a\xa4\x6f\xe4\xb6\x09\x7b\x84\x3e\xc1\x34\x38\x77\x38\
-\x75\x21\x80\x68\x29\x8f\x8d\x52\x7e\x8c\xb2\x47\x09\x3a\x82\x08\
-\x45\xe5\xa0\x2a\x4c\x01\xe4\xd3\xa9\xc8\xe4\x37\xb4\x1f\x41\x55\
-\x59\xae\x42\xa8\x31\x81\x0d\x72\x5c\x34\x04\x9c\x40\xbf\xff\x1b\
-\xc3\xfe\x49\x44\xd9\x22\xb9\xf0\xef\xe6\x62\x02\xd1\xff\x10\x88\
-\xfe\x12\x60\x00\x3b\xa3\x53\x98\x13\x38\xd8\xdc\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\xfb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x01\x9d\x49\x44\x41\x54\x78\xda\xa4\
-\x93\xbf\x4b\xc3\x50\x10\xc7\x2f\x2f\x2f\x92\x0e\x45\x9d\xec\x14\
-\xc4\x52\x5d\x5d\xea\xa2\x90\xbf\xc3\xc1\x41\xba\xe8\xe2\xe0\xa4\
-\xe0\xe0\xe0\xe0\x54\x45\x1c\x44\x10\x07\x71\x71\x76\x73\x2a\xea\
-\x28\x9d\x84\xa2\xed\x24\xa5\x0e\xa2\x85\xd6\x5a\x5e\x93\x9c\x77\
-\xaf\x69\x4d\x51\xdb\x8a\x81\xcb\xcb\x8f\xfb\x7e\xde\xf7\xee\x12\
-\x03\x11\xe1\x3f\x87\xcc\xc8\x7d\x5a\x8c\x15\x3a\x25\x6b\x5b\x6f\
-\x8f\xc3\x88\xe2\x3b\xe3\x29\x5a\x4a\x00\x78\x24\xdb\xfb\x63\x6a\
-\xe3\x2c\xb3\x3e\xbd\x18\x87\x41\x7e\x0c\x8a\x87\x99\x1a\xec\x2e\
-\x9d\x64\xb5\x03\x84\x80\x57\xa1\x94\x02\x8f\xca\xf1\x7d\xbf\x2f\
-\xc0\x34\x4d\xe0\x5c\xd2\x89\x10\xa0\xf7\x14\x41\x10\x80\x22\x71\
-\xab\xd5\xea\x0b\xb0\x28\x38\x97\x74\x22\xea\xc0\xf4\x3c\x4f\x03\
-\x9a\x03\x00\x28\x04\x70\x2e\xe9\x4c\x0d\x08\x50\x5b\x36\xd9\xba\
-\x22\xf2\x20\x80\xb0\x2c\x5d\x26\xe9\x42\x40\xe8\x80\x1f\xbe\x57\
-\x14\x8c\x4c\xd8\x7d\x01\x9c\xa3\x01\x1d\x07\xd1\x12\x8a\x17\x4f\
-\x43\xcd\x3e\x16\x8b\x45\x4a\x80\xaf\x12\xf2\xf9\x3c\xfc\xf6\x61\
-\x19\x86\xd1\xbd\x76\x5d\x97\xb6\xed\x2d\x41\xb2\x03\x1e\xd1\xfc\
-\x5a\xf2\xdb\x24\x2c\xaa\xfb\xf6\xa0\x04\x8e\xe3\x40\xb9\x5c\xd6\
-\x4d\x24\x9d\x8c\x3a\x90\xec\x40\x4a\x09\xf5\x7a\x13\x72\xd9\x7b\
-\x2d\x9c\x5b\x9d\xea\x5a\xe6\x77\x7c\xd8\xb6\x1d\xf6\xc0\x6f\x03\
-\x7c\xf0\xf4\x26\x82\xc6\xc3\x49\x8d\x86\x82\x44\x22\xa1\x93\xf9\
-\x5a\x8f\x0e\xcd\x1e\x00\x7f\x07\xa4\xb3\xf4\x54\xae\xf1\x1c\x9e\
-\xb1\x78\xb8\xb7\x79\x7c\xf5\x52\x79\xad\x2a\x85\x3a\x99\x03\xb1\
-\x1d\x9d\x67\x51\x80\xc2\x8f\x38\x6b\xb9\x33\x0e\xc5\x58\x12\xd2\
-\xe9\x49\x98\xcd\xe4\xe4\xe9\xcd\x4f\x4d\x74\xbd\xe5\x85\xe8\x7d\
-\x15\x2a\x85\x3b\xb8\xdc\x66\xc0\x28\x83\x79\x12\x7f\xfc\x93\xb9\
-\x79\xcd\x4f\x01\x06\x00\xba\x01\xda\x2a\x98\x34\xd6\x68\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xfc\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x37\
-\x3a\x30\x31\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x37\x3a\x30\x31\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x37\x63\x39\x34\x39\x33\x35\x35\x2d\x66\x35\x36\x31\x2d\x63\x38\
-\x34\x30\x2d\x61\x36\x65\x32\x2d\x31\x64\x33\x34\x35\x36\x35\x38\
-\x66\x37\x39\x36\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x37\x63\x39\x34\x39\x33\x35\x35\x2d\x66\x35\x36\x31\x2d\x63\x38\
-\x34\x30\x2d\x61\x36\x65\x32\x2d\x31\x64\x33\x34\x35\x36\x35\x38\
-\x66\x37\x39\x36\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x37\x63\x39\x34\x39\x33\x35\x35\
-\x2d\x66\x35\x36\x31\x2d\x63\x38\x34\x30\x2d\x61\x36\x65\x32\x2d\
-\x31\x64\x33\x34\x35\x36\x35\x38\x66\x37\x39\x36\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x37\x63\x39\x34\x39\x33\x35\x35\x2d\x66\x35\x36\x31\x2d\
-\x63\x38\x34\x30\x2d\x61\x36\x65\x32\x2d\x31\x64\x33\x34\x35\x36\
-\x35\x38\x66\x37\x39\x36\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x77\x2d\xc5\xf2\x00\x00\x00\x6c\x49\x44\x41\x54\x38\
-\x8d\xed\x92\x41\x0e\x80\x30\x08\x04\x07\xe3\xc7\x79\x19\x4f\xc3\
-\x8b\x35\xa5\x85\x6a\xe2\xc1\x8b\x7b\xe9\x01\x98\x12\x76\xc5\xdd\
-\x69\x12\x11\x06\xb5\xe2\x55\xe8\xfb\x01\xb6\x71\xa2\x1f\x36\x03\
-\xb3\x00\x9a\xb4\x02\x3c\xd2\x0f\xa8\x01\x7e\x5e\x1f\x58\x3b\x91\
-\x01\xc2\xf0\x1d\x44\x92\x20\x95\x9e\x03\xb8\x7b\x48\xdb\xeb\x1b\
-\xec\xc5\x2f\x69\x73\x12\xf5\x7a\x03\x55\x0d\x6f\xa5\xef\x73\x30\
-\xba\xb0\x74\x00\x66\x17\x0e\x97\x71\x2a\x0b\x3f\x0b\x2b\x4d\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xf1\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x38\
-\x3a\x32\x33\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x38\x3a\x32\x33\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x62\x61\x62\x39\x64\x34\x37\x65\x2d\x33\x39\x32\x31\x2d\x64\x34\
-\x34\x38\x2d\x61\x33\x37\x34\x2d\x39\x63\x64\x39\x62\x33\x63\x38\
-\x30\x32\x63\x62\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x62\x61\x62\x39\x64\x34\x37\x65\x2d\x33\x39\x32\x31\x2d\x64\x34\
-\x34\x38\x2d\x61\x33\x37\x34\x2d\x39\x63\x64\x39\x62\x33\x63\x38\
-\x30\x32\x63\x62\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x62\x61\x62\x39\x64\x34\x37\x65\
-\x2d\x33\x39\x32\x31\x2d\x64\x34\x34\x38\x2d\x61\x33\x37\x34\x2d\
-\x39\x63\x64\x39\x62\x33\x63\x38\x30\x32\x63\x62\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x62\x61\x62\x39\x64\x34\x37\x65\x2d\x33\x39\x32\x31\x2d\
-\x64\x34\x34\x38\x2d\x61\x33\x37\x34\x2d\x39\x63\x64\x39\x62\x33\
-\x63\x38\x30\x32\x63\x62\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x1d\xf7\x61\x7d\x00\x00\x00\x61\x49\x44\x41\x54\x38\
-\x8d\xc5\x93\x51\x0a\xc0\x30\x08\x43\x9f\x63\xf7\xbf\x72\xf6\x55\
-\x18\x9d\x69\x1d\x0e\xe6\x4f\xa1\xda\xf8\x12\x68\x48\xa2\x53\x47\
-\xeb\x35\xc0\x86\x60\xdd\x94\x96\x04\x9a\xce\xb4\xda\x16\xaa\x02\
-\x96\xc2\x09\x08\x88\x2f\x09\x2c\x45\x26\x70\xdf\xbe\xa5\x78\x1b\
-\xe2\x83\xe2\xac\x0e\xba\x9a\x05\x5c\x78\x72\x33\x55\x0b\x36\x8b\
-\x41\x60\x37\x90\xdb\x19\x77\x11\xbf\xff\xc6\x0b\x3c\x96\x1c\x0f\
-\x9e\xf7\xc0\x20\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x01\x12\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x00\xb4\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\x03\x25\x80\x89\x81\x42\x40\xb1\x01\x2c\x28\xa6\
-\x31\x31\x85\x01\xa9\x30\x24\xa1\x7a\x28\xdd\x88\x2c\xf6\xef\xdf\
-\xbf\xab\x70\x1e\x28\x0c\x60\x98\x91\x91\x11\x84\x9d\x80\x78\x1d\
-\x94\x86\x89\xe9\x20\x8b\x21\xeb\xc1\xe6\x85\xd7\x50\x97\xbd\x46\
-\x12\xbb\x82\x45\x0c\x67\x18\x30\x02\x31\x33\x94\x46\x06\xd8\xc4\
-\x70\x1a\xc0\x8a\x45\x31\x2b\x29\x06\xb0\x60\x51\xcc\x42\xac\x01\
-\x9f\xa1\xb6\xa9\x20\x89\x19\x42\xc5\x3e\x63\xd8\x86\x9c\x12\x81\
-\xd1\x08\x63\xa6\x02\x71\x32\x9a\xda\xb9\x40\x3c\x1b\xc4\x00\x46\
-\x23\x76\x03\x40\x51\x84\x4c\xa3\x03\x98\x5a\x64\x3d\x2c\x68\x6a\
-\xf8\x81\xf8\x2a\x81\xfc\xa1\x03\xc4\x1f\x70\x19\x00\x02\x46\x38\
-\xc4\x41\xe0\x2f\xde\x30\x18\x90\xcc\x04\x10\x60\x00\x56\x78\x3d\
-\xa2\x4a\x00\xad\x78\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x07\x1c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x35\
-\x3a\x34\x34\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x35\x3a\x34\x34\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x31\x39\x38\x31\x33\x32\x33\x38\x2d\x61\x64\x30\x63\x2d\x65\x36\
-\x34\x39\x2d\x61\x62\x30\x31\x2d\x62\x38\x65\x64\x38\x33\x35\x35\
-\x37\x37\x65\x36\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x31\x39\x38\x31\x33\x32\x33\x38\x2d\x61\x64\x30\x63\x2d\x65\x36\
-\x34\x39\x2d\x61\x62\x30\x31\x2d\x62\x38\x65\x64\x38\x33\x35\x35\
-\x37\x37\x65\x36\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x31\x39\x38\x31\x33\x32\x33\x38\
-\x2d\x61\x64\x30\x63\x2d\x65\x36\x34\x39\x2d\x61\x62\x30\x31\x2d\
-\x62\x38\x65\x64\x38\x33\x35\x35\x37\x37\x65\x36\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x31\x39\x38\x31\x33\x32\x33\x38\x2d\x61\x64\x30\x63\x2d\
-\x65\x36\x34\x39\x2d\x61\x62\x30\x31\x2d\x62\x38\x65\x64\x38\x33\
-\x35\x35\x37\x37\x65\x36\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\xb1\xf0\x38\xab\x00\x00\x00\x8c\x49\x44\x41\x54\x38\
-\x8d\xb5\x93\x51\x12\x80\x20\x08\x44\x77\x3b\x99\x9e\x3c\x6f\xb6\
-\xfd\x24\x89\x62\xd6\x34\x31\xe3\x0f\xf2\x60\x05\xa4\x24\xfc\x6d\
-\x3a\x4f\x68\xdb\x0a\x5e\x29\x64\x57\xa9\xf5\x3b\x98\x64\xc4\x98\
-\x02\x8b\x2c\xa5\x0c\x95\x49\x42\x12\x4e\x9f\x93\xc4\x1e\x4e\x29\
-\x01\xfb\x1e\xeb\xcd\x79\x50\x6f\x3d\x78\x09\x9b\x92\xb1\x89\x35\
-\xb0\x05\x46\xb8\x16\x92\x7b\x02\xae\x06\xc9\x94\xcc\x61\x20\xe7\
-\xc5\x18\x17\x30\x00\xce\x14\x00\xd1\xf2\x74\x30\x70\xbf\x48\x6e\
-\xde\x11\x5c\x13\xf8\xc0\x28\xc9\x04\x6e\xed\x76\xdf\x1f\xdc\x5b\
-\xd0\x6b\xe3\xd7\xef\x7c\x00\xed\x3f\x44\xc4\x43\xcf\x59\x0d\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xe7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x00\x89\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\x03\x45\x80\x91\x91\x11\x84\x1b\x81\x78\x0d\x94\
-\xbd\x86\x48\x36\x48\x0f\xdc\x80\x75\x50\x9a\x14\x0c\xd3\xc3\x48\
-\x91\x0f\x98\xa0\xf4\x26\x32\xf4\x6e\x42\x36\x80\x99\x0c\x03\x98\
-\xa1\x61\x48\x1d\x2f\xec\x26\x43\xef\x6e\xda\x7b\x01\x96\xc8\xf0\
-\xa9\x81\xb9\xe0\x28\x2e\xcd\xe8\x6c\x24\x70\x14\xd9\x00\x16\x5c\
-\x9a\xf1\x88\xb1\x60\xf5\x02\xa1\xbc\x81\xcb\x3b\xb7\xc9\x08\xc4\
-\xdb\x30\x2f\xc8\x01\xf1\x1d\x20\x7e\x0e\x95\x78\x4e\x24\x1b\xa4\
-\x47\x0e\xe4\x1e\x7e\x20\xe6\x20\x23\x2a\xff\x02\xf1\x0f\x80\x00\
-\x03\x00\xe8\x78\x2e\x99\xd3\x0d\xdc\x19\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xe5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x38\
-\x3a\x35\x35\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x38\x3a\x35\x35\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x30\x65\x38\x39\x36\x32\x31\x39\x2d\x66\x61\x61\x36\x2d\x38\x63\
-\x34\x33\x2d\x62\x36\x33\x33\x2d\x63\x63\x39\x33\x30\x65\x30\x32\
-\x37\x64\x30\x66\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x30\x65\x38\x39\x36\x32\x31\x39\x2d\x66\x61\x61\x36\x2d\x38\x63\
-\x34\x33\x2d\x62\x36\x33\x33\x2d\x63\x63\x39\x33\x30\x65\x30\x32\
-\x37\x64\x30\x66\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x30\x65\x38\x39\x36\x32\x31\x39\
-\x2d\x66\x61\x61\x36\x2d\x38\x63\x34\x33\x2d\x62\x36\x33\x33\x2d\
-\x63\x63\x39\x33\x30\x65\x30\x32\x37\x64\x30\x66\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x30\x65\x38\x39\x36\x32\x31\x39\x2d\x66\x61\x61\x36\x2d\
-\x38\x63\x34\x33\x2d\x62\x36\x33\x33\x2d\x63\x63\x39\x33\x30\x65\
-\x30\x32\x37\x64\x30\x66\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\xb8\xa0\xf6\x8f\x00\x00\x00\x55\x49\x44\x41\x54\x38\
-\x8d\xa5\xd3\xdd\x0a\x00\x30\x04\x05\xe0\xf1\xfe\xef\x7c\x76\x63\
-\xb5\xd9\x9f\x83\x52\x28\x5f\x6e\x08\x80\x56\x0a\x03\x60\x49\xef\
-\xaa\xd5\x32\x66\x2c\xa2\x53\x9d\x42\xd4\xf5\x34\xe2\x01\x1a\x39\
-\x01\x14\x72\x03\xc2\xc8\x0b\x08\x21\x3f\xe0\x8b\x44\x80\x27\x12\
-\x05\xae\x08\x03\x1c\x11\x16\xd8\x10\xa9\x7e\x63\xe6\x82\x25\x3a\
-\x81\xef\x1a\x0f\x38\x27\x97\xf1\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x02\xcb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x6d\x49\x44\x41\x54\x78\xda\x8c\
-\x52\x4b\x6b\x13\x61\x14\x3d\xdf\xcc\xe4\xd9\x4c\x42\x0d\xc3\xa4\
-\x49\x4d\x9a\x20\xb1\x14\xc1\x65\xdb\x6d\x5c\xb6\xda\x2e\x5c\x8a\
-\x3b\xd1\xa5\x3b\xc1\x45\x20\x5d\x14\x04\x17\x5d\x08\x56\x14\x17\
-\x95\xba\xd1\x6d\x41\x29\xe8\x5f\xc8\xc2\x42\x4b\x83\xb4\x55\x84\
-\xd8\x34\xef\x4c\x1e\xe3\xcc\x78\xef\xd0\x47\x2a\x5a\xbc\x70\xf8\
-\x6e\xee\x77\xcf\x99\x73\x73\x3f\x71\x3b\x9f\xc7\x49\x08\x21\x6e\
-\xd2\x31\x86\xbf\xc7\x27\xdb\xb6\x4b\x84\x73\x45\xc5\x71\x9c\xd3\
-\x1f\x94\xc7\x5f\xe5\xf3\xab\x46\xbf\x0f\x8b\xea\x27\x77\xc5\x62\
-\x11\x6b\x9b\x9b\x0f\xf8\x1b\x84\xdd\x61\x01\xc9\xb6\x2c\x0c\x41\
-\x08\xfa\x82\x35\x18\xa0\xdb\xe9\xa0\xdd\x6e\xa3\xd5\x6a\xb9\xe7\
-\xfb\xa5\xa5\x55\xba\xbf\xd1\x33\x8c\x89\xfa\xd1\x11\x18\xa2\x52\
-\x81\x24\xed\xec\xb8\x89\x45\x02\x04\x21\x0b\x01\xbf\xa2\x20\xe0\
-\xf5\x42\x91\x24\x1e\x0b\xd5\x6a\x15\xcf\xd6\xd7\x91\x9b\x9a\x7a\
-\x5e\xda\xde\xbe\xf3\x7d\x7f\x1f\xe2\x58\x40\x71\x6d\x50\x83\xa7\
-\xdb\x45\x5f\xd7\x25\xf6\x28\xcb\x32\xfc\xc7\x16\xbb\xe4\x26\x97\
-\xcb\xb9\xe3\xa8\xaa\x8a\x8f\xc5\x62\xcd\x57\x2e\x43\x50\x3f\x0f\
-\xc8\x02\x12\x61\x8e\x0a\xf1\x0f\x2b\x2b\x99\x82\x10\xb8\x28\xb8\
-\x67\x71\x71\xf1\x3e\xa5\x3f\x08\x1b\xf2\xe4\xe4\x64\x94\xb0\x50\
-\x28\x14\x9e\x36\x9b\xcd\x59\x4d\xd3\x5c\xdb\x0a\x8d\x31\x0c\xd7\
-\x95\xdf\x8f\x6c\x36\x3b\xbb\xbc\xbc\x3c\x5f\x2a\x95\x76\x2a\x95\
-\xca\x17\xc5\x34\x4d\x2d\x16\x8b\xa5\x89\x8c\x7a\xbd\x8e\x70\x38\
-\xec\x9e\x7d\xda\x44\xb3\xd9\x02\xd7\x7b\xbd\x1e\xa8\x0f\xd1\x68\
-\x14\x91\x48\x18\x5b\x5b\xbb\x08\x85\xd4\x34\x73\x59\x40\x4f\x24\
-\x12\xa9\x5a\xad\x06\x52\x24\x81\x08\xf6\xf6\xbe\xc1\x30\xba\x38\
-\x5b\xb1\x0c\x8f\x47\x26\x11\xdb\xed\xe9\xf5\x7e\x61\x64\x64\x34\
-\xc5\x5c\x69\x30\x18\xc4\x48\x20\xd9\xa1\xb5\x1d\xf1\x7a\xea\x1d\
-\xd8\xb6\x42\x76\x55\x04\x02\xe1\x73\x90\x24\xaf\xdb\xb3\x71\xeb\
-\x1d\xc6\xc6\x52\x49\xe6\x2a\x64\x55\x23\xcb\x19\xbe\x60\x17\x4c\
-\x0e\x04\xd4\x7f\xfe\x89\xdc\x33\xfd\x7a\x1a\xbe\x4b\x83\x0c\x73\
-\x59\xc0\x1f\x0c\x86\xc8\x16\xad\x62\x6e\x01\xa9\xd4\x55\x12\xe1\
-\x57\x38\xbc\x8d\xb3\x7c\x7c\x5c\x47\x32\x79\xdd\xcd\x99\xab\x18\
-\x86\xe1\x31\x4d\x81\x60\x50\xa5\x07\xf3\xd3\xc5\xff\x06\x73\x45\
-\x24\x12\x79\x48\x2b\xd2\xb8\xd0\x68\x34\xe4\x83\x83\x83\x47\x77\
-\xd7\xc8\xcd\x35\xc0\x27\x76\xf1\xf6\xf3\x0b\xd4\xcb\x69\x8c\xaa\
-\x97\xf1\xe6\xf1\x3c\xae\x4c\x4c\x3c\x21\x8e\xc5\xfd\xf4\x72\x0f\
-\xf9\xe4\x81\xe3\x0c\x7d\x66\x66\xc9\xf9\x23\x2c\x9a\x87\x61\x5a\
-\x96\x63\xd2\xc9\x3d\x27\xfd\xcc\x3d\x1d\xce\xa7\xeb\xf0\x68\xda\
-\x3d\xc7\xb6\x33\x17\xd9\x16\x92\xf4\xd5\x3c\x3c\x7c\xd9\xa7\xe7\
-\xcc\xf1\x5b\x80\x01\x00\x49\x55\x5c\xb5\x47\x6c\x1a\x9a\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\xf6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x02\x98\x49\x44\x41\x54\x78\xda\x8c\
-\x93\xcb\x4f\x53\x41\x14\xc6\xbf\xfb\x6a\xa1\xb7\x48\x2d\x54\x6d\
-\x29\x5a\x82\x22\xc8\x4b\xf0\x19\xf0\x91\xe8\x02\x23\x0b\xd1\xc6\
-\xbd\x3b\x63\x62\x5c\x60\xa2\x1b\xfc\x13\xd8\x18\x56\x06\x97\xc2\
-\x42\x8c\x09\x21\xc1\x10\x1e\x89\x51\x17\x52\xa2\x71\x61\x7c\x14\
-\x0c\x4a\x4a\xa5\xa4\x62\xdb\x6b\xdb\xfb\x98\x71\xe6\x42\x49\x1b\
-\x43\xe2\x49\xbe\xdc\xcc\x9d\x39\x67\x7e\xe7\x31\x82\xd8\x77\x1f\
-\x5b\x76\x9d\x29\x88\xff\xb3\x15\xa6\xa7\xe1\x36\x27\x64\xd0\xed\
-\x9f\xb5\x43\xfd\x37\x06\xa3\x2b\x71\x80\x52\x84\xfc\xd5\xa8\xa9\
-\xf2\x40\x91\xe5\x12\x4f\x45\x91\xd1\x7b\x6f\xf0\xee\xf9\x83\x0e\
-\x7b\x2d\xf3\xc3\x5b\x26\x06\xab\x2a\xe1\xf7\xa8\xd8\xd0\x72\xf8\
-\x16\x4b\x60\xf2\xe5\x2b\x9c\x6d\xa9\x2b\x09\xe0\x50\x14\x74\x04\
-\xe5\xae\x6a\x55\xd0\xd8\x32\x56\x4c\x20\x12\x42\x90\xcb\xe5\x51\
-\x26\x09\xe8\x6c\x08\x41\xca\xa5\x70\xfb\xd2\x19\xa8\x2e\x17\x04\
-\x51\xdc\x3e\xd8\x7f\xe5\x62\x58\x00\xc2\xd7\x06\x06\x6e\x15\x13\
-\x48\x96\x45\xc1\xc5\xcd\xb2\x08\x46\xde\x12\xcc\x2d\xa7\x50\xee\
-\x48\x21\x10\x08\xc0\x29\x01\x5d\xf5\xc0\xae\x32\xe0\x72\x33\x85\
-\x69\x18\x62\x49\x0a\xa5\x01\x28\x7c\xd2\x77\x9c\xf4\x09\x90\xd9\
-\xe5\x4e\x25\x06\x93\xb0\x1a\xe8\x15\x68\x0a\x1d\x86\x49\xff\x0d\
-\x20\xf1\x14\xb8\xb8\xf1\x6f\x67\xc8\x87\x3b\xbd\xed\xf6\x9a\x13\
-\x30\x6c\x8c\xcc\xcd\xa3\x92\x11\x98\x6c\xdf\xd0\x75\x16\x80\x60\
-\x87\x14\x28\xe2\x5f\x87\xf1\x71\xf2\xa6\xdd\x95\x84\x57\x44\xeb\
-\xd5\x35\x68\xf9\x5f\x10\x85\x1c\x0c\x22\x42\xd7\x75\x49\xb4\x09\
-\x36\x25\x99\x8c\xb1\x58\x92\xec\x80\xbb\xd2\x0d\x57\x85\x0b\x2e\
-\x55\xb5\xb1\x97\x36\x80\xd9\x55\xc9\x26\xd0\xf3\x79\x4e\x40\x77\
-\x24\x70\x56\x78\x10\x68\x3f\x0a\x2d\xbe\x0a\x55\xcc\xd8\x4e\xb9\
-\x2c\x90\xd6\x44\x46\x60\xf0\x00\x8c\x20\xf9\xa3\x40\x20\x13\x16\
-\xac\x58\x26\xd8\x20\xa9\x8d\xa0\xce\x7a\x58\xc4\xcd\x9c\x08\x9a\
-\xf7\x18\xe8\xa9\xcf\x42\x66\x03\xa6\xa5\xd3\x8a\x4c\x16\xc6\x20\
-\x76\x84\x01\x4f\x50\xe6\xad\xe3\x2a\xb4\x31\xb5\xbe\x88\xb5\xe8\
-\x02\x62\x51\x1d\x65\xd4\x44\xdb\x09\x82\xd1\xf1\x29\x4c\xcc\x44\
-\x30\xfd\xfa\xcd\xbc\x93\x24\x7f\xf2\xe9\x28\x27\xef\x9e\x79\xa9\
-\x61\xb9\x0b\x29\x14\x94\xfa\x6d\x61\xf9\x5b\x06\x4b\xd1\x2c\x3e\
-\x7f\x32\x6c\x82\x86\x43\xed\x18\x9f\x5f\x1f\xfe\xb3\x61\x3d\x48\
-\x46\x22\x4f\xf8\xa0\xb3\xa6\xc0\xcb\x52\x49\x8c\x4e\xcc\xbe\xef\
-\xee\x6c\x39\xe0\xf7\x79\x77\xf3\x14\x3c\xfb\xfb\x50\xdb\xf5\x90\
-\x09\xd8\xeb\xf7\xdb\xd8\xcf\x5f\x4c\x7d\x40\x32\x97\xa0\x5f\x66\
-\x16\xb9\xaf\x50\xa8\xa0\x50\x73\x1c\xa8\x3b\xdd\xc3\x6a\x71\xae\
-\xae\x66\x5f\x63\xf7\xb1\xd6\xa6\xd1\xb1\x31\x94\xa7\x23\xd3\xa2\
-\xc3\x91\x15\x24\xc9\xb4\x53\xd3\xb4\xd5\x4c\x3c\x33\x44\x53\xb1\
-\x4d\xbf\x92\x00\xa1\x53\x9b\x05\xb5\xe8\x11\xf6\x46\x2e\xc0\xd2\
-\xfd\x74\xe1\xf1\x23\xb6\x6d\x14\xbd\xa7\xf4\x96\x6c\xfb\x2b\xc0\
-\x00\x63\x89\x62\xa1\x4d\x81\xe1\x0b\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x00\xf7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x00\x99\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\x03\x25\x80\x89\x81\x42\x30\xf0\x06\xb0\x60\x98\
-\xc8\x04\x37\x53\x1b\x88\x1b\xd1\xa4\xeb\xff\xfd\xfb\x77\x15\x45\
-\x04\x14\x88\xc8\x98\x91\x91\x11\x19\xeb\x00\xf1\x7a\x20\xee\x81\
-\x89\xa1\xab\x67\x22\xc2\x8b\xac\x40\xbc\x90\xdc\x30\xb0\x00\xe2\
-\x3f\x40\x7c\x99\x5c\x03\xfc\x81\x78\x27\xb9\xb1\x60\x04\xc4\x02\
-\x40\x7c\x02\x39\xbc\x08\xc6\x02\x2c\x20\x81\xa0\x08\x88\xd9\x81\
-\x7c\x66\xbc\x6e\x44\x0f\x55\x20\xb0\x05\xe2\x87\x68\xd8\x1d\x88\
-\xc5\xa1\x06\xa2\xc6\x1a\xba\xb3\x80\xb6\x73\x03\x29\x3e\x10\x13\
-\xcd\xae\xbf\x40\xfc\x01\xa8\xfe\x27\x8a\xfa\xa1\x9f\x99\x00\x02\
-\x0c\x00\x5d\xaf\x57\xc1\x39\xda\xb9\xde\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x06\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x36\
-\x3a\x32\x32\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x36\x3a\x32\x32\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x39\x61\x39\x63\x38\x36\x39\x65\x2d\x38\x31\x64\x63\x2d\x37\x62\
-\x34\x34\x2d\x39\x35\x34\x31\x2d\x66\x61\x30\x31\x33\x34\x39\x36\
-\x39\x37\x62\x31\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x39\x61\x39\x63\x38\x36\x39\x65\x2d\x38\x31\x64\x63\x2d\x37\x62\
-\x34\x34\x2d\x39\x35\x34\x31\x2d\x66\x61\x30\x31\x33\x34\x39\x36\
-\x39\x37\x62\x31\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x39\x61\x39\x63\x38\x36\x39\x65\
-\x2d\x38\x31\x64\x63\x2d\x37\x62\x34\x34\x2d\x39\x35\x34\x31\x2d\
-\x66\x61\x30\x31\x33\x34\x39\x36\x39\x37\x62\x31\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x39\x61\x39\x63\x38\x36\x39\x65\x2d\x38\x31\x64\x63\x2d\
-\x37\x62\x34\x34\x2d\x39\x35\x34\x31\x2d\x66\x61\x30\x31\x33\x34\
-\x39\x36\x39\x37\x62\x31\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x2c\xd1\x16\xce\x00\x00\x00\x76\x49\x44\x41\x54\x38\
-\x8d\xd5\x92\x41\x12\xc0\x20\x08\x03\x93\xf6\x65\xfe\xcc\x9f\xe1\
-\xcf\xe8\x81\xb6\xd2\x03\x8a\xde\x9a\x13\x38\xb3\x10\x32\x12\xeb\
-\x52\x57\xf3\x58\x85\x5b\x6b\x9f\x9e\x9b\x9b\xbb\x85\x5d\x70\x65\
-\xc0\x68\x48\x2a\x03\x55\x8d\xdd\x9f\x59\x98\x24\x5c\x80\x29\xe7\
-\xfa\xa8\xd6\xaa\xe8\x67\x0c\x33\x99\xc1\x29\xbd\x30\x44\x7e\x00\
-\x5b\x9a\x22\x8a\x52\x00\x11\x7b\xf5\xb5\xf5\x61\xea\xbc\xb7\x19\
-\xf4\xc8\xc3\x93\x21\xdd\x41\xa4\xc1\x76\x00\x60\xf0\xcb\xd2\xba\
-\x00\xe5\x53\x63\xc8\x78\x03\x56\xc4\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x07\x09\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x33\
-\x3a\x32\x33\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x30\x33\x3a\x32\x33\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x33\x38\x31\x34\x33\x31\x32\x64\x2d\x35\x39\x37\x66\x2d\x66\x35\
-\x34\x30\x2d\x61\x32\x37\x37\x2d\x31\x35\x31\x66\x35\x33\x63\x39\
-\x34\x66\x38\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x33\x38\x31\x34\x33\x31\x32\x64\x2d\x35\x39\x37\x66\x2d\x66\x35\
-\x34\x30\x2d\x61\x32\x37\x37\x2d\x31\x35\x31\x66\x35\x33\x63\x39\
-\x34\x66\x38\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x33\x38\x31\x34\x33\x31\x32\x64\
-\x2d\x35\x39\x37\x66\x2d\x66\x35\x34\x30\x2d\x61\x32\x37\x37\x2d\
-\x31\x35\x31\x66\x35\x33\x63\x39\x34\x66\x38\x33\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x33\x38\x31\x34\x33\x31\x32\x64\x2d\x35\x39\x37\x66\x2d\
-\x66\x35\x34\x30\x2d\x61\x32\x37\x37\x2d\x31\x35\x31\x66\x35\x33\
-\x63\x39\x34\x66\x38\x33\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\xa9\x2b\x29\xa1\x00\x00\x00\x79\x49\x44\x41\x54\x38\
-\x8d\xa5\x93\x41\x0e\x80\x20\x0c\x04\x77\x8d\x0f\x83\x97\xc3\xcf\
-\xd6\x03\x28\xd1\xd0\xa6\xa6\x7b\x81\x04\x66\x42\xa1\x50\x12\x32\
-\x39\x52\x34\x80\x13\x00\x48\x7a\x7b\xac\x23\x52\xd2\x10\x78\xf0\
-\x28\x91\xd3\xb3\x46\x72\x4c\xbc\x12\x3c\xf8\x89\x25\x70\xe1\xd6\
-\x7c\x41\x18\xde\x09\x42\x70\xad\xc0\x5c\x7c\x09\x7e\xc3\xc0\x7c\
-\x0a\x92\xea\xbd\x6f\x2f\xa3\x94\x62\xc2\x92\xe2\x8d\xf4\x85\xef\
-\x84\x04\x16\x0c\xac\x12\x00\xbb\xe3\x4c\x58\xd2\x10\x64\x92\xfe\
-\x4c\x69\xc1\x05\x02\x19\x4a\x13\xf8\xde\x32\x32\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xe8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x30\x31\x3a\x33\x31\
-\x3a\x35\x31\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x30\x31\x3a\x33\x31\x3a\x35\x31\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x62\x66\x30\x65\x61\x65\x34\x31\x2d\x39\x63\x62\x33\x2d\x66\x63\
-\x34\x33\x2d\x39\x64\x35\x61\x2d\x34\x37\x38\x31\x33\x61\x34\x33\
-\x61\x34\x34\x31\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x62\x66\x30\x65\x61\x65\x34\x31\x2d\x39\x63\x62\x33\x2d\x66\x63\
-\x34\x33\x2d\x39\x64\x35\x61\x2d\x34\x37\x38\x31\x33\x61\x34\x33\
-\x61\x34\x34\x31\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x62\x66\x30\x65\x61\x65\x34\x31\
-\x2d\x39\x63\x62\x33\x2d\x66\x63\x34\x33\x2d\x39\x64\x35\x61\x2d\
-\x34\x37\x38\x31\x33\x61\x34\x33\x61\x34\x34\x31\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x62\x66\x30\x65\x61\x65\x34\x31\x2d\x39\x63\x62\x33\x2d\
-\x66\x63\x34\x33\x2d\x39\x64\x35\x61\x2d\x34\x37\x38\x31\x33\x61\
-\x34\x33\x61\x34\x34\x31\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x9b\xf6\xe4\x62\x00\x00\x00\x58\x49\x44\x41\x54\x38\
-\x8d\xb5\x51\x49\x12\x00\x20\x08\xca\xfe\xff\x67\x3b\x35\x63\x2a\
-\xe5\x32\x71\x29\x0d\x08\x6b\x0c\x0b\x76\x7a\x10\x13\xf4\x6f\x26\
-\xc7\x19\x32\xa0\x82\xf1\x53\x10\x16\x6b\xe2\xb5\x46\x23\x48\xa0\
-\x71\xfe\x20\x32\x27\xe4\x64\x5e\xd8\x70\xd3\xdf\xb3\x35\x24\xc4\
-\x7a\xef\x5d\x20\x39\xe1\x78\x95\x74\x3d\xb0\x5a\x4b\x06\xad\xd8\
-\x29\xf1\x02\x5e\xd3\x19\xf3\xbf\xe8\xb7\x18\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xce\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\
-\x00\x41\x64\x6f\x62\x65\x20\x49\x6d\x61\x67\x65\x52\x65\x61\x64\
-\x79\x71\xc9\x65\x3c\x00\x00\x00\x70\x49\x44\x41\x54\x78\xda\x62\
-\xfc\xff\xff\x3f\x03\x25\x80\x89\x81\x42\x40\xb1\x01\x8c\x40\x00\
-\xa2\x1b\x81\x58\x9b\x04\x7d\x57\x81\xb8\xfe\xdf\xbf\x7f\x70\x03\
-\xc8\x02\x20\x03\x28\xf6\x02\x0b\x94\xde\x4a\x86\x5e\x6f\x64\x03\
-\x58\x29\x0d\xc4\x81\x0f\x83\x13\x64\xe8\xb5\x40\x36\x80\x93\x6c\
-\x17\x00\xf3\x82\x1c\x90\x7e\x02\xc4\xfa\x24\xe8\xbb\x08\xc4\x20\
-\x7d\x8f\x40\x21\xc8\x0f\x75\x01\x29\xe1\xf1\x0f\x88\xbf\x03\x2d\
-\xff\xc8\x38\xe0\xb9\x11\x20\xc0\x00\xd1\xe1\x1f\x20\x10\xae\x80\
-\x3f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x65\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x33\
-\x3a\x34\x38\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x33\x3a\x34\x38\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x39\x64\x63\x34\x36\x31\x63\x36\x2d\x39\x34\x35\x32\x2d\x32\x32\
-\x34\x34\x2d\x39\x37\x66\x31\x2d\x31\x65\x66\x63\x31\x65\x36\x31\
-\x65\x38\x34\x39\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x39\x64\x63\x34\x36\x31\x63\x36\x2d\x39\x34\x35\x32\x2d\x32\x32\
-\x34\x34\x2d\x39\x37\x66\x31\x2d\x31\x65\x66\x63\x31\x65\x36\x31\
-\x65\x38\x34\x39\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x39\x64\x63\x34\x36\x31\x63\x36\
-\x2d\x39\x34\x35\x32\x2d\x32\x32\x34\x34\x2d\x39\x37\x66\x31\x2d\
-\x31\x65\x66\x63\x31\x65\x36\x31\x65\x38\x34\x39\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x39\x64\x63\x34\x36\x31\x63\x36\x2d\x39\x34\x35\x32\x2d\
-\x32\x32\x34\x34\x2d\x39\x37\x66\x31\x2d\x31\x65\x66\x63\x31\x65\
-\x36\x31\x65\x38\x34\x39\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\x4f\xf1\x5b\x8d\x00\x00\x01\xd5\x49\x44\x41\x54\x38\
-\x8d\x95\x93\xcf\x6b\x13\x51\x10\xc7\x3f\xb3\xd9\xdd\x6c\x68\x24\
-\x6d\x13\xb0\x6d\x14\x62\x2f\x0a\xd6\xc3\xf6\x20\xd5\x5e\x04\x41\
-\x29\x82\x07\x6f\x05\x03\x1e\x15\x05\x41\x88\x57\xef\x52\x6f\x5e\
-\xbd\xe8\xa5\x78\xf5\x14\x7f\x14\xff\x00\x69\xf0\x17\x18\x08\x14\
-\x0f\x82\x62\x91\xa4\xd4\x64\x37\xdd\x7d\xe3\x21\x69\x9a\x18\x5d\
-\x71\xe0\x7b\x78\xf0\xe6\xf3\x9d\x99\xf7\x46\x8e\xaf\xae\x9d\xaf\
-\xaf\x57\x5e\x78\xf9\xd2\xa3\x60\x7b\xeb\x3a\x10\x2f\xde\x7d\x0e\
-\x80\xaa\x92\x14\x9b\xf7\x2f\x00\x60\xea\xf5\xfa\x7b\x40\xbd\xe9\
-\xa3\xeb\x13\x47\x16\xee\x78\x85\x52\xd9\xb2\xd3\xcb\x40\x01\x98\
-\x04\xa4\x9f\x73\x1a\x48\x03\xf8\x95\x6a\xcf\xc0\xaf\x54\x97\x40\
-\x8c\x7b\xa8\xb0\x01\x18\x40\x87\x74\x70\x16\x2b\x40\x24\xce\x9f\
-\xba\x78\x6b\xbf\x82\xe1\x0a\x3d\x60\xb6\xef\x30\x0f\x64\xd3\x53\
-\xc5\xd2\xcc\xd9\xab\xfe\xcc\x72\x79\xc5\x72\xbc\xcf\xbd\xfb\xfa\
-\xa6\x0f\xdc\x18\x00\xfc\x4a\x35\xb1\xcf\xfd\x38\x76\xf9\xde\x25\
-\x40\x25\x65\xff\x00\xe6\xfe\x1b\x00\x60\x39\xde\x16\x10\x0f\xb7\
-\x20\x49\x00\x55\x45\x55\x79\xfb\x60\x05\x80\xc9\x13\xe7\xca\xcd\
-\x4f\xaf\x1f\x03\x39\x60\x47\x55\xb1\x93\x1c\x55\x95\x28\x8a\x38\
-\x79\xfb\x19\x00\x8d\x27\x37\xb3\xf4\x66\x30\x09\xec\x00\x58\x49\
-\x80\x6e\xb7\x8b\x31\x66\xa0\xbd\xdd\xed\x77\x80\xb8\x53\xc5\x81\
-\xf1\x1f\x01\xc6\x18\xda\xed\xf6\x48\xb2\x31\x06\xd3\x6d\x37\x41\
-\xcc\xf4\xe2\x95\x89\xbf\x02\xe2\x38\xa6\xd3\xe9\x0c\xfa\x1f\x16\
-\xe0\x82\xca\xd7\x57\x0f\x37\x81\xc3\x22\x72\x00\x10\x11\xe2\x38\
-\x26\x0c\xc3\x71\xe7\xbe\x80\x5a\x76\xfe\xcc\x0d\x04\x01\xf2\xc0\
-\xe8\x10\x6d\xdb\xa6\xd9\x6c\x26\x8d\x65\x35\xfc\xd6\xb8\x86\x6a\
-\x4a\xec\xf4\x4b\x8d\xc2\x39\xeb\xf7\x85\xc9\xe5\x72\x64\x32\x19\
-\xa2\x28\x1a\x13\xf0\x74\xef\xe7\xf7\xa5\x5a\xad\xf6\x41\xa3\x70\
-\x16\xf0\xc6\x9e\xd1\x71\x1c\x5c\xd7\xc5\x71\x1c\x5a\xad\x16\x41\
-\x10\x8c\x8c\x48\xec\xf4\x17\xdf\xf7\x17\x2c\x2f\xdb\x30\xc1\xae\
-\x27\xff\x5a\xd9\xe1\x10\x11\x80\x22\x90\xa2\xf7\x17\x3e\xfe\x02\
-\x3a\x70\xf5\x80\x15\x3e\x09\xce\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x07\x05\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x30\x31\x3a\x33\x38\
-\x3a\x31\x31\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x30\x31\x3a\x33\x38\x3a\x31\x31\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x36\x35\x36\x31\x65\x63\x62\x32\x2d\x62\x66\x65\x64\x2d\x61\x65\
-\x34\x38\x2d\x61\x66\x38\x63\x2d\x64\x35\x34\x62\x39\x30\x39\x37\
-\x64\x63\x62\x64\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x36\x35\x36\x31\x65\x63\x62\x32\x2d\x62\x66\x65\x64\x2d\x61\x65\
-\x34\x38\x2d\x61\x66\x38\x63\x2d\x64\x35\x34\x62\x39\x30\x39\x37\
-\x64\x63\x62\x64\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x36\x35\x36\x31\x65\x63\x62\x32\
-\x2d\x62\x66\x65\x64\x2d\x61\x65\x34\x38\x2d\x61\x66\x38\x63\x2d\
-\x64\x35\x34\x62\x39\x30\x39\x37\x64\x63\x62\x64\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x36\x35\x36\x31\x65\x63\x62\x32\x2d\x62\x66\x65\x64\x2d\
-\x61\x65\x34\x38\x2d\x61\x66\x38\x63\x2d\x64\x35\x34\x62\x39\x30\
-\x39\x37\x64\x63\x62\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\xb8\x6a\x8f\x42\x00\x00\x00\x75\x49\x44\x41\x54\x38\
-\x8d\xad\x93\x5d\x0e\xc0\x20\x08\x83\xc1\xfb\xdf\x69\xdc\xac\x7b\
-\xd1\x85\x3a\x08\x1a\x6d\x42\x20\xea\x57\x89\x3f\x0a\x40\x2e\xe9\
-\x01\xe7\xb9\x8e\xd5\xc6\x42\x33\xa5\xec\x60\xb8\x88\x77\x36\x33\
-\xf8\xec\xc1\xa1\x65\x13\x37\x18\xc0\xe8\x51\xc3\x9f\xc1\x1f\x46\
-\xd4\x49\xdc\x01\xc3\xa9\x49\xda\xc1\x9e\x49\x72\x38\x85\x89\xa0\
-\xf1\xd5\x85\x52\x2e\xd1\xb3\xfa\xb9\xfa\xc1\x70\x27\x74\x88\x4b\
-\xf0\x6c\x32\x6b\xcb\xe4\x2a\x2c\x7a\xfa\x1b\xdb\x11\x2d\x22\x2f\
-\xcf\xfd\xa1\x3b\x20\xc4\x83\x91\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x06\xf8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xff\x61\
-\x00\x00\x01\x37\x69\x43\x43\x50\x41\x64\x6f\x62\x65\x20\x52\x47\
-\x42\x20\x28\x31\x39\x39\x38\x29\x00\x00\x28\x91\x95\x8f\xbf\x4a\
-\xc3\x50\x14\x87\xbf\x1b\x45\xc5\xa1\x56\x08\xe2\xe0\x70\x27\x51\
-\x50\x6c\xd5\xc1\x8c\x49\x5b\x8a\x20\x58\xab\x43\x92\xad\x49\x43\
-\x95\x62\x12\x6e\xae\x7f\xfa\x10\x8e\x6e\x1d\x5c\xdc\x7d\x02\x27\
-\x47\xc1\x41\xf1\x09\x7c\x03\xc5\xa9\x83\x43\x84\x0c\x05\x8b\xdf\
-\xf4\x9d\xdf\x39\x1c\xce\x01\xa3\x62\xd7\x9d\x86\x51\x86\xf3\x58\
-\xab\x76\xd3\x91\xae\xe7\xcb\xd9\x17\x66\x98\x02\x80\x4e\x98\xa5\
-\x76\xab\x75\x00\x10\x27\x71\xc4\x18\xdf\xef\x08\x80\xd7\x4d\xbb\
-\xee\x34\xc6\xfb\x7f\x32\x1f\xa6\x4a\x03\x23\x60\xbb\x1b\x65\x21\
-\x88\x0a\xd0\xbf\xd2\xa9\x06\x31\x04\xcc\xa0\x9f\x6a\x10\x0f\x80\
-\xa9\x4e\xda\x35\x10\x4f\x40\xa9\x97\xfb\x1b\x50\x0a\x72\xff\x00\
-\x4a\xca\xf5\x7c\x10\x5f\x80\xd9\x73\x3d\x1f\x8c\x39\xc0\x0c\x72\
-\x5f\x01\x4c\x1d\x5d\x6b\x80\x5a\x92\x0e\xd4\x59\xef\x54\xcb\xaa\
-\x65\x59\xd2\xee\x26\x41\x24\x8f\x07\x99\x8e\xce\x33\xb9\x1f\x87\
-\x89\x4a\x13\xd5\xd1\x51\x17\xc8\xef\x03\x60\x31\x1f\x6c\x37\x1d\
-\xb9\x56\xb5\xac\xbd\xf5\x7f\xfe\x3d\x11\xd7\xf3\x65\x6e\x9f\x47\
-\x08\x40\x2c\x3d\x17\x59\x41\x78\xa1\x2e\x7f\x55\x18\x3b\x93\xeb\
-\x62\xc7\x70\x19\x0e\xef\x61\x7a\x54\x64\xbb\x37\x70\xb7\x01\x0b\
-\xb7\x45\xb6\x5a\x85\xf2\x16\x3c\x0e\x7f\x00\xc0\xc6\x4f\xfd\xf3\
-\x53\x3f\xc8\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\
-\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x04\xf3\x69\x54\x58\x74\
-\x58\x4d\x4c\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\
-\x70\x00\x00\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\
-\x62\x65\x67\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\
-\x57\x35\x4d\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\
-\x4e\x54\x63\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\
-\x6d\x70\x6d\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\
-\x61\x64\x6f\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\
-\x78\x3a\x78\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\
-\x4d\x50\x20\x43\x6f\x72\x65\x20\x35\x2e\x36\x2d\x63\x31\x34\x35\
-\x20\x37\x39\x2e\x31\x36\x33\x34\x39\x39\x2c\x20\x32\x30\x31\x38\
-\x2f\x30\x38\x2f\x31\x33\x2d\x31\x36\x3a\x34\x30\x3a\x32\x32\x20\
-\x20\x20\x20\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\
-\x44\x46\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\
-\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\
-\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\
-\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\
-\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\
-\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\
-\x78\x6d\x70\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\
-\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\
-\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\
-\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\
-\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\
-\x6d\x6c\x6e\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\
-\x63\x6f\x6d\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\
-\x30\x2f\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\
-\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\
-\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\
-\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\
-\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\
-\x2f\x52\x65\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\
-\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\
-\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
-\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\x64\x6f\
-\x77\x73\x29\x22\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\
-\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\
-\x30\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\
-\x78\x6d\x70\x3a\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\
-\x32\x30\x32\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x36\
-\x3a\x30\x31\x2b\x31\x30\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\
-\x65\x74\x61\x64\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\
-\x30\x2d\x31\x31\x2d\x32\x38\x54\x31\x33\x3a\x31\x36\x3a\x30\x31\
-\x2b\x31\x30\x3a\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\
-\x74\x3d\x22\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\
-\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\
-\x65\x3d\x22\x33\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
-\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
-\x62\x63\x34\x38\x62\x38\x34\x35\x2d\x38\x35\x36\x64\x2d\x39\x62\
-\x34\x62\x2d\x38\x64\x33\x38\x2d\x61\x63\x31\x34\x38\x64\x31\x61\
-\x65\x64\x63\x35\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
-\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\x70\x2e\x64\x69\x64\x3a\
-\x62\x63\x34\x38\x62\x38\x34\x35\x2d\x38\x35\x36\x64\x2d\x39\x62\
-\x34\x62\x2d\x38\x64\x33\x38\x2d\x61\x63\x31\x34\x38\x64\x31\x61\
-\x65\x64\x63\x35\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\
-\x69\x6e\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\
-\x78\x6d\x70\x2e\x64\x69\x64\x3a\x62\x63\x34\x38\x62\x38\x34\x35\
-\x2d\x38\x35\x36\x64\x2d\x39\x62\x34\x62\x2d\x38\x64\x33\x38\x2d\
-\x61\x63\x31\x34\x38\x64\x31\x61\x65\x64\x63\x35\x22\x3e\x20\x3c\
-\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\
-\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\
-\x20\x73\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\
-\x72\x65\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\
-\x73\x74\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\
-\x64\x3a\x62\x63\x34\x38\x62\x38\x34\x35\x2d\x38\x35\x36\x64\x2d\
-\x39\x62\x34\x62\x2d\x38\x64\x33\x38\x2d\x61\x63\x31\x34\x38\x64\
-\x31\x61\x65\x64\x63\x35\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\
-\x65\x6e\x3d\x22\x32\x30\x32\x30\x2d\x30\x35\x2d\x32\x30\x54\x30\
-\x36\x3a\x32\x34\x3a\x30\x36\x2b\x31\x30\x3a\x30\x30\x22\x20\x73\
-\x74\x45\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\
-\x6e\x74\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\
-\x68\x6f\x70\x20\x43\x43\x20\x32\x30\x31\x39\x20\x28\x57\x69\x6e\
-\x64\x6f\x77\x73\x29\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\
-\x65\x71\x3e\x20\x3c\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\
-\x6f\x72\x79\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\
-\x69\x70\x74\x69\x6f\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x20\x3c\x2f\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\
-\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\
-\x22\x3f\x3e\xfd\xdc\x3d\x86\x00\x00\x00\x68\x49\x44\x41\x54\x38\
-\x8d\xb5\x93\xc1\x0d\xc0\x20\x0c\x03\xcf\x55\x07\x63\x74\x36\x73\
-\x1f\x95\x78\xa0\x50\xa0\x69\xfd\x8c\x14\x9f\x03\x89\x6c\x93\xd1\
-\x09\x20\xa9\xaf\xaf\xb8\xca\xf6\x6d\x10\xa9\xd6\x1a\xd6\x4b\x29\
-\x00\x8d\x78\x2c\x90\x1e\x15\x19\x78\x95\xfe\x4b\x82\x2d\xfa\xe7\
-\x09\xb6\xe9\xc0\xf8\x1b\xbb\x66\x88\x77\x43\x53\x83\x49\xaa\x36\
-\xc2\x30\xfe\x4c\xe9\x47\x94\x6d\x24\xbd\xba\x28\xdb\x52\xf6\x1a\
-\xd3\x23\x5c\x9e\x28\x28\x1d\x9b\x03\xb3\x01\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0d\
-\x05\x47\xb1\xc7\
-\x00\x65\
-\x00\x64\x00\x69\x00\x74\x00\x2d\x00\x62\x00\x6f\x00\x6c\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x12\
-\x05\xb0\x87\xc7\
-\x00\x64\
-\x00\x6f\x00\x63\x00\x75\x00\x6d\x00\x65\x00\x6e\x00\x74\x00\x2d\x00\x69\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x70\x00\x6e\
-\x00\x67\
-\x00\x0a\
-\x09\xf1\x8f\xc7\
-\x00\x70\
-\x00\x65\x00\x6e\x00\x63\x00\x69\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x07\xef\x0e\xa7\
-\x00\x6c\
-\x00\x61\x00\x79\x00\x65\x00\x72\x00\x2d\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x17\
-\x09\x5f\xee\xe7\
-\x00\x6c\
-\x00\x61\x00\x79\x00\x65\x00\x72\x00\x2d\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x2d\x00\x65\x00\x6c\x00\x6c\x00\x69\x00\x70\
-\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x0a\x66\x63\x47\
-\x00\x70\
-\x00\x61\x00\x69\x00\x6e\x00\x74\x00\x2d\x00\x63\x00\x61\x00\x6e\x00\x2d\x00\x63\x00\x6f\x00\x6c\x00\x6f\x00\x72\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-\x00\x08\
-\x00\x9e\x5a\x27\
-\x00\x64\
-\x00\x69\x00\x73\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x0c\x34\xfe\x67\
-\x00\x70\
-\x00\x61\x00\x69\x00\x6e\x00\x74\x00\x2d\x00\x62\x00\x72\x00\x75\x00\x73\x00\x68\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0b\x07\x5a\x27\
-\x00\x65\
-\x00\x64\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x12\
-\x0e\x41\xd8\x27\
-\x00\x65\
-\x00\x64\x00\x69\x00\x74\x00\x2d\x00\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x70\x00\x6e\
-\x00\x67\
-\x00\x0d\
-\x04\x81\xf8\xe7\
-\x00\x70\
-\x00\x61\x00\x69\x00\x6e\x00\x74\x00\x2d\x00\x63\x00\x61\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0f\xe4\x23\xe7\
-\x00\x73\
-\x00\x65\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x14\
-\x02\xbd\xa4\x27\
-\x00\x6c\
-\x00\x61\x00\x79\x00\x65\x00\x72\x00\x2d\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x2d\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2e\
-\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0a\x2a\x77\xe7\
-\x00\x70\
-\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x1a\
-\x0d\xa6\xfa\x87\
-\x00\x62\
-\x00\x6c\x00\x75\x00\x65\x00\x2d\x00\x66\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x6f\x00\x70\x00\x65\x00\x6e\x00\x2d\
-\x00\x69\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x02\x1f\xed\x07\
-\x00\x65\
-\x00\x64\x00\x69\x00\x74\x00\x2d\x00\x69\x00\x74\x00\x61\x00\x6c\x00\x69\x00\x63\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0b\x4a\x5a\xc7\
-\x00\x70\
-\x00\x69\x00\x70\x00\x65\x00\x74\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x09\xc8\xc6\x47\
-\x00\x65\
-\x00\x72\x00\x61\x00\x73\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x12\
-\x01\xc8\xd1\xc7\
-\x00\x73\
-\x00\x65\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2d\x00\x70\x00\x6f\x00\x6c\x00\x79\x00\x2e\x00\x70\x00\x6e\
-\x00\x67\
-\x00\x11\
-\x04\xfb\x42\x07\
-\x00\x62\
-\x00\x6f\x00\x72\x00\x64\x00\x65\x00\x72\x00\x2d\x00\x77\x00\x65\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\
-\x00\x18\
-\x0f\xa1\xdc\xc7\
-\x00\x6c\
-\x00\x61\x00\x79\x00\x65\x00\x72\x00\x2d\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x2d\x00\x70\x00\x6f\x00\x6c\x00\x79\x00\x6c\
-\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x08\x8c\xa3\xa7\
-\x00\x73\
-\x00\x70\x00\x72\x00\x61\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x17\
-\x04\x9c\xcf\x07\
-\x00\x6c\
-\x00\x61\x00\x79\x00\x65\x00\x72\x00\x2d\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x2d\x00\x70\x00\x6f\x00\x6c\x00\x79\x00\x67\
-\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x02\
-\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x6f\
-\x00\x00\x02\x90\x00\x00\x00\x00\x00\x01\x00\x00\x51\x48\
-\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\x42\x36\
-\x00\x00\x01\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x35\x84\
-\x00\x00\x01\x72\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x79\
-\x00\x00\x03\x30\x00\x00\x00\x00\x00\x01\x00\x00\x68\x78\
-\x00\x00\x02\xba\x00\x00\x00\x00\x00\x01\x00\x00\x58\x34\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x01\x1e\
-\x00\x00\x00\x74\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xfc\
-\x00\x00\x03\x18\x00\x00\x00\x00\x00\x01\x00\x00\x61\x6f\
-\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x12\xce\
-\x00\x00\x02\x76\x00\x00\x00\x00\x00\x01\x00\x00\x4a\x3b\
-\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x03\xc1\
-\x00\x00\x01\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x3c\x6d\
-\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x19\xb2\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x00\x25\x6e\
-\x00\x00\x02\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x43\x31\
-\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x6e\
-\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x3f\x3c\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x63\
-\x00\x00\x02\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x59\x06\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x34\x99\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x17\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x6f\
-\x00\x00\x01\x76\x0a\x2e\x0b\x2c\
-\x00\x00\x02\x90\x00\x00\x00\x00\x00\x01\x00\x00\x51\x48\
-\x00\x00\x01\x76\x0a\x55\x01\x3a\
-\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\x42\x36\
-\x00\x00\x01\x76\x0a\x2e\x0b\x8a\
-\x00\x00\x01\xb2\x00\x00\x00\x00\x00\x01\x00\x00\x35\x84\
-\x00\x00\x01\x76\x0c\xd3\x2f\x96\
-\x00\x00\x01\x72\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x79\
-\x00\x00\x01\x76\x0c\xd0\x43\xb8\
-\x00\x00\x03\x30\x00\x00\x00\x00\x00\x01\x00\x00\x68\x78\
-\x00\x00\x01\x76\x0c\xd9\xad\xe8\
-\x00\x00\x02\xba\x00\x00\x00\x00\x00\x01\x00\x00\x58\x34\
-\x00\x00\x01\x76\x0a\x2e\x0a\xee\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x76\x0a\x2e\x0b\x6a\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x01\x1e\
-\x00\x00\x01\x76\x0a\x2e\x0b\x4b\
-\x00\x00\x00\x74\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xfc\
-\x00\x00\x01\x76\x0c\xd8\x3b\x9b\
-\x00\x00\x03\x18\x00\x00\x00\x00\x00\x01\x00\x00\x61\x6f\
-\x00\x00\x01\x76\x0a\x5a\xcd\x6f\
-\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x12\xce\
-\x00\x00\x01\x76\x0c\xd8\xe0\x5e\
-\x00\x00\x02\x76\x00\x00\x00\x00\x00\x01\x00\x00\x4a\x3b\
-\x00\x00\x01\x76\x0c\xce\x1d\xf6\
-\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x03\xc1\
-\x00\x00\x01\x76\x0c\xd1\xd5\xc4\
-\x00\x00\x01\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x3c\x6d\
-\x00\x00\x01\x76\x0a\x2e\x11\x17\
-\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x19\xb2\
-\x00\x00\x01\x76\x0a\x2e\x0d\x3f\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x00\x25\x6e\
-\x00\x00\x01\x76\x0c\xd2\xb3\x23\
-\x00\x00\x02\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x43\x31\
-\x00\x00\x01\x76\x0c\xd0\xd8\x91\
-\x00\x00\x01\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x6e\
-\x00\x00\x01\x76\x0c\xd1\x73\x7b\
-\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x3f\x3c\
-\x00\x00\x01\x76\x0a\x2e\x0a\xbf\
-\x00\x00\x01\x48\x00\x00\x00\x00\x00\x01\x00\x00\x2c\x63\
-\x00\x00\x01\x76\x0a\x2e\x0b\xb9\
-\x00\x00\x02\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x59\x06\
-\x00\x00\x01\x76\x0c\xd7\xa7\xec\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x34\x99\
-\x00\x00\x01\x76\x0a\x2e\x11\x9d\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,88 @@
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor
+
+SAMPLE_SIZES = [1, 3, 5, 11]
+
+
+class SampleStore:
+    """
+    Pixel reads from the canvas image, with a summed-area table for averaging any
+    square in O(1).
+
+    The canvas reports changed rects through invalidate(); the table is only
+    brought up to date when it is next read, and then recomputed from the
+    top-left corner of the changed area onwards, since only entries below and to
+    the right of it change.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.sat = None
+        self.dirty = None
+
+    def invalidate(self, rect=None):
+        if self.sat is None:
+            return
+        if rect is None:
+            self.sat = None
+            return
+
+        rect = rect.intersected(self.source().rect())
+        if rect.isEmpty():
+            return
+        self.dirty = rect if self.dirty is None else self.dirty.united(rect)
+
+    def refresh(self):
+        import numpy as np
+
+        image = self.source()
+        if self.sat is None:
+            self.sat = np.zeros((image.height() + 1, image.width() + 1, 4), np.uint32)
+            self.update_sat(image, QRect(0, 0, 1, 1))
+            self.dirty = None
+
+        elif self.dirty is not None:
+            self.update_sat(image, self.dirty)
+            self.dirty = None
+
+    def update_sat(self, image, rect):
+        import numpy as np
+        from imagearray import image_array
+
+        # sat[y, x] holds the sums over rows < y and columns < x. Sums wrap around in
+        # uint32, which still gives exact box sums as long as a box sums below 2**32.
+        x0, y0 = rect.x(), rect.y()
+        arr = image_array(image)
+        block = np.cumsum(arr[y0:, x0:], axis=0, dtype=np.uint32)
+        np.cumsum(block, axis=1, dtype=np.uint32, out=block)
+
+        sat = self.sat
+        block += sat[y0, x0 + 1:]
+        block += sat[y0 + 1:, x0, None]
+        block -= sat[y0, x0]
+        sat[y0 + 1:, x0 + 1:] = block
+
+    def pixel(self, x, y):
+        return QColor.fromRgba(self.source().pixel(x, y))
+
+    def average(self, x, y, size):
+        """
+        The mean color of the size x size square centred on x, y, clipped to the canvas.
+        """
+        if size <= 1:
+            return self.pixel(x, y)
+
+        self.refresh()
+        image = self.source()
+        half = size // 2
+        h, w = image.height(), image.width()
+        x0, y0, x1, y1 = max(x - half, 0), max(y - half, 0), min(x + half + 1, w), min(y + half + 1, h)
+
+        # The canvas is premultiplied, so the color is the channel sums over the alpha sum.
+        sat = self.sat
+        b, g, r, a = (int(c) for c in sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0])
+        if not a:
+            return QColor(0, 0, 0, 0)
+
+        n = (x1 - x0) * (y1 - y0)
+        return QColor((r * 255 + a // 2) // a, (g * 255 + a // 2) // a, (b * 255 + a // 2) // a, (a + n // 2) // n)
@@ -0,0 +1,213 @@
+import struct
+
+from PyQt5.QtCore import Qt, QByteArray, QDataStream, QRect
+from PyQt5.QtGui import QBitmap, QImage, QPainter, QPainterPath, QPolygon, QRegion
+
+import numpy as np
+
+from imagearray import image_array
+
+SELECTION_OPS = ['replace', 'add', 'subtract', 'intersect']
+
+# A QPainterPath element as QDataStream writes it: type, then x and y.
+PATH_ELEMENT = np.dtype([('type', '>i4'), ('x', '>f8'), ('y', '>f8')])
+
+
+def selection_op(modifiers):
+    """
+    Map keyboard modifiers to a selection combine op, as in most paint programs:
+    Shift adds, Alt (or Ctrl) subtracts and Shift+Alt intersects.
+    """
+    add = bool(modifiers & Qt.ShiftModifier)
+    sub = bool(modifiers & (Qt.AltModifier | Qt.ControlModifier))
+    if add and sub:
+        return 'intersect'
+    if add:
+        return 'add'
+    if sub:
+        return 'subtract'
+    return 'replace'
+
+
+def runs(edges):
+    """
+    The row, start and (exclusive) end of every horizontal run of True in a (h, w) array.
+    """
+    h, w = edges.shape
+    padded = np.zeros((h, w + 2), np.int8)
+    padded[:, 1:-1] = edges
+    changes = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(changes == 1)
+    ends = np.nonzero(changes == -1)[1]
+    return rows, starts, ends
+
+
+def segments_path(x0, y0, x1, y1):
+    """
+    A QPainterPath of separate line segments, built in one go by reading it from
+    the QDataStream form rather than with a moveTo and lineTo call per segment.
+    """
+    n = len(x0)
+    elements = np.empty((n, 2), PATH_ELEMENT)
+    elements['type'] = [QPainterPath.MoveToElement, QPainterPath.LineToElement]
+    elements['x'] = np.stack([x0, x1], axis=1)
+    elements['y'] = np.stack([y0, y1], axis=1)
+    # Element count, the elements, then the start of the last subpath and the fill rule.
+    data = struct.pack('>i', 2 * n) + elements.tobytes() + struct.pack('>ii', max(2 * n - 2, 0), Qt.OddEvenFill)
+
+    path = QPainterPath()
+    QDataStream(QByteArray(data)) >> path
+    return path
+
+
+class SelectionMask:
+    """
+    A 1-bit selection mask, packed 8 pixels to a byte in the same layout as
+    QImage.Format_MonoLSB (LSB first, rows padded to 32 bits).
+
+    Combining masks works on whole packed rows at once, so union, intersect and
+    subtract of two full-canvas selections touch width * height / 8 bytes.
+    The clip QRegion and the outline path are derived lazily and cached, so
+    tools can clip with QPainter.setClipRegion rather than testing pixels.
+    """
+
+    def __init__(self, width, height, bits=None):
+        self.width = width
+        self.height = height
+        self.stride = ((width + 31) // 32) * 4
+
+        if bits is None:
+            bits = np.zeros((height, self.stride), np.uint8)
+        self.bits = bits
+
+        self._region = None
+        self._path = None
+
+    @classmethod
+    def from_array(cls, arr):
+        """
+        Pack a (h, w) boolean array.
+        """
+        h, w = arr.shape
+        mask = cls(w, h)
+        packed = np.packbits(arr, axis=1, bitorder='little')
+        mask.bits[:, :packed.shape[1]] = packed
+        return mask
+
+    @classmethod
+    def from_rect(cls, width, height, rect):
+        arr = np.zeros((height, width), bool)
+        rect = rect.normalized().intersected(QRect(0, 0, width, height))
+        arr[rect.top():rect.bottom() + 1, rect.left():rect.right() + 1] = True
+        return cls.from_array(arr)
+
+    @classmethod
+    def from_polygon(cls, width, height, points):
+        image = QImage(width, height, QImage.Format_Grayscale8)
+        image.fill(0)
+
+        p = QPainter(image)
+        p.setPen(Qt.NoPen)
+        p.setBrush(Qt.white)
+        p.drawPolygon(QPolygon(points))
+        p.end()
+
+        return cls.from_array(image_array(image) > 127)
+
+    @classmethod
+    def from_alpha(cls, width, height, image, pos):
+        """
+        Select the non-transparent pixels of an image placed at pos, clipped to the canvas.
+        """
+        image = image.convertToFormat(QImage.Format_ARGB32)
+        alpha = image_array(image)[..., 3] > 0
+        arr = np.zeros((height, width), bool)
+
+        target = QRect(pos, image.size()).intersected(QRect(0, 0, width, height))
+        if not target.isEmpty():
+            sx, sy = target.left() - pos.x(), target.top() - pos.y()
+            arr[target.top():target.bottom() + 1, target.left():target.right() + 1] = \
+                alpha[sy:sy + target.height(), sx:sx + target.width()]
+
+        return cls.from_array(arr)
+
+    @classmethod
+    def full(cls, width, height):
+        return cls.from_array(np.ones((height, width), bool))
+
+    def to_array(self):
+        return np.unpackbits(self.bits, axis=1, count=self.width, bitorder='little').astype(bool)
+
+    def copy(self):
+        return SelectionMask(self.width, self.height, self.bits.copy())
+
+    def union(self, other):
+        return SelectionMask(self.width, self.height, self.bits | other.bits)
+
+    def intersect(self, other):
+        return SelectionMask(self.width, self.height, self.bits & other.bits)
+
+    def subtract(self, other):
+        return SelectionMask(self.width, self.height, self.bits & ~other.bits)
+
+    def inverted(self):
+        return self.full(self.width, self.height).subtract(self)
+
+    def combine(self, other, op):
+        if op == 'add':
+            return self.union(other)
+        if op == 'subtract':
+            return self.subtract(other)
+        if op == 'intersect':
+            return self.intersect(other)
+        return other
+
+    def is_empty(self):
+        return not self.bits.any()
+
+    def contains(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.bits[y, x >> 3] & (1 << (x & 7)))
+        return False
+
+    def bounding_rect(self):
+        rows = np.flatnonzero(self.bits.any(axis=1))
+        if not len(rows):
+            return QRect()
+
+        columns = np.bitwise_or.reduce(self.bits[rows[0]:rows[-1] + 1], axis=0)
+        cols = np.flatnonzero(np.unpackbits(columns, count=self.width, bitorder='little'))
+        return QRect(int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1))
+
+    def to_image(self):
+        """
+        Return the mask as a Format_MonoLSB QImage, selected pixels set to color1.
+        """
+        data = self.bits.tobytes()
+        image = QImage(data, self.width, self.height, self.stride, QImage.Format_MonoLSB)
+        image.setColorTable([0xffffffff, 0xff000000])
+        return image.copy()
+
+    def region(self):
+        if self._region is None:
+            self._region = QRegion(QBitmap.fromImage(self.to_image()))
+        return self._region
+
+    def outline(self):
+        """
+        The boundary between selected and unselected pixels, as one line segment
+        per run of pixel edges. It is only ever stroked, so the segments are not
+        joined into closed polygons.
+        """
+        if self._path is None:
+            arr = np.zeros((self.height + 2, self.width + 2), bool)
+            arr[1:-1, 1:-1] = self.to_array()
+            # Edges between pixel rows y - 1 and y, and between columns x - 1 and x.
+            horizontal = arr[:-1, 1:-1] != arr[1:, 1:-1]
+            vertical = arr[1:-1, :-1] != arr[1:-1, 1:]
+
+            hy, hx0, hx1 = runs(horizontal)
+            vx, vy0, vy1 = runs(vertical.T)
+            self._path = segments_path(np.concatenate([hx0, vx]), np.concatenate([hy, vy0]),
+                                       np.concatenate([hx1, vx]), np.concatenate([hy, vy1]))
+        return self._path
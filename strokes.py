@@ -0,0 +1,122 @@
+import math
+
+from PyQt5.QtCore import QPointF
+from PyQt5.QtGui import QPainterPath
+
+# One-euro filter parameters, with time measured in input samples rather than
+# seconds so a replayed stroke smooths exactly like the original.
+MIN_CUTOFF = 0.03
+BETA = 0.02
+DERIVATIVE_CUTOFF = 0.5
+
+
+def simplify(points, epsilon):
+    """
+    Ramer-Douglas-Peucker: drop points closer than epsilon to the polyline through
+    the points kept. The first and last points are always kept.
+    """
+    if len(points) < 3:
+        return list(points)
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    eps2 = epsilon * epsilon
+
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first].x(), points[first].y()
+        dx, dy = points[last].x() - ax, points[last].y() - ay
+        length2 = dx * dx + dy * dy
+
+        index, best = 0, eps2
+        for i in range(first + 1, last):
+            px, py = points[i].x() - ax, points[i].y() - ay
+            if length2:
+                cross = px * dy - py * dx
+                d2 = cross * cross / length2
+            else:
+                d2 = px * px + py * py
+            if d2 > best:
+                index, best = i, d2
+
+        if index:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [p for p, k in zip(points, keep) if k]
+
+
+def smoothing_factor(cutoff):
+    tau = 1 / (2 * math.pi * cutoff)
+    return 1 / (1 + tau)
+
+
+class OneEuroFilter:
+    """
+    Low-pass filter whose cutoff rises with speed: slow movement is smoothed
+    heavily to remove jitter, fast movement is followed closely to limit lag.
+    """
+
+    def __init__(self, pos, min_cutoff=MIN_CUTOFF, beta=BETA):
+        self.min_cutoff, self.beta = min_cutoff, beta
+        self.x, self.y = pos.x(), pos.y()
+        self.dx = self.dy = 0.0
+
+    def __call__(self, pos):
+        a = smoothing_factor(DERIVATIVE_CUTOFF)
+        self.dx += a * (pos.x() - self.x - self.dx)
+        self.dy += a * (pos.y() - self.y - self.dy)
+
+        a = smoothing_factor(self.min_cutoff + self.beta * math.hypot(self.dx, self.dy))
+        self.x += a * (pos.x() - self.x)
+        self.y += a * (pos.y() - self.y)
+        return QPointF(self.x, self.y)
+
+
+def catmull_rom(path, p0, p1, p2, p3):
+    """
+    Append the Catmull-Rom segment from p1 to p2 to path as a cubic Bezier.
+    """
+    path.cubicTo(p1 + (p2 - p0) / 6, p2 - (p3 - p1) / 6, p2)
+
+
+class SmoothStroke:
+    """
+    Online stroke smoothing: incoming points go through a one-euro filter, are
+    decimated with RDP and the points kept are joined by a Catmull-Rom spline.
+    A segment can only be drawn once the point after it is known, so the curve
+    lags one control point behind the input until the stroke is finished.
+    """
+
+    def __init__(self, pos, epsilon):
+        pos = QPointF(pos)
+        self.epsilon = epsilon
+        self.filter = OneEuroFilter(pos)
+        self.controls = [pos, pos]
+
+    def extend(self, points, final=False):
+        """
+        Add the points (the first one being the last point passed before) and return
+        a path of the segments that can now be drawn, or None. A final call also
+        ends the curve at the last raw point.
+        """
+        filtered = [self.controls[-1]] + [self.filter(p) for p in points[1:]]
+        if final and points:
+            filtered.append(QPointF(points[-1]))
+
+        controls = self.controls + simplify(filtered, self.epsilon)[1:]
+        if final:
+            controls.append(controls[-1])
+
+        if len(controls) < 4:
+            self.controls = controls
+            return None
+
+        path = QPainterPath(controls[1])
+        for i in range(1, len(controls) - 2):
+            catmull_rom(path, *controls[i - 1:i + 3])
+
+        self.controls = controls[-3:]
+        return path
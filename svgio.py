@@ -0,0 +1,315 @@
+"""
+SVG export and import for the canvas: the raster image as an embedded PNG and the
+vector layer as SVG primitives.
+
+Both directions stream. The writer emits one element at a time through a SAX
+XMLGenerator, and the reader walks iterparse events and drops each element once
+it has been read, so neither holds the document in memory.
+"""
+import base64
+import re
+from functools import lru_cache
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import XMLGenerator
+
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice, QPoint, QRect
+from PyQt5.QtGui import QBrush, QColor, QFont, QImage, QPen
+
+from vector import ROUNDRECT_RADIUS, Shape
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+
+CONTAINERS = ['svg', 'g']
+
+# Presentation attributes that are read, and inherited from enclosing groups.
+STYLE_PROPERTIES = [
+    'stroke', 'stroke-width', 'stroke-opacity', 'stroke-linecap', 'stroke-linejoin',
+    'fill', 'fill-opacity', 'font-family', 'font-size', 'font-weight', 'font-style', 'text-decoration',
+]
+
+CAPS = {'butt': Qt.FlatCap, 'round': Qt.RoundCap, 'square': Qt.SquareCap}
+JOINS = {'miter': Qt.MiterJoin, 'round': Qt.RoundJoin, 'bevel': Qt.BevelJoin}
+CAP_NAMES = {v: k for k, v in CAPS.items()}
+JOIN_NAMES = {v: k for k, v in JOINS.items()}
+
+NUMBER = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def number(value):
+    return ('%.2f' % value).rstrip('0').rstrip('.')
+
+
+def png_data_uri(image):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, 'PNG')
+    return 'data:image/png;base64,' + base64.b64encode(bytes(data)).decode('ascii')
+
+
+def paint_attributes(color, prefix):
+    attrs = {prefix: color.name()}
+    if color.alpha() < 255:
+        attrs[prefix + '-opacity'] = number(color.alphaF())
+    return attrs
+
+
+def shape_element(shape):
+    """
+    The SVG tag and attributes for a shape.
+    """
+    attrs = {}
+    if shape.kind == 'text':
+        font = shape.font
+        attrs.update(paint_attributes(shape.pen.color(), 'fill'))
+        attrs.update({
+            'x': str(shape.points[0].x()), 'y': str(shape.points[0].y()),
+            'font-family': font.family(),
+            'font-size': number(font.pixelSize() if font.pixelSize() > 0 else font.pointSizeF() * 4 / 3),
+        })
+        if font.bold():
+            attrs['font-weight'] = 'bold'
+        if font.italic():
+            attrs['font-style'] = 'italic'
+        if font.underline():
+            attrs['text-decoration'] = 'underline'
+        return 'text', attrs
+
+    pen = shape.pen
+    if pen.style() == Qt.NoPen:
+        attrs['stroke'] = 'none'
+    else:
+        attrs.update(paint_attributes(pen.color(), 'stroke'))
+        attrs['stroke-width'] = str(pen.width())
+        attrs['stroke-linecap'] = CAP_NAMES.get(pen.capStyle(), 'butt')
+        attrs['stroke-linejoin'] = JOIN_NAMES.get(pen.joinStyle(), 'miter')
+
+    if shape.brush is None or shape.kind in ('line', 'polyline'):
+        attrs['fill'] = 'none'
+    else:
+        attrs.update(paint_attributes(shape.brush.color(), 'fill'))
+
+    if shape.kind in ('rect', 'roundrect', 'ellipse'):
+        # Qt draws a QRect's outline through its last pixel, so the SVG box is the
+        # full width() and height() rather than the distance between the corners.
+        box = shape.box().normalized()
+        if shape.kind == 'ellipse':
+            tag = 'ellipse'
+            attrs.update({
+                'cx': number(box.x() + box.width() / 2), 'cy': number(box.y() + box.height() / 2),
+                'rx': number(box.width() / 2), 'ry': number(box.height() / 2),
+            })
+        else:
+            tag = 'rect'
+            attrs.update({'x': str(box.x()), 'y': str(box.y()),
+                          'width': str(box.width()), 'height': str(box.height())})
+            if shape.kind == 'roundrect':
+                attrs['rx'] = attrs['ry'] = str(ROUNDRECT_RADIUS)
+        return tag, attrs
+
+    if shape.kind == 'line':
+        a, b = shape.points
+        attrs.update({'x1': str(a.x()), 'y1': str(a.y()), 'x2': str(b.x()), 'y2': str(b.y())})
+        return 'line', attrs
+
+    attrs['points'] = ' '.join('%d,%d' % (p.x(), p.y()) for p in shape.points)
+    return shape.kind, attrs
+
+
+def write_svg(path, image, shapes):
+    """
+    Write the image, embedded as a PNG, and the shapes over it to an SVG file.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        out = XMLGenerator(f, 'utf-8', short_empty_elements=True)
+        out.startDocument()
+        out.startElement('svg', {
+            'xmlns': SVG_NS, 'xmlns:xlink': XLINK_NS, 'version': '1.1',
+            'width': str(image.width()), 'height': str(image.height()),
+            'viewBox': '0 0 %d %d' % (image.width(), image.height()),
+        })
+        out.ignorableWhitespace('\n')
+        out.startElement('image', {
+            'x': '0', 'y': '0', 'width': str(image.width()), 'height': str(image.height()),
+            'xlink:href': png_data_uri(image),
+        })
+        out.endElement('image')
+        out.ignorableWhitespace('\n')
+
+        for shape in shapes:
+            tag, attrs = shape_element(shape)
+            out.startElement(tag, attrs)
+            if shape.kind == 'text':
+                out.characters(shape.text)
+            out.endElement(tag)
+            out.ignorableWhitespace('\n')
+
+        out.endElement('svg')
+        out.endDocument()
+
+
+def local_name(tag):
+    return tag.rpartition('}')[2]
+
+
+def element_style(elem, inherited):
+    style = dict(inherited)
+    for name in STYLE_PROPERTIES:
+        if name in elem.attrib:
+            style[name] = elem.attrib[name]
+    for declaration in elem.get('style', '').split(';'):
+        name, _, value = declaration.partition(':')
+        if name.strip() in STYLE_PROPERTIES:
+            style[name.strip()] = value.strip()
+    return style
+
+
+def length(value, default=0.0):
+    match = NUMBER.match(value.strip()) if value else None
+    return float(match.group()) if match else default
+
+
+@lru_cache(maxsize=256)
+def parse_color(value, opacity=None):
+    """
+    A QColor for an SVG paint value, or None for 'none' and anything unsupported.
+    The result is shared, so callers copy it before changing it.
+    """
+    value = (value or '').strip()
+    if not value or value == 'none' or value.startswith('url('):
+        return None
+
+    if value.startswith('rgb('):
+        parts = value[4:-1].split(',')
+        channels = [length(c) * 2.55 if c.strip().endswith('%') else length(c) for c in parts]
+        color = QColor(*(max(0, min(255, int(round(c)))) for c in channels[:3]))
+    else:
+        color = QColor(value)
+    if not color.isValid():
+        return None
+
+    if opacity is not None:
+        color.setAlphaF(max(0.0, min(1.0, length(opacity, 1.0))))
+    return color
+
+
+def style_pen(style):
+    return cached_pen(*(style.get(k) for k in ('stroke', 'stroke-opacity', 'stroke-width',
+                                               'stroke-linecap', 'stroke-linejoin')))
+
+
+@lru_cache(maxsize=256)
+def cached_pen(stroke, opacity, width, cap, join):
+    color = parse_color(stroke, opacity)
+    if color is None:
+        return QPen(Qt.NoPen)
+    width = max(1, int(round(length(width, 1.0))))
+    return QPen(color, width, Qt.SolidLine, CAPS.get(cap, Qt.FlatCap), JOINS.get(join, Qt.MiterJoin))
+
+
+def style_brush(style):
+    # SVG fills with black unless told otherwise.
+    color = parse_color(style.get('fill', 'black'), style.get('fill-opacity'))
+    return QBrush(color) if color is not None else None
+
+
+def style_font(style):
+    font = QFont(style.get('font-family', 'sans-serif').split(',')[0].strip().strip('\'"'))
+    font.setPixelSize(max(1, int(round(length(style.get('font-size'), 16.0)))))
+    font.setBold(style.get('font-weight') in ('bold', 'bolder') or length(style.get('font-weight'), 400) >= 600)
+    font.setItalic(style.get('font-style') in ('italic', 'oblique'))
+    font.setUnderline('underline' in style.get('text-decoration', ''))
+    return font
+
+
+def parse_points(value):
+    coords = [int(round(float(v))) for v in NUMBER.findall(value or '')]
+    return [QPoint(x, y) for x, y in zip(coords[::2], coords[1::2])]
+
+
+def read_shape(tag, elem, style):
+    a = elem.attrib
+    if tag == 'text':
+        text = ''.join(elem.itertext())
+        color = parse_color(style.get('fill', 'black'), style.get('fill-opacity'))
+        if not text or color is None:
+            return None
+        pos = QPoint(int(round(length(a.get('x')))), int(round(length(a.get('y')))))
+        return Shape('text', [pos], QPen(color), text=text, font=style_font(style))
+
+    pen = style_pen(style)
+    if tag == 'line':
+        points = [QPoint(int(round(length(a.get(x)))), int(round(length(a.get(y)))))
+                  for x, y in (('x1', 'y1'), ('x2', 'y2'))]
+        return Shape('line', points, pen)
+
+    brush = style_brush(style)
+    if tag in ('polyline', 'polygon'):
+        points = parse_points(a.get('points'))
+        return Shape(tag, points, pen, brush) if len(points) >= 2 else None
+
+    if tag == 'rect':
+        kind = 'roundrect' if length(a.get('rx')) or length(a.get('ry')) else 'rect'
+        x, y, w, h = (length(a.get(k)) for k in ('x', 'y', 'width', 'height'))
+    else:
+        kind = 'ellipse'
+        rx = length(a.get('r')) if tag == 'circle' else length(a.get('rx'))
+        ry = length(a.get('r')) if tag == 'circle' else length(a.get('ry'))
+        x, y, w, h = length(a.get('cx')) - rx, length(a.get('cy')) - ry, rx * 2, ry * 2
+
+    if w <= 0 or h <= 0:
+        return None
+    box = QRect(int(round(x)), int(round(y)), int(round(w)), int(round(h)))
+    return Shape(kind, [box.topLeft(), box.bottomRight()], pen, brush)
+
+
+def read_image(elem):
+    """
+    An embedded PNG or JPEG <image> and the rect it is drawn in, or None.
+    """
+    href = elem.get('{%s}href' % XLINK_NS) or elem.get('href') or ''
+    header, _, data = href.partition(',')
+    if not header.startswith('data:image/') or not header.endswith(';base64'):
+        return None
+
+    image = QImage.fromData(base64.b64decode(data))
+    if image.isNull():
+        return None
+    a = elem.attrib
+    width = length(a.get('width'), image.width())
+    height = length(a.get('height'), image.height())
+    return image, QRect(int(round(length(a.get('x')))), int(round(length(a.get('y')))),
+                        int(round(width)), int(round(height)))
+
+
+def read_svg(path):
+    """
+    Yield ('image', (QImage, QRect)) for embedded raster images and ('shape', Shape)
+    for the supported primitives, in document order. Transforms are not applied.
+    """
+    elements, styles = [], []
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        tag = local_name(elem.tag)
+        if event == 'start':
+            styles.append(element_style(elem, styles[-1] if styles else {}))
+            elements.append(elem)
+            continue
+
+        style = styles.pop()
+        elements.pop()
+        if tag == 'image':
+            item = read_image(elem)
+            if item is not None:
+                yield 'image', item
+        elif tag in ('rect', 'circle', 'ellipse', 'line', 'polyline', 'polygon', 'text'):
+            shape = read_shape(tag, elem, style)
+            if shape is not None:
+                yield 'shape', shape
+
+        # Drop each element of a group once it has been read so the tree never
+        # grows. Anything deeper, like a <tspan>, goes when its ancestor does.
+        if not elements or local_name(elements[-1].tag) in CONTAINERS:
+            elem.clear()
+            if elements:
+                elements[-1].remove(elem)
@@ -0,0 +1,25 @@
+import csv
+
+from PyQt5.QtCore import Qt, QEvent, QPointF
+from PyQt5.QtGui import QMouseEvent
+
+
+def test_log_ends_with_summary(window, app, tmp_path):
+    log = str(tmp_path / 'diagnostics.csv')
+    canvas = window.canvas
+    canvas.show_diagnostics(True, log)
+    window.penButton.pressed.emit()
+
+    for kind, x in ((QEvent.MouseButtonPress, 10), (QEvent.MouseMove, 20), (QEvent.MouseButtonRelease, 20)):
+        canvas.event(QMouseEvent(kind, QPointF(x, 10), Qt.LeftButton, Qt.LeftButton, Qt.NoModifier))
+        canvas.repaint()
+    window.close()
+
+    with open(log, newline='') as f:
+        rows = list(csv.DictReader(f))
+    summary = [row for row in rows if row['time'] in ('p50', 'p95', 'p99')]
+    events = [row for row in rows if row not in summary]
+
+    assert events and rows[-len(summary):] == summary
+    assert {row['handler'] for row in summary} == {row['handler'] for row in events}
+    assert len(summary) == 3 * len({row['handler'] for row in events})
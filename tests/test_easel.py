@@ -0,0 +1,58 @@
+from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtGui import QColor, QImage, QPixmap
+from PyQt5.QtTest import QTest
+
+
+def is_blank(image):
+    white = QImage(image.size(), image.format())
+    white.fill(Qt.white)
+    return image == white
+
+
+def red_pixmap():
+    pixmap = QPixmap(40, 40)
+    pixmap.fill(QColor(Qt.red))
+    return pixmap
+
+
+def test_new_image_drops_floating_selection(window, app):
+    canvas = window.canvas
+    canvas.paste_floating(red_pixmap(), QPoint(10, 10))
+
+    window.actionNewImage.trigger()
+    window.penButton.pressed.emit()
+    app.processEvents()
+
+    assert canvas.floating is None
+    assert is_blank(canvas.image)
+
+
+def test_open_drops_floating_selection(window, app):
+    canvas = window.canvas
+    canvas.paste_floating(red_pixmap(), QPoint(10, 10))
+
+    opened = QImage(100, 80, QImage.Format_ARGB32)
+    opened.fill(Qt.white)
+    canvas.set_image(opened)
+    window.penButton.pressed.emit()
+    app.processEvents()
+
+    assert canvas.floating is None
+    assert is_blank(canvas.image)
+
+
+def test_clear_image_drops_text_box(window, app):
+    canvas = window.canvas
+    window.textButton.pressed.emit()
+    QTest.mouseClick(canvas, Qt.LeftButton, Qt.NoModifier, QPoint(20, 20))
+    QTest.keyClicks(canvas, "hello")
+    assert canvas.text_box is not None
+
+    window.actionClearImage.trigger()
+    assert canvas.text_box is None
+
+    # A click that would have committed the old text box starts a new one instead.
+    QTest.mouseClick(canvas, Qt.LeftButton, Qt.NoModifier, QPoint(300, 200))
+    window.penButton.pressed.emit()
+    app.processEvents()
+    assert is_blank(canvas.image)
@@ -0,0 +1,46 @@
+import os
+import random
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QImage, QPainter
+
+import pytest
+
+import export
+
+
+@pytest.mark.parametrize('options', [{'compression': 1}, {'compression': 9}, {'palette': True}])
+def test_png_estimate_matches_saved_file(app, tmp_path, options):
+    # Small enough that the estimate encodes the whole image rather than a proxy.
+    image = QImage(200, 150, QImage.Format_ARGB32)
+    image.fill(Qt.white)
+    p = QPainter(image)
+    for i in range(0, 200, 10):
+        p.fillRect(i, i // 2, 30, 20, QColor(i, 255 - i, 128))
+    p.end()
+
+    options = dict(export.DEFAULT_OPTIONS, **options)
+    path = str(tmp_path / 'out.png')
+    export.save(image, path, 'PNG', options)
+
+    assert export.estimate_size(image, 'PNG', options) == os.path.getsize(path)
+
+
+@pytest.mark.parametrize('name', ['PNG', 'JPEG', 'BMP'])
+def test_indexed_estimate_is_close_to_saved_file(app, tmp_path, name):
+    # Large enough that the estimate encodes a proxy of the image.
+    image = QImage(640, 480, QImage.Format_Indexed8)
+    image.setColorTable([QColor(i, 255 - i, 128).rgb() for i in range(0, 256, 16)])
+    rng = random.Random(0)
+    for y in range(480):
+        for x in range(0, 640, 8):
+            index = rng.randrange(16)
+            for i in range(8):
+                image.setPixel(x + i, y, index)
+
+    options = dict(export.DEFAULT_OPTIONS)
+    path = str(tmp_path / ('out.' + name.lower()))
+    export.save(image, path, name, options)
+
+    size = os.path.getsize(path)
+    assert abs(export.estimate_size(image, name, options) - size) < size * 0.25
@@ -0,0 +1,59 @@
+import zlib
+
+import numpy as np
+import pytest
+
+from PyQt5.QtGui import QImage
+
+from imagearray import array_image, image_array
+from pngwriter import adler32_combine, write_png
+
+
+def random_image(rng, fmt, alpha):
+    arr = rng.integers(0, 256, (37, 53, 4), np.uint8)
+    # Some flat areas, so the filters and deflate have something to find.
+    arr[10:20] = arr[10, 0]
+    arr[..., 3] = rng.integers(0, 256, arr.shape[:2]) if alpha else 255
+    return array_image(arr, QImage.Format_ARGB32).convertToFormat(fmt)
+
+
+def pixels(image):
+    image = image.convertToFormat(QImage.Format_ARGB32)
+    return image_array(image).copy()
+
+
+@pytest.mark.parametrize('fmt, alpha', [
+    (QImage.Format_RGB32, False),
+    (QImage.Format_ARGB32, False),
+    (QImage.Format_ARGB32, True),
+])
+@pytest.mark.parametrize('level', [0, 6, 9])
+@pytest.mark.parametrize('strip_bytes', [1, 500, 1 << 20])
+def test_round_trip_is_exact(app, tmp_path, fmt, alpha, level, strip_bytes):
+    image = random_image(np.random.default_rng(level), fmt, alpha)
+    path = str(tmp_path / 'out.png')
+    write_png(image, path, level, jobs=3, strip_bytes=strip_bytes)
+
+    loaded = QImage(path)
+    assert not loaded.isNull()
+    assert np.array_equal(pixels(loaded), pixels(image))
+
+
+def test_indexed_round_trip_is_exact(app, tmp_path):
+    rng = np.random.default_rng(0)
+    image = QImage(41, 29, QImage.Format_Indexed8)
+    image.setColorTable([int(c) for c in rng.integers(0, 1 << 32, 20, np.uint64)])
+    image_array(image, writable=True)[:] = rng.integers(0, 20, (29, 41))
+    path = str(tmp_path / 'out.png')
+    write_png(image, path, strip_bytes=100)
+
+    loaded = QImage(path)
+    assert loaded.format() == QImage.Format_Indexed8
+    assert np.array_equal(pixels(loaded), pixels(image))
+
+
+def test_adler32_combine_matches_zlib():
+    rng = np.random.default_rng(0)
+    for n1, n2 in [(0, 0), (0, 10), (10, 0), (1, 1), (1000, 70000), (65521, 65521), (200000, 3)]:
+        a, b = rng.integers(0, 256, n1, np.uint8).tobytes(), rng.integers(0, 256, n2, np.uint8).tobytes()
+        assert adler32_combine(zlib.adler32(a), zlib.adler32(b), len(b)) == zlib.adler32(a + b)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from PyQt5.QtGui import QImage
+
+from imagearray import array_image, image_array
+from quantize import DITHERS, METHODS, quantize
+
+
+def random_image(alpha):
+    rng = np.random.default_rng(0)
+    arr = rng.integers(0, 256, (48, 64, 4), np.uint8)
+    arr[..., 3] = np.where(rng.random((48, 64)) < 0.2, 0, 255) if alpha else 255
+    return array_image(arr, QImage.Format_ARGB32)
+
+
+@pytest.mark.parametrize('method', sorted(METHODS))
+@pytest.mark.parametrize('dither', DITHERS)
+@pytest.mark.parametrize('alpha', [False, True])
+@pytest.mark.parametrize('n', [1, 2, 7, 64])
+def test_palette_has_at_most_n_colors(app, method, dither, alpha, n):
+    indices, palette = quantize(random_image(alpha), n, method, dither)
+
+    assert 1 <= len(palette) <= n
+    assert image_array(indices).max() < len(palette)
+
+
+@pytest.mark.parametrize('method', sorted(METHODS))
+def test_few_colors_are_kept(app, method):
+    colors = np.array([0xffff0000, 0xff00ff00, 0xff0000ff], np.uint32)
+    image = array_image(colors[np.arange(32 * 32).reshape(32, 32) % 3], QImage.Format_ARGB32)
+
+    indices, palette = quantize(image, 16, method)
+
+    assert len(palette) <= 16
+    assert set(palette) >= set(int(c) for c in colors)
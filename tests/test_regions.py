@@ -0,0 +1,46 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from regions import color_match, connected_region
+
+
+def flood(mask, x, y):
+    """
+    Reference 4-connected flood fill, one pixel at a time.
+    """
+    h, w = mask.shape
+    region = np.zeros_like(mask)
+    region[y, x] = True
+    queue = deque([(x, y)])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < w and 0 <= ny < h and mask[ny, nx] and not region[ny, nx]:
+                region[ny, nx] = True
+                queue.append((nx, ny))
+    return region
+
+
+@pytest.mark.parametrize('density', [0.3, 0.5, 0.6, 0.8])
+@pytest.mark.parametrize('window', [4, 256])
+def test_connected_region_matches_flood_fill(density, window):
+    rng = np.random.default_rng(int(density * 10) + window)
+    for _ in range(20):
+        h, w = rng.integers(1, 60, 2)
+        arr = (rng.random((h, w)) < density).astype(np.uint8)
+        x, y = rng.integers(w), rng.integers(h)
+
+        expected = flood(arr == arr[y, x], x, y)
+        assert np.array_equal(connected_region(arr, x, y, window=window), expected)
+
+
+def test_connected_region_with_tolerance():
+    rng = np.random.default_rng(0)
+    arr = np.full((40, 50, 4), 255, np.uint8)
+    arr[..., :3] = rng.integers(100, 140, (40, 50, 3))
+    x, y = 25, 20
+
+    expected = flood(color_match(arr, x, y, 30), x, y)
+    assert np.array_equal(connected_region(arr, x, y, 30, window=8), expected)
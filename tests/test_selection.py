@@ -0,0 +1,70 @@
+import numpy as np
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QPainterPath
+
+from selection import SelectionMask
+
+
+def unit_edges(path):
+    """
+    The pixel edges an outline of horizontal and vertical segments covers.
+    """
+    edges = set()
+    for i in range(0, path.elementCount(), 2):
+        a, b = path.elementAt(i), path.elementAt(i + 1)
+        assert a.type == QPainterPath.MoveToElement and b.type == QPainterPath.LineToElement
+        x0, y0, x1, y1 = int(a.x), int(a.y), int(b.x), int(b.y)
+        assert x0 == x1 or y0 == y1
+        if y0 == y1:
+            edges.update(('h', x, y0) for x in range(min(x0, x1), max(x0, x1)))
+        else:
+            edges.update(('v', x0, y) for y in range(min(y0, y1), max(y0, y1)))
+    return edges
+
+
+def boundary(arr):
+    """
+    Reference: the edges between each selected pixel and its unselected or off-canvas neighbours.
+    """
+    h, w = arr.shape
+
+    def selected(x, y):
+        return 0 <= x < w and 0 <= y < h and arr[y, x]
+
+    edges = set()
+    for y in range(h + 1):
+        for x in range(w + 1):
+            if selected(x, y) != selected(x, y - 1) and x < w:
+                edges.add(('h', x, y))
+            if selected(x, y) != selected(x - 1, y) and y < h:
+                edges.add(('v', x, y))
+    return edges
+
+
+def test_outline_follows_the_mask_boundary(app):
+    rng = np.random.default_rng(0)
+    for density in (0.1, 0.5, 0.9):
+        arr = rng.random((23, 37)) < density
+        assert unit_edges(SelectionMask.from_array(arr).outline()) == boundary(arr)
+
+
+def test_outline_of_a_rect(app):
+    mask = SelectionMask.from_rect(50, 40, QRect(5, 6, 10, 20))
+    path = mask.outline()
+
+    assert path.elementCount() == 8
+    assert path.boundingRect().toRect() == QRect(5, 6, 10, 20)
+
+
+def test_outline_of_empty_and_full_masks(app):
+    assert SelectionMask(20, 10).outline().isEmpty()
+    assert SelectionMask.full(20, 10).outline().boundingRect().toRect() == QRect(0, 0, 20, 10)
+
+
+def test_select_all_before_choosing_a_tool(window, app):
+    window.actionSelectAll.trigger()
+    window.canvas.repaint()
+    app.processEvents()
+
+    assert window.canvas.selection is not None
@@ -0,0 +1,53 @@
+from PyQt5.QtCore import Qt, QPoint, QRect
+from PyQt5.QtGui import QBrush, QColor, QFont, QImage, QPen
+
+from svgio import read_svg, write_svg
+from vector import SHAPE_KINDS, Shape
+
+
+def make_shape(kind):
+    pen = QPen(QColor(200, 30, 40, 128), 3, Qt.SolidLine, Qt.RoundCap, Qt.BevelJoin)
+    brush = QBrush(QColor(10, 120, 250))
+    if kind == 'text':
+        font = QFont('Sans')
+        font.setPixelSize(18)
+        font.setBold(True)
+        font.setItalic(True)
+        return Shape(kind, [QPoint(15, 40)], pen, text="hello <&> world", font=font)
+    if kind in ('polyline', 'polygon'):
+        return Shape(kind, [QPoint(5, 6), QPoint(40, 12), QPoint(22, 50)], pen, brush)
+    return Shape(kind, [QPoint(10, 20), QPoint(61, 45)], pen, brush)
+
+
+def test_every_shape_kind_round_trips(app, tmp_path):
+    image = QImage(80, 60, QImage.Format_ARGB32)
+    image.fill(QColor(1, 2, 3, 200))
+    shapes = [make_shape(kind) for kind in SHAPE_KINDS]
+    path = str(tmp_path / 'out.svg')
+    write_svg(path, image, shapes)
+
+    items = list(read_svg(path))
+
+    assert items[0][0] == 'image'
+    loaded, rect = items[0][1]
+    assert rect == QRect(0, 0, 80, 60)
+    assert loaded.convertToFormat(QImage.Format_ARGB32) == image
+
+    read = [item for kind, item in items[1:]]
+    assert [s.kind for s in read] == SHAPE_KINDS
+    for before, after in zip(shapes, read):
+        assert after.points == before.points, before.kind
+        assert after.pen.color().rgba() == before.pen.color().rgba(), before.kind
+        if before.kind == 'text':
+            assert after.text == before.text
+            assert after.font.family() == before.font.family()
+            assert after.font.pixelSize() == before.font.pixelSize()
+            assert (after.font.bold(), after.font.italic()) == (True, True)
+            continue
+
+        assert after.pen.width() == before.pen.width()
+        assert (after.pen.capStyle(), after.pen.joinStyle()) == (Qt.RoundCap, Qt.BevelJoin)
+        if before.kind in ('line', 'polyline'):
+            assert after.brush is None or after.brush.style() == Qt.NoBrush
+        else:
+            assert after.brush.color() == before.brush.color(), before.kind
@@ -0,0 +1,126 @@
+from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtGui import QImage
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+import pytest
+
+from imagearray import image_array
+from textbox import TextBox
+
+FONT_KEY = ('Sans', 12, False, False, False)
+
+
+@pytest.fixture
+def canvas(window):
+    """
+    A text box holding "hello world", typed into the focused canvas of the active
+    window, so the window's shortcuts see every key first as they would for a user.
+    """
+    window.activateWindow()
+    assert QTest.qWaitForWindowActive(window)
+    canvas = window.canvas
+    canvas.setFocus()
+
+    window.textButton.pressed.emit()
+    QTest.mouseClick(canvas, Qt.LeftButton, Qt.NoModifier, QPoint(20, 20))
+    QTest.keyClicks(canvas, "hello world")
+    return canvas
+
+
+def test_select_all_selects_the_text(canvas):
+    QTest.keyClick(canvas, Qt.Key_A, Qt.ControlModifier)
+
+    assert canvas.text_box.selected_text() == "hello world"
+    assert canvas.selection is None
+
+
+def test_cut_and_paste_edit_the_text(canvas):
+    for _ in range(5):
+        QTest.keyClick(canvas, Qt.Key_Left, Qt.ShiftModifier)
+    QTest.keyClick(canvas, Qt.Key_X, Qt.ControlModifier)
+
+    assert canvas.text_box.text() == "hello "
+    assert QApplication.clipboard().text() == "world"
+
+    QTest.keyClick(canvas, Qt.Key_Home)
+    QTest.keyClick(canvas, Qt.Key_V, Qt.ControlModifier)
+
+    assert canvas.mode == 'text'
+    assert canvas.floating is None
+    assert canvas.text_box.text() == "worldhello "
+
+
+def test_shortcuts_work_without_a_text_box(canvas):
+    QTest.keyClick(canvas, Qt.Key_Escape)
+    assert canvas.text_box is None
+
+    QTest.keyClick(canvas, Qt.Key_A, Qt.ControlModifier)
+    assert canvas.selection is not None
+
+
+def test_commit_leaves_no_selection_highlight(canvas, app):
+    QTest.keyClick(canvas, Qt.Key_A, Qt.ControlModifier)
+    QTest.mouseClick(canvas, Qt.LeftButton, Qt.NoModifier, QPoint(400, 300))
+    app.processEvents()
+    assert canvas.text_box is None
+
+    # Black text on white: every pixel is a gray, with no trace of the blue highlight.
+    image = canvas.image.convertToFormat(QImage.Format_ARGB32)
+    pixels = image_array(image)
+    b, g, r = (pixels[..., i].astype(int) for i in range(3))
+    assert (r < 255).any()
+    assert (b == r).all() and (g == r).all()
+
+
+def line_breaks(box):
+    return [[(l.start, l.length) for l in p.lines] for p in box.paragraphs]
+
+
+def assert_laid_out(box):
+    fresh = TextBox(box.pos, box.width, box.font_key)
+    fresh.insert(box.text())
+    assert line_breaks(box) == line_breaks(fresh)
+
+
+def test_editing_across_a_paragraph_break(app):
+    # Narrow enough that each paragraph wraps over several lines.
+    box = TextBox(QPoint(0, 0), 80, FONT_KEY)
+    box.insert("the quick brown fox\njumps over the lazy dog")
+    assert [p.text for p in box.paragraphs] == ["the quick brown fox", "jumps over the lazy dog"]
+    assert box.cursor == (1, 23)
+    assert all(len(p.lines) > 1 for p in box.paragraphs)
+    assert_laid_out(box)
+
+    # Backspace at the start of a paragraph joins it to the one before.
+    box.cursor = (1, 0)
+    assert box.backspace() is not None
+    assert box.text() == "the quick brown foxjumps over the lazy dog"
+    assert box.cursor == (0, 19)
+    assert_laid_out(box)
+
+    # Insert a break back in the middle of the joined paragraph.
+    box.insert("\n")
+    assert [p.text for p in box.paragraphs] == ["the quick brown fox", "jumps over the lazy dog"]
+    assert box.cursor == (1, 0)
+    assert_laid_out(box)
+
+    # Delete at the end of a paragraph joins the next one to it.
+    box.cursor = (0, 19)
+    assert box.delete() is not None
+    assert box.text() == "the quick brown foxjumps over the lazy dog"
+    assert box.cursor == (0, 19)
+    assert_laid_out(box)
+
+    # A multi-line insert splits the paragraph around the cursor.
+    box.insert("!\n\nand ")
+    assert box.text() == "the quick brown fox!\n\nand jumps over the lazy dog"
+    assert box.cursor == (2, 4)
+    assert_laid_out(box)
+
+    # At the very start and end there is nothing to join.
+    box.cursor = (0, 0)
+    assert box.backspace() is None
+    box.cursor = (2, len(box.paragraphs[2].text))
+    assert box.delete() is None
+    assert len(box.paragraphs) == 3
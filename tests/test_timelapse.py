@@ -0,0 +1,29 @@
+from PyQt5.QtCore import Qt, QEvent, QPointF
+from PyQt5.QtGui import QMouseEvent
+
+
+def mouse(kind, x, y, button=Qt.LeftButton):
+    buttons = Qt.NoButton if kind == QEvent.MouseButtonRelease else Qt.LeftButton
+    return QMouseEvent(kind, QPointF(x, y), button, buttons, Qt.NoModifier)
+
+
+def test_capture_includes_buffered_stroke(window, tmp_path):
+    canvas = window.canvas
+    canvas.start_timelapse(str(tmp_path / 'timelapse.png'))
+    window.penButton.pressed.emit()
+
+    canvas.mousePressEvent(mouse(QEvent.MouseButtonPress, 10, 10))
+    for x in range(12, 200, 4):
+        canvas.mouseMoveEvent(mouse(QEvent.MouseMove, x, 50, Qt.NoButton))
+
+    # A capture on the timer, before any paint event has drawn the stroke.
+    canvas.timelapse.last_capture = 0
+    canvas.on_timer()
+    captured = canvas.image.copy()
+
+    # Whatever the next paint draws must still be dirty for the next capture.
+    canvas.flush_stroke()
+    assert canvas.image == captured or not canvas.timelapse.dirty.isEmpty()
+
+    canvas.mouseReleaseEvent(mouse(QEvent.MouseButtonRelease, 200, 50))
+    assert canvas.stop_timelapse() >= 2
@@ -0,0 +1,424 @@
+from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import QColor, QFont, QFontMetricsF, QGuiApplication, QKeySequence, QPen, QTextLayout, \
+    QTextOption
+
+from bisect import bisect_right
+from functools import lru_cache
+
+SELECTION_COLOR = QColor(0x33, 0x99, 0xff, 0x60)
+FRAME_PEN = QPen(QColor(0x80, 0x80, 0x80), 1, Qt.DotLine)
+
+MIN_WIDTH = 20
+
+# Editing keys the box handles itself, ahead of the window's shortcuts for them.
+EDIT_KEYS = (QKeySequence.SelectAll, QKeySequence.Copy, QKeySequence.Cut, QKeySequence.Paste)
+
+
+@lru_cache(maxsize=64)
+def cached_font(family, size, bold, italic, underline):
+    """
+    The shared QFont for a font key (family, size, bold, italic, underline). Don't modify it.
+    """
+    font = QFont(family)
+    font.setPointSize(size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    font.setUnderline(underline)
+    return font
+
+
+@lru_cache(maxsize=64)
+def font_metrics(key):
+    return QFontMetricsF(cached_font(*key))
+
+
+class TextLine:
+    """
+    One wrapped line: a span of its paragraph plus the QTextLine it was laid out as.
+
+    The QTextLayout is kept alongside so the QTextLine stays valid. Lines that are
+    reused after an edit keep their old layout and only have their start shifted.
+    """
+    __slots__ = ('start', 'length', 'layout', 'line')
+
+    def __init__(self, start, length, layout, line):
+        self.start = start
+        self.length = length
+        self.layout = layout
+        self.line = line
+
+    @property
+    def end(self):
+        return self.start + self.length
+
+    def shifted(self, delta):
+        return TextLine(self.start + delta, self.length, self.layout, self.line)
+
+    def cursor_to_x(self, col):
+        return self.line.cursorToX(col - self.start + self.line.textStart())[0]
+
+    def x_to_cursor(self, x):
+        return self.line.xToCursor(x) - self.line.textStart() + self.start
+
+
+class Paragraph:
+
+    def __init__(self, text, box):
+        self.text = text
+        self.box = box
+        self.lines = self.break_lines(0)
+
+    def break_lines(self, start, stop_at=()):
+        """
+        Wrap text from start, stopping early once a line would begin at one of the
+        offsets in stop_at (where the old wrapping is known to resume unchanged).
+        """
+        layout = QTextLayout(self.text[start:], self.box.font)
+        layout.setTextOption(self.box.option)
+        layout.setCacheEnabled(True)
+        layout.beginLayout()
+
+        lines = []
+        pos = start
+        while not (lines and pos in stop_at):
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(self.box.width)
+            line.setPosition(QPointF(0, 0))
+            lines.append(TextLine(start + line.textStart(), line.textLength(), layout, line))
+            pos = lines[-1].end
+
+        layout.endLayout()
+        return lines
+
+    def line_index(self, col):
+        return max(bisect_right([l.start for l in self.lines], col) - 1, 0)
+
+    def replace(self, col, removed, text):
+        """
+        Replace removed characters at col with text and re-wrap only the lines that changed.
+        Returns the index of the first line that was re-laid out.
+        """
+        self.text = self.text[:col] + text + self.text[col + removed:]
+        delta = len(text) - removed
+
+        first = max(self.line_index(col) - 1, 0)
+        tail = [l.shifted(delta) for l in self.lines[first + 1:] if l.start >= col + max(removed, 1)]
+        lines = self.break_lines(self.lines[first].start, {l.start for l in tail})
+
+        end = lines[-1].end if lines else 0
+        self.lines = self.lines[:first] + lines + [l for l in tail if l.start >= end]
+        return first
+
+
+class TextBox:
+    """
+    An editable, wrapping, multi-line text box drawn over the canvas.
+
+    Each paragraph is wrapped into TextLine objects; an edit re-breaks lines from
+    the edited one onward only until the old line breaks line up again, and the
+    returned dirty rects cover just the lines that moved or changed.
+    """
+
+    def __init__(self, pos, width, font_key):
+        self.pos = QPointF(pos)
+        self.width = max(width, MIN_WIDTH)
+        self.option = QTextOption()
+        self.option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+        self.font_key = font_key
+        self.font = cached_font(*font_key)
+        self.line_height = font_metrics(font_key).height()
+
+        self.paragraphs = [Paragraph("", self)]
+        self.cursor = (0, 0)
+        self.anchor = None
+
+    def set_font(self, font_key):
+        self.font_key = font_key
+        self.font = cached_font(*font_key)
+        self.line_height = font_metrics(font_key).height()
+        self.relayout()
+
+    def set_width(self, width):
+        self.width = max(width, MIN_WIDTH)
+        self.relayout()
+
+    def relayout(self):
+        for paragraph in self.paragraphs:
+            paragraph.lines = paragraph.break_lines(0)
+
+    def text(self):
+        return "\n".join(p.text for p in self.paragraphs)
+
+    def line_count(self):
+        return sum(len(p.lines) for p in self.paragraphs)
+
+    def first_line(self, index):
+        return sum(len(p.lines) for p in self.paragraphs[:index])
+
+    def rect(self):
+        return QRectF(self.pos.x(), self.pos.y(), self.width, max(self.line_count(), 1) * self.line_height)
+
+    def lines_rect(self, first, last=None):
+        """
+        Canvas rect covering visual lines first..last (to the bottom of the box if last is None).
+        """
+        if last is None:
+            last = self.line_count()
+        top = self.pos.y() + first * self.line_height
+        rect = QRectF(self.pos.x() - 1, top, self.width + 2, (last - first + 1) * self.line_height)
+        return rect.toAlignedRect()
+
+    def edit_rect(self, index, first, lines_before):
+        """
+        Dirty rect after paragraph index was edited from its line first: to the end of the
+        paragraph if its line count held, otherwise to the (old or new) bottom of the box.
+        """
+        top = self.first_line(index)
+        lines = len(self.paragraphs[index].lines)
+        if lines == lines_before:
+            return self.lines_rect(top + first, top + lines)
+
+        total = self.line_count()
+        return self.lines_rect(top + first, max(total, total - lines + lines_before))
+
+    def ordered_selection(self):
+        if self.anchor is None or self.anchor == self.cursor:
+            return None
+        return min(self.anchor, self.cursor), max(self.anchor, self.cursor)
+
+    def selected_text(self):
+        selection = self.ordered_selection()
+        if selection is None:
+            return ""
+
+        (p0, c0), (p1, c1) = selection
+        if p0 == p1:
+            return self.paragraphs[p0].text[c0:c1]
+        middle = [p.text for p in self.paragraphs[p0 + 1:p1]]
+        return "\n".join([self.paragraphs[p0].text[c0:]] + middle + [self.paragraphs[p1].text[:c1]])
+
+    def delete_selection(self):
+        selection = self.ordered_selection()
+        self.anchor = None
+        if selection is None:
+            return None
+
+        (p0, c0), (p1, c1) = selection
+        self.cursor = (p0, c0)
+        if p0 == p1:
+            paragraph = self.paragraphs[p0]
+            lines = len(paragraph.lines)
+            return self.edit_rect(p0, paragraph.replace(c0, c1 - c0, ""), lines)
+
+        top, total = self.first_line(p0), self.line_count()
+        text = self.paragraphs[p0].text[:c0] + self.paragraphs[p1].text[c1:]
+        self.paragraphs[p0:p1 + 1] = [Paragraph(text, self)]
+        return self.lines_rect(top, total)
+
+    def insert(self, text):
+        rect = self.delete_selection()
+        p, c = self.cursor
+        paragraph = self.paragraphs[p]
+
+        pieces = text.split("\n")
+        if len(pieces) == 1:
+            lines = len(paragraph.lines)
+            dirty = self.edit_rect(p, paragraph.replace(c, 0, text), lines)
+            self.cursor = (p, c + len(text))
+
+        else:
+            head, tail = paragraph.text[:c], paragraph.text[c:]
+            pieces[0] = head + pieces[0]
+            self.cursor = (p + len(pieces) - 1, len(pieces[-1]))
+            pieces[-1] = pieces[-1] + tail
+            total = self.line_count()
+            self.paragraphs[p:p + 1] = [Paragraph(piece, self) for piece in pieces]
+            dirty = self.lines_rect(self.first_line(p), max(total, self.line_count()))
+
+        return dirty.united(rect) if rect else dirty
+
+    def backspace(self):
+        if self.ordered_selection():
+            return self.delete_selection()
+
+        p, c = self.cursor
+        if c > 0:
+            paragraph = self.paragraphs[p]
+            lines = len(paragraph.lines)
+            self.cursor = (p, c - 1)
+            return self.edit_rect(p, paragraph.replace(c - 1, 1, ""), lines)
+
+        if p > 0:
+            self.anchor, self.cursor = (p - 1, len(self.paragraphs[p - 1].text)), (p, 0)
+            return self.delete_selection()
+
+    def delete(self):
+        if self.ordered_selection():
+            return self.delete_selection()
+
+        p, c = self.cursor
+        if c < len(self.paragraphs[p].text):
+            self.anchor = (p, c + 1)
+            return self.delete_selection()
+
+        if p < len(self.paragraphs) - 1:
+            self.anchor = (p + 1, 0)
+            return self.delete_selection()
+
+    def visual_lines(self):
+        return [(i, j) for i, p in enumerate(self.paragraphs) for j in range(len(p.lines))]
+
+    def cursor_line(self):
+        p, c = self.cursor
+        return p, self.paragraphs[p].line_index(c)
+
+    def cursor_x(self):
+        p, c = self.cursor
+        line = self.paragraphs[p].lines[self.paragraphs[p].line_index(c)]
+        return line.cursor_to_x(c)
+
+    def move(self, key, select=False):
+        """
+        Move the cursor for an arrow/Home/End key, extending the selection if select is set.
+        Returns the rect to repaint.
+        """
+        before = self.selection_rect()
+        if select and self.anchor is None:
+            self.anchor = self.cursor
+        elif not select:
+            self.anchor = None
+
+        p, c = self.cursor
+        paragraph = self.paragraphs[p]
+        line = paragraph.lines[paragraph.line_index(c)]
+
+        if key == Qt.Key_Left:
+            self.cursor = (p, c - 1) if c > 0 else (p - 1, len(self.paragraphs[p - 1].text)) if p > 0 else (p, c)
+        elif key == Qt.Key_Right:
+            self.cursor = (p, c + 1) if c < len(paragraph.text) else (p + 1, 0) if p < len(self.paragraphs) - 1 else (p, c)
+        elif key == Qt.Key_Home:
+            self.cursor = (p, line.start)
+        elif key == Qt.Key_End:
+            end = line.end if line is paragraph.lines[-1] else line.end - 1
+            self.cursor = (p, max(end, line.start))
+        elif key in (Qt.Key_Up, Qt.Key_Down):
+            lines = self.visual_lines()
+            index = lines.index(self.cursor_line()) + (1 if key == Qt.Key_Down else -1)
+            if 0 <= index < len(lines):
+                x = self.cursor_x()
+                i, j = lines[index]
+                self.cursor = (i, self.paragraphs[i].lines[j].x_to_cursor(x))
+
+        return before.united(self.selection_rect())
+
+    def select_all(self):
+        self.anchor = (0, 0)
+        self.cursor = (len(self.paragraphs) - 1, len(self.paragraphs[-1].text))
+        return self.lines_rect(0)
+
+    def hit(self, pos):
+        """
+        Return the (paragraph, column) nearest to a canvas position.
+        """
+        lines = self.visual_lines()
+        index = min(max(int((pos.y() - self.pos.y()) // self.line_height), 0), len(lines) - 1)
+        i, j = lines[index]
+        return i, self.paragraphs[i].lines[j].x_to_cursor(pos.x() - self.pos.x())
+
+    def set_cursor_at(self, pos, select=False):
+        before = self.selection_rect()
+        if select and self.anchor is None:
+            self.anchor = self.cursor
+        elif not select:
+            self.anchor = None
+
+        self.cursor = self.hit(pos)
+        return before.united(self.selection_rect())
+
+    def selection_rect(self):
+        """
+        Canvas rect covering the cursor line and any selected lines.
+        """
+        first = last = self.visual_lines().index(self.cursor_line())
+        if self.anchor is not None:
+            p, c = self.anchor
+            anchor = self.first_line(p) + self.paragraphs[p].line_index(c)
+            first, last = min(first, anchor), max(last, anchor)
+        return self.lines_rect(first, last)
+
+    def takes_key(self, event):
+        """
+        Whether the key event is one of EDIT_KEYS, which the box needs before any shortcut.
+        """
+        return any(event.matches(k) for k in EDIT_KEYS)
+
+    def key_press(self, event):
+        """
+        Apply a key press to the box. Returns the rect to repaint, or None if nothing changed.
+        """
+        key, modifiers = event.key(), event.modifiers()
+        select = bool(modifiers & Qt.ShiftModifier)
+
+        if event.matches(QKeySequence.SelectAll):
+            return self.select_all()
+        if event.matches(QKeySequence.Copy) or event.matches(QKeySequence.Cut):
+            if self.ordered_selection():
+                QGuiApplication.clipboard().setText(self.selected_text())
+            return self.delete_selection() if event.matches(QKeySequence.Cut) else None
+        if event.matches(QKeySequence.Paste):
+            text = QGuiApplication.clipboard().text().replace("\r\n", "\n").replace("\r", "\n")
+            return self.insert(text) if text else None
+
+        if key in (Qt.Key_Left, Qt.Key_Right, Qt.Key_Up, Qt.Key_Down, Qt.Key_Home, Qt.Key_End):
+            return self.move(key, select)
+        if key == Qt.Key_Backspace:
+            return self.backspace()
+        if key == Qt.Key_Delete:
+            return self.delete()
+        if key in (Qt.Key_Return, Qt.Key_Enter):
+            return self.insert("\n")
+        if event.text() and event.text().isprintable():
+            return self.insert(event.text())
+
+    def paint(self, p, clip=None, cursor=False, frame=False, selection=False):
+        """
+        Draw the lines intersecting clip (a QRect in canvas coordinates) with the painter's pen.
+        The cursor, frame and selection highlight are for the on-screen preview only.
+        """
+        if frame:
+            pen = p.pen()
+            p.setPen(FRAME_PEN)
+            p.drawRect(self.rect().adjusted(-2, -2, 2, 2))
+            p.setPen(pen)
+
+        selection = selection and self.ordered_selection()
+        p.setFont(self.font)
+
+        y = self.pos.y()
+        for i, paragraph in enumerate(self.paragraphs):
+            for line in paragraph.lines:
+                if clip is None or (y + self.line_height >= clip.top() and y <= clip.bottom()):
+                    if selection:
+                        self.paint_selection(p, i, line, y, selection)
+                    line.line.draw(p, QPointF(self.pos.x(), y))
+                y += self.line_height
+
+        if cursor:
+            i, j = self.cursor_line()
+            top = self.pos.y() + (self.first_line(i) + j) * self.line_height
+            x = self.pos.x() + self.cursor_x()
+            p.drawLine(QPointF(x, top), QPointF(x, top + self.line_height))
+
+    def paint_selection(self, p, index, line, y, selection):
+        (p0, c0), (p1, c1) = selection
+        if not p0 <= index <= p1:
+            return
+
+        start = c0 if index == p0 else 0
+        end = c1 if index == p1 else len(self.paragraphs[index].text)
+        start, end = max(start, line.start), min(end, line.end)
+        if start < end:
+            x0, x1 = line.cursor_to_x(start), line.cursor_to_x(end)
+            p.fillRect(QRectF(self.pos.x() + x0, y, x1 - x0, self.line_height), SELECTION_COLOR)
@@ -0,0 +1,149 @@
+"""
+Timelapse recording of the canvas as an animated PNG.
+
+The canvas reports every area it changes with touch(). Up to CAPTURE_FPS times a
+second, capture() copies the rects changed since the last capture, and a
+background thread deflates the copies and appends them to the file as APNG
+frames drawn over the frames before them. All but the last rect of a capture
+show for no time, so each capture plays as one step of 1 / PLAYBACK_FPS of a
+second; idle time produces no frames at all.
+
+Captures wait in a short queue. When the encoder falls behind, captures are
+skipped and their changes carry over into the next, so memory stays bounded
+however long the session runs.
+"""
+import queue
+import struct
+import threading
+import time
+import zlib
+
+from PyQt5.QtGui import QImage, QRegion
+
+from imagearray import image_array
+from pngwriter import COLOR_RGBA, PNG_SIGNATURE, STRIP_BYTES, chunk, filtered_data
+
+CAPTURE_FPS = 5
+PLAYBACK_FPS = 20
+QUEUE_FRAMES = 4
+# Beyond this many rects, a capture is one frame of their bounding rect.
+CAPTURE_RECTS = 16
+
+APNG_DISPOSE_NONE = 0
+APNG_BLEND_SOURCE = 0
+
+
+def frame_data(image, level):
+    """
+    An image as a zlib stream of filtered, non-premultiplied RGBA rows, filtered
+    a strip at a time to keep the temporaries small.
+    """
+    image = image.convertToFormat(QImage.Format_ARGB32)
+    rows = image_array(image), [2, 1, 0, 3]
+    height = image.height()
+    strip = max(1, STRIP_BYTES // (image.width() * 4))
+
+    compressor = zlib.compressobj(level)
+    data = [compressor.compress(filtered_data(rows, y, min(y + strip, height), 4, True))
+            for y in range(0, height, strip)]
+    data.append(compressor.flush())
+    return b''.join(data)
+
+
+class Timelapse:
+    """
+    Records the canvas to an APNG file at path, starting from a full frame of image.
+    """
+
+    def __init__(self, path, image, capture_fps=CAPTURE_FPS, playback_fps=PLAYBACK_FPS, level=6):
+        self.rect = image.rect()
+        self.interval = 1 / capture_fps
+        self.playback_fps = playback_fps
+        self.level = level
+        self.last_capture = time.perf_counter()
+        self.dirty = QRegion()
+        self.frames_written = 0
+        self.error = None
+
+        self.file = open(path, 'wb')
+        self.captures = queue.Queue(QUEUE_FRAMES)
+        self.captures.put([(self.rect, image.copy())])
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def touch(self, rect):
+        self.dirty += rect
+
+    def capture_due(self):
+        now = time.perf_counter()
+        if self.dirty.isEmpty() or now - self.last_capture < self.interval:
+            return False
+        self.last_capture = now
+        return True
+
+    def capture(self, render, block=False):
+        """
+        Queue the changed rects, rendered by render(rect). Returns False, keeping
+        them dirty for the next capture, if the queue is full.
+        """
+        # Frames must lie within the first one, whatever the canvas does meanwhile.
+        dirty = self.dirty & self.rect
+        if not dirty.isEmpty():
+            if self.captures.full() and not block:
+                return False
+            rects = dirty.rects() if dirty.rectCount() <= CAPTURE_RECTS else [dirty.boundingRect()]
+            self.captures.put([(rect, render(rect)) for rect in rects])
+        self.dirty = QRegion()
+        return True
+
+    def run(self):
+        f = self.file
+        try:
+            f.write(PNG_SIGNATURE)
+            f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', self.rect.width(), self.rect.height(),
+                                               8, COLOR_RGBA, 0, 0, 0)))
+            # The frame count is not known until the end; it is patched in on close.
+            actl = f.tell()
+            f.write(chunk(b'acTL', struct.pack('>II', 0, 0)))
+
+            sequence = 0
+            while True:
+                frames = self.captures.get()
+                if frames is None:
+                    break
+
+                for i, (rect, image) in enumerate(frames):
+                    data = frame_data(image, self.level)
+                    delay = 1 if i == len(frames) - 1 else 0
+                    f.write(chunk(b'fcTL', struct.pack(
+                        '>IIIIIHHBB', sequence, rect.width(), rect.height(), rect.x(), rect.y(),
+                        delay, self.playback_fps, APNG_DISPOSE_NONE, APNG_BLEND_SOURCE)))
+                    sequence += 1
+                    if not self.frames_written:
+                        f.write(chunk(b'IDAT', data))
+                    else:
+                        f.write(chunk(b'fdAT', struct.pack('>I', sequence) + data))
+                        sequence += 1
+                    self.frames_written += 1
+
+            f.write(chunk(b'IEND', b''))
+            f.seek(actl)
+            f.write(chunk(b'acTL', struct.pack('>II', self.frames_written, 0)))
+        except OSError as e:
+            self.error = e
+        finally:
+            f.close()
+
+    def close(self, render=None):
+        """
+        Capture what is left with render, if given, and finish the file. Returns the
+        number of frames written. Raises OSError if writing failed.
+        """
+        if self.thread.is_alive():
+            if render is not None:
+                self.capture(render, block=True)
+            self.captures.put(None)
+        self.thread.join()
+        if self.error:
+            raise self.error
+        return self.frames_written
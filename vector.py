@@ -0,0 +1,270 @@
+"""
+A retained layer of vector shapes drawn over the raster image.
+
+Shapes are kept as objects so they can be selected, moved and restyled after they
+are drawn. A uniform grid indexes their bounding boxes: hit tests look at the one
+cell under the pointer, and repaints only draw the shapes in the cells the dirty
+rect overlaps.
+"""
+import bisect
+import math
+from collections import defaultdict
+
+from PyQt5.QtCore import Qt, QPoint, QPointF, QRect
+from PyQt5.QtGui import QBrush, QFontMetrics, QPen, QPolygon, QPolygonF
+
+SHAPE_KINDS = ['line', 'polyline', 'polygon', 'rect', 'roundrect', 'ellipse', 'text']
+BOX_KINDS = ['rect', 'roundrect', 'ellipse']
+
+ROUNDRECT_RADIUS = 25
+
+GRID_CELL = 32
+HIT_TOLERANCE = 3
+
+
+def segment_distance(px, py, ax, ay, bx, by):
+    dx, dy = bx - ax, by - ay
+    length2 = dx * dx + dy * dy
+    t = 0 if not length2 else max(0, min(1, ((px - ax) * dx + (py - ay) * dy) / length2))
+    return math.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+class Shape:
+    """
+    One shape: its kind, its control points (two corners for the box kinds, the
+    baseline origin for text, the vertices otherwise), the pen it is stroked with
+    and the brush it is filled with, or None. Text is drawn in the pen's color.
+    """
+    __slots__ = ('kind', 'points', 'pen', 'brush', 'text', 'font')
+
+    def __init__(self, kind, points, pen, brush=None, text=None, font=None):
+        self.kind = kind
+        self.points = [QPoint(p) for p in points]
+        self.pen = QPen(pen)
+        self.brush = QBrush(brush) if brush is not None else None
+        self.text = text
+        self.font = font
+
+    def box(self):
+        # The same QRect the raster tools draw with, so both render identically.
+        return QRect(self.points[0], self.points[1])
+
+    def bounds(self):
+        """
+        The area the shape covers, including its stroke.
+        """
+        if self.kind in BOX_KINDS:
+            rect = self.box().normalized()
+        elif self.kind == 'text':
+            rect = QFontMetrics(self.font).boundingRect(self.text).translated(self.points[0])
+        else:
+            rect = QPolygon(self.points).boundingRect()
+        # Miter joins reach up to a full pen width beyond the outline.
+        margin = self.pen.width() + 1
+        return rect.adjusted(-margin, -margin, margin, margin)
+
+    def paint(self, p):
+        p.setPen(self.pen)
+        p.setBrush(self.brush if self.brush is not None else Qt.NoBrush)
+
+        if self.kind == 'line':
+            p.drawLine(*self.points)
+        elif self.kind == 'polyline':
+            p.drawPolyline(QPolygon(self.points))
+        elif self.kind == 'polygon':
+            p.drawPolygon(QPolygon(self.points))
+        elif self.kind == 'rect':
+            p.drawRect(self.box())
+        elif self.kind == 'roundrect':
+            p.drawRoundedRect(self.box(), ROUNDRECT_RADIUS, ROUNDRECT_RADIUS)
+        elif self.kind == 'ellipse':
+            p.drawEllipse(self.box())
+        elif self.kind == 'text':
+            p.setFont(self.font)
+            p.drawText(self.points[0], self.text)
+
+    def translate(self, dx, dy):
+        offset = QPoint(dx, dy)
+        self.points = [p + offset for p in self.points]
+
+    def contains(self, x, y, tolerance=HIT_TOLERANCE):
+        """
+        Whether x, y is on the stroke (within tolerance) or, for filled shapes, inside.
+        Tested analytically rather than through QPainterPath, which is much slower.
+        """
+        reach = self.pen.width() / 2 + tolerance
+        filled = self.brush is not None and self.kind != 'polyline'
+
+        if self.kind in BOX_KINDS:
+            rect = self.box().normalized()
+            x0, y0, x1, y1 = rect.left(), rect.top(), rect.right() + 1, rect.bottom() + 1
+            if self.kind == 'ellipse':
+                cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+                if rx < 1 or ry < 1:
+                    return segment_distance(x, y, x0, y0, x1, y1) <= reach
+                # Radial distance scaled back to pixels; close to the true distance
+                # for anything but very flat ellipses.
+                d = math.hypot((x - cx) / rx, (y - cy) / ry)
+                return (filled and d <= 1) or abs(d - 1) * min(rx, ry) <= reach
+
+            if x0 - reach <= x <= x1 + reach and y0 - reach <= y <= y1 + reach:
+                inside = x0 + reach < x < x1 - reach and y0 + reach < y < y1 - reach
+                return filled or not inside
+            return False
+
+        if self.kind == 'text':
+            return self.bounds().contains(x, y)
+
+        points = self.points
+        if self.kind == 'polygon':
+            points = points + points[:1]
+            if filled and QPolygonF([QPointF(p) for p in self.points]).containsPoint(QPointF(x, y), Qt.OddEvenFill):
+                return True
+
+        for a, b in zip(points, points[1:]):
+            if segment_distance(x, y, a.x(), a.y(), b.x(), b.y()) <= reach:
+                return True
+        return len(points) == 1 and math.hypot(x - points[0].x(), y - points[0].y()) <= reach
+
+
+class VectorLayer:
+    """
+    Shapes in drawing order, indexed by a uniform grid of their bounding boxes.
+
+    Ids increase with drawing order, and each cell keeps its ids sorted, so walking
+    a cell backwards visits the shapes top first. Methods that change shapes return
+    the QRect that needs repainting.
+    """
+
+    def __init__(self, cell=GRID_CELL):
+        self.cell = cell
+        self.shapes = {}
+        self.bounds = {}
+        self.cells = defaultdict(list)
+        self.next_id = 0
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def __iter__(self):
+        return iter(self.shapes.values())
+
+    def cell_keys(self, x0, y0, x1, y1):
+        c = self.cell
+        return [(cx, cy) for cy in range(y0 // c, y1 // c + 1) for cx in range(x0 // c, x1 // c + 1)]
+
+    def index(self, id, shape):
+        rect = shape.bounds()
+        b = self.bounds[id] = (rect.left(), rect.top(), rect.right(), rect.bottom())
+        for key in self.cell_keys(*b):
+            bisect.insort(self.cells[key], id)
+        return rect
+
+    def unindex(self, id):
+        b = self.bounds.pop(id)
+        for key in self.cell_keys(*b):
+            ids = self.cells[key]
+            del ids[bisect.bisect_left(ids, id)]
+            if not ids:
+                del self.cells[key]
+        return QRect(QPoint(b[0], b[1]), QPoint(b[2], b[3]))
+
+    def add(self, shape):
+        """
+        Add a shape on top of the others and return its id.
+        """
+        id = self.next_id
+        self.next_id += 1
+        self.shapes[id] = shape
+        self.index(id, shape)
+        return id
+
+    def remove(self, ids):
+        dirty = QRect()
+        for id in ids:
+            dirty |= self.unindex(id)
+            del self.shapes[id]
+        return dirty
+
+    def clear(self):
+        self.shapes.clear()
+        self.bounds.clear()
+        self.cells.clear()
+
+    def rect(self, id):
+        b = self.bounds[id]
+        return QRect(QPoint(b[0], b[1]), QPoint(b[2], b[3]))
+
+    def update_shapes(self, ids, fn):
+        dirty = QRect()
+        for id in ids:
+            dirty |= self.unindex(id)
+            fn(self.shapes[id])
+            dirty |= self.index(id, self.shapes[id])
+        return dirty
+
+    def move(self, ids, dx, dy):
+        return self.update_shapes(ids, lambda shape: shape.translate(dx, dy))
+
+    def restyle(self, ids, **style):
+        """
+        Change the style of the shapes: color and width set the pen, fill sets the
+        fill color (None for no fill) and fill_color only recolors shapes that are
+        already filled.
+        """
+        def apply(shape):
+            pen = QPen(shape.pen)
+            if 'color' in style:
+                pen.setColor(style['color'])
+            if 'width' in style:
+                pen.setWidth(style['width'])
+            shape.pen = pen
+
+            if 'fill' in style:
+                shape.brush = QBrush(style['fill']) if style['fill'] is not None else None
+            if 'fill_color' in style and shape.brush is not None:
+                shape.brush = QBrush(style['fill_color'])
+
+        return self.update_shapes(ids, apply)
+
+    def hit(self, x, y, tolerance=HIT_TOLERANCE):
+        """
+        The id of the topmost shape at x, y, or None.
+        """
+        ids = self.cells.get((x // self.cell, y // self.cell))
+        if not ids:
+            return None
+
+        bounds, shapes = self.bounds, self.shapes
+        for id in reversed(ids):
+            x0, y0, x1, y1 = bounds[id]
+            if x0 <= x <= x1 and y0 <= y <= y1 and shapes[id].contains(x, y, tolerance):
+                return id
+        return None
+
+    def query(self, rect):
+        """
+        Ids of the shapes whose bounds intersect rect, in drawing order.
+        """
+        x0, y0, x1, y1 = rect.left(), rect.top(), rect.right(), rect.bottom()
+        keys = self.cell_keys(x0, y0, x1, y1)
+        if len(keys) > len(self.cells):
+            candidates = self.bounds
+        else:
+            candidates = set()
+            for key in keys:
+                candidates.update(self.cells.get(key, ()))
+
+        bounds = self.bounds
+        return sorted(id for id in candidates
+                      if bounds[id][0] <= x1 and bounds[id][2] >= x0 and bounds[id][1] <= y1 and bounds[id][3] >= y0)
+
+    def paint(self, p, rect):
+        """
+        Draw the shapes that intersect rect. Returns the number drawn.
+        """
+        ids = self.query(rect)
+        shapes = self.shapes
+        for id in ids:
+            shapes[id].paint(p)
+        return len(ids)